@@ -0,0 +1,205 @@
+"""
+Measures the lag versus jitter trade-off of the cursor filters of
+i3-deep-focus/filters.py.
+
+Without a session, a synthetic one is generated: fixations on random screen
+positions separated by instant saccades, with gaussian noise. Its true
+positions are known, so the lag is the time the filtered cursor takes to
+cover 90% of each saccade and the jitter is the RMS distance to the fixated
+position once settled.
+
+A recorded session is either an .npz file with "timestamps" (seconds) and
+"positions" (samples, 2) arrays, or a video or directory of frames which is
+replayed through GazeTracking and mapped to the screen with a ScreenMapper
+fitted on the calibration data. Its true positions are unknown, so the
+saccades are found as large jumps between the medians of the raw positions
+before and after them, and the lag is the time the filtered cursor takes to
+cover 90% of those jumps. The jitter is the RMS of the second difference of
+the filtered positions. Both of these are also reported for the synthetic
+session, where the step lag can be checked against the saccade lag.
+
+Usage:
+    python -m benchmarks.cursor_filters [SESSION] [--seconds 60] [--noise 40]
+        [--calibration calibration.npz] [--save session.npz]
+"""
+
+import argparse
+import importlib
+import os
+
+import numpy as np
+
+filters = importlib.import_module("i3-deep-focus.filters")
+screen_mapper = importlib.import_module("i3-deep-focus.screen_mapper")
+gaze = importlib.import_module("i3-deep-focus.gaze")
+
+# Same as Calibration.DUMMY_CALIBRATION_PATH, without importing pyautogui
+DUMMY_CALIBRATION_PATH = os.path.join(os.path.dirname(filters.__file__), "data", "dummy_calibration.npz")
+
+CONFIGURATIONS = (
+    ("none", {}),
+    ("one_euro", {}),
+    ("one_euro", {"min_cutoff": 0.3, "beta": 0.001}),
+    ("one_euro", {"min_cutoff": 1.0, "beta": 0.004}),
+    ("kalman", {}),
+    ("kalman", {"process_noise": 3000.0}),
+    ("kalman", {"process_noise": 30000.0}),
+)
+
+
+def synthetic_session(seconds, noise, fps=30, size=(1920, 1080), seed=0):
+    """Returns the timestamps, noisy positions, true positions and saccade
+    indices of fixations on random screen positions"""
+    rng = np.random.default_rng(seed)
+    count = int(seconds * fps)
+    timestamps = np.arange(count) / fps + rng.normal(0, 0.002, count)
+    timestamps = np.maximum.accumulate(timestamps)
+    truth = np.empty((count, 2))
+    saccades = []
+    index = 0
+    while index < count:
+        duration = int(rng.uniform(0.3, 1.5) * fps)
+        truth[index:index + duration] = rng.uniform((50, 50), (size[0] - 50, size[1] - 50))
+        if index:
+            saccades.append(index)
+        index += duration
+    return timestamps, truth + rng.normal(0, noise, truth.shape), truth, saccades
+
+
+def recorded_session(path, calibration_path, fps):
+    """Returns the timestamps and screen positions of a recorded session"""
+    if path.endswith(".npz"):
+        with np.load(path) as session:
+            return session["timestamps"], session["positions"]
+
+    from gaze_tracking import GazeTracking
+    from gaze_tracking.replay import open_source
+
+    with np.load(calibration_path) as data:
+        samples, targets = data["samples"], np.repeat(data["targets"], data["counts"], axis=0)
+    mapper = screen_mapper.ScreenMapper().fit(samples, targets)
+    tracker = GazeTracking()
+    source = open_source(path)
+    fps = getattr(source, "fps", None) or fps
+    timestamps, positions = [], []
+    count = 0
+    while True:
+        success, frame = source.read()
+        if not success:
+            break
+        tracker.refresh(frame, count / fps)
+        count += 1
+        sample = gaze.Gaze(tracker.snapshot)
+        if sample:
+            timestamps.append(sample.timestamp)
+            positions.append(mapper.predict(sample))
+    return np.array(timestamps), np.array(positions).reshape(-1, 2)
+
+
+def apply(cursor_filter, timestamps, positions):
+    return np.array([cursor_filter(position, timestamp) for position, timestamp in zip(positions, timestamps)])
+
+
+def _lag(timestamps, filtered, steps, fraction):
+    """Mean time the filtered positions take to cover `fraction` of each step,
+    given as (start index, origin, target), a step ending where the next starts"""
+    lags = []
+    ends = [start for start, _, _ in steps[1:]] + [len(filtered)]
+    for (start, origin, target), end in zip(steps, ends):
+        amplitude = np.linalg.norm(target - origin)
+        if amplitude < 100:
+            continue
+        progress = (filtered[start:end] - origin) @ (target - origin) / amplitude ** 2
+        reached = np.flatnonzero(progress >= fraction)
+        if len(reached):
+            lags.append(timestamps[start + reached[0]] - timestamps[start])
+    return float(np.mean(lags)) if lags else float("nan")
+
+
+def saccade_lag(timestamps, filtered, truth, saccades, fraction=0.9):
+    """Mean time the filtered positions take to cover `fraction` of each saccade"""
+    return _lag(timestamps, filtered, [(start, truth[start - 1], truth[start]) for start in saccades], fraction)
+
+
+def fixation_jitter(filtered, truth, saccades, settle):
+    """RMS distance to the fixated position, `settle` samples after each saccade"""
+    mask = np.ones(len(truth), dtype=bool)
+    for start in [0] + saccades:
+        mask[start:start + settle] = False
+    return float(np.sqrt(np.mean(np.sum((filtered[mask] - truth[mask]) ** 2, axis=1))))
+
+
+def raw_steps(positions, window=5, threshold=150):
+    """Finds the saccades of a session without its true positions: the jumps
+    of more than `threshold` pixels between the medians of the `window` raw
+    positions before and after an index. Returns them as (start index,
+    origin, target), the medians being the origin and the target."""
+    count = len(positions)
+    jumps = np.zeros(count)
+    medians = {}
+    for index in range(window, count - window + 1):
+        before = np.median(positions[index - window:index], axis=0)
+        after = np.median(positions[index:index + window], axis=0)
+        jumps[index] = np.linalg.norm(after - before)
+        medians[index] = (before, after)
+    # The largest jumps first, the indices next to a kept one are the same saccade
+    starts = []
+    for index in np.argsort(-jumps):
+        if jumps[index] < threshold:
+            break
+        if all(abs(index - start) >= window for start in starts):
+            starts.append(int(index))
+    return [(start,) + medians[start] for start in sorted(starts)]
+
+
+def step_lag(timestamps, filtered, positions, fraction=0.9):
+    """Mean time the filtered positions take to cover `fraction` of the
+    saccades found in the raw positions"""
+    return _lag(timestamps, filtered, raw_steps(positions), fraction)
+
+
+def roughness(filtered):
+    """RMS of the second difference of the positions, in pixels"""
+    return float(np.sqrt(np.mean(np.sum(np.diff(filtered, 2, axis=0) ** 2, axis=1))))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("session", nargs="?", help="Recorded session: .npz trace, video or directory of frames")
+    parser.add_argument("--seconds", type=float, default=60, help="Duration of the synthetic session")
+    parser.add_argument("--noise", type=float, default=40, help="Noise of the synthetic session in pixels")
+    parser.add_argument("--calibration", default=DUMMY_CALIBRATION_PATH,
+                        help="Calibration data to map a replayed video with")
+    parser.add_argument("--fps", type=float, default=30, help="Rate of a directory of frames")
+    parser.add_argument("--save", help="Save the raw positions of the session to this .npz file")
+    args = parser.parse_args()
+
+    truth = saccades = None
+    if args.session:
+        timestamps, positions = recorded_session(args.session, args.calibration, args.fps)
+    else:
+        timestamps, positions, truth, saccades = synthetic_session(args.seconds, args.noise)
+    if len(positions) < 3:
+        parser.error("The session has too few positions")
+    if args.save:
+        np.savez(args.save, timestamps=timestamps, positions=positions)
+
+    print("Positions: {}, duration: {:.1f} s".format(len(positions), timestamps[-1] - timestamps[0]))
+    header = "{:<40} {:>14} {:>12}".format("filter", "step lag (ms)", "roughness")
+    if truth is not None:
+        header += " {:>16} {:>12}".format("saccade lag (ms)", "jitter (px)")
+    print(header)
+    for name, parameters in CONFIGURATIONS:
+        filtered = apply(filters.create_filter(name, **parameters), timestamps, positions)
+        label = name + "".join(" {}={}".format(key, value) for key, value in parameters.items())
+        line = "{:<40} {:>14.0f} {:>12.1f}".format(
+            label, step_lag(timestamps, filtered, positions) * 1000, roughness(filtered))
+        if truth is not None:
+            line += " {:>16.0f} {:>12.1f}".format(
+                saccade_lag(timestamps, filtered, truth, saccades) * 1000,
+                fixation_jitter(filtered, truth, saccades, settle=9))
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Compares face detection time and landmark error for several detection scales.
+
+The landmarks predicted from the face found at full resolution are used as
+reference, the error is the mean distance in pixels between the reference
+landmarks and the ones predicted from the face found on the downscaled frame.
+
+Usage:
+    python -m benchmarks.detection_scale VIDEO_OR_IMAGES... [--scales 1 0.5 0.25] [--frames 100]
+"""
+
+import argparse
+import time
+
+import cv2
+import numpy
+
+from gaze_tracking import GazeTracking
+
+
+def read_frames(paths, max_frames):
+    """Yields grayscale frames from video files or images"""
+    count = 0
+    for path in paths:
+        capture = cv2.VideoCapture(path)
+        while count < max_frames:
+            ok, frame = capture.read()
+            if not ok:
+                break
+            count += 1
+            yield cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        capture.release()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="+", help="Video files or images with a face")
+    parser.add_argument("--scales", nargs="+", type=float, default=[1.0, 0.5, 0.33, 0.25])
+    parser.add_argument("--frames", type=int, default=100, help="Maximum number of frames to use")
+    args = parser.parse_args()
+
+    frames = list(read_frames(args.paths, args.frames))
+    if not frames:
+        parser.error("No frames could be read")
+
+    reference = GazeTracking(tracking=False)
+    references = []
+    for frame in frames:
+        faces = reference._detect_faces(frame)
+        references.append(GazeTracking._landmarks_to_array(reference._predictor(frame, faces[0])) if faces else None)
+
+    print("Frames: {}, resolution: {}x{}".format(len(frames), frames[0].shape[1], frames[0].shape[0]))
+    print("{:>6} {:>12} {:>9} {:>10} {:>14}".format("scale", "detect (ms)", "speedup", "hit rate", "error (px)"))
+    baseline = None
+    for scale in args.scales:
+        tracker = GazeTracking(tracking=False, detection_scale=scale)
+        durations, errors, hits = [], [], 0
+        for frame, expected in zip(frames, references):
+            start = time.perf_counter()
+            faces = tracker._detect_faces(frame)
+            durations.append(time.perf_counter() - start)
+            if not faces:
+                continue
+            hits += 1
+            if expected is not None:
+                landmarks = GazeTracking._landmarks_to_array(tracker._predictor(frame, faces[0]))
+                errors.append(numpy.linalg.norm(landmarks - expected, axis=1).mean())
+
+        duration = numpy.median(durations) * 1000
+        baseline = baseline or duration
+        print("{:>6.2f} {:>12.2f} {:>8.1f}x {:>9.0%} {:>14}".format(
+            scale,
+            duration,
+            baseline / duration,
+            hits / len(frames),
+            "{:.2f}".format(numpy.mean(errors)) if errors else "-"))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Measures the CPU saved by reusing the analysis of the last frame when the
+eyes didn't change, and what it costs in accuracy.
+
+The recording is analyzed once without reuse, as reference, then once per
+threshold. For each run the throughput, the rate of reused frames and the
+mean distance between the pupils found and the reference ones are reported.
+
+Usage:
+    python -m benchmarks.frame_reuse VIDEO_OR_DIRECTORY [--thresholds 1 2 4 8]
+        [--max-reuse 10] [--frames 600]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from gaze_tracking import GazeTracking
+from gaze_tracking.replay import open_source
+
+
+def analyze(path, frames, reuse_threshold, max_reuse):
+    """Returns the duration of the run, the pupils of each frame and the
+    number of reused frames"""
+    tracker = GazeTracking(reuse_threshold=reuse_threshold, max_reuse=max_reuse)
+    source = open_source(path)
+    pupils = []
+    duration = 0.0
+    count = 0
+    while frames is None or count < frames:
+        success, frame = source.read()
+        if not success:
+            break
+        count += 1
+        start = time.perf_counter()
+        tracker.refresh(frame, count / 30)
+        duration += time.perf_counter() - start
+        snapshot = tracker.snapshot
+        pupils.append((snapshot.eye_left.pupil_center, snapshot.eye_right.pupil_center)
+                      if snapshot.pupils_located else None)
+    return duration, pupils, tracker.reused_frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="Video file or directory of frames")
+    parser.add_argument("--thresholds", nargs="+", type=float, default=[1.0, 2.0, 4.0, 8.0],
+                        help="Mean gray level differences under which a frame is reused")
+    parser.add_argument("--max-reuse", type=int, default=10, help="Frames in a row that can be reused")
+    parser.add_argument("--frames", type=int, help="Maximum number of frames to analyze")
+    args = parser.parse_args()
+
+    duration, reference, _ = analyze(args.path, args.frames, None, args.max_reuse)
+    if not reference:
+        parser.error("No frames could be read")
+
+    print("Frames: {}".format(len(reference)))
+    print("{:>10} {:>10} {:>10} {:>10} {:>10} {:>16}".format(
+        "threshold", "fps", "speedup", "reused", "pupils", "pupil error (px)"))
+    print("{:>10} {:>10.1f} {:>9.2f}x {:>10.0%} {:>10.0%} {:>16}".format(
+        "off", len(reference) / duration, 1.0, 0.0, np.mean([p is not None for p in reference]), "-"))
+    for threshold in args.thresholds:
+        run_duration, pupils, reused = analyze(args.path, args.frames, threshold, args.max_reuse)
+        errors = [
+            np.linalg.norm(np.subtract(found, expected), axis=1).mean()
+            for found, expected in zip(pupils, reference) if found is not None and expected is not None]
+        print("{:>10.1f} {:>10.1f} {:>9.2f}x {:>10.0%} {:>10.0%} {:>16}".format(
+            threshold,
+            len(pupils) / run_duration,
+            duration / run_duration,
+            reused / len(pupils),
+            np.mean([p is not None for p in pupils]),
+            "{:.2f}".format(np.mean(errors)) if errors else "-"))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+Measures the focus engine against a fake i3 serving a synthetic layout, so it
+runs without i3.
+
+The screen is split in a grid of tiled windows with a few floating windows on
+top. A gaze path dwelling on random points is replayed, with window events
+sent by the fake i3 in between: title changes, which must not cost a tree
+request, and new windows, which must cost one at most. The time of each
+update, the tree requests and the focus commands are reported, along with the
+same lookups done by fetching the tree on every frame.
+
+Usage:
+    python -m benchmarks.i3_focus [--windows 64] [--frames 3000] [--events 100]
+"""
+
+import argparse
+import importlib
+import os
+import random
+import tempfile
+import time
+
+import numpy as np
+
+ipc = importlib.import_module("i3-deep-focus.ipc")
+focus = importlib.import_module("i3-deep-focus.focus")
+
+SCREEN = (1920, 1080)
+
+
+def layout(windows, floating):
+    """Returns a tree and workspaces with the screen split in a grid of
+    windows plus floating windows, and the ids of the windows"""
+    columns = int(np.ceil(np.sqrt(windows)))
+    rows = int(np.ceil(windows / columns))
+    width, height = SCREEN[0] // columns, SCREEN[1] // rows
+    ids = list(range(100, 100 + windows + floating))
+    tiled = [
+        {"id": ids[i], "window": ids[i], "nodes": [], "floating_nodes": [],
+         "rect": {"x": (i % columns) * width, "y": (i // columns) * height, "width": width, "height": height}}
+        for i in range(windows)]
+    floating_nodes = [
+        {"id": ids[windows + i] + 10000, "nodes": [{
+            "id": ids[windows + i], "window": ids[windows + i], "nodes": [], "floating_nodes": [],
+            "rect": {"x": 200 + 300 * i, "y": 150 + 100 * i, "width": 400, "height": 300}}]}
+        for i in range(floating)]
+    tree = {"id": 1, "type": "root", "nodes": [{
+        "id": 2, "type": "output", "name": "eDP-1", "nodes": [
+            {"id": 3, "type": "workspace", "name": "1", "nodes": tiled, "floating_nodes": floating_nodes},
+            {"id": 4, "type": "workspace", "name": "2", "nodes": [], "floating_nodes": []}]}]}
+    workspaces = [{"name": "1", "visible": True}, {"name": "2", "visible": False}]
+    return tree, workspaces, ids
+
+
+def gaze_path(frames, rng):
+    """Gaze points at 30 fps staying about half a second on each point"""
+    points = []
+    while len(points) < frames:
+        target = (rng.uniform(0, SCREEN[0] - 1), rng.uniform(0, SCREEN[1] - 1))
+        for _ in range(rng.randint(5, 25)):
+            points.append((target[0] + rng.gauss(0, 10), target[1] + rng.gauss(0, 10)))
+    return points[:frames]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--windows", type=int, default=64, help="Tiled windows on the visible workspace")
+    parser.add_argument("--floating", type=int, default=4, help="Floating windows above them")
+    parser.add_argument("--frames", type=int, default=3000, help="Gaze points replayed")
+    parser.add_argument("--events", type=int, default=100, help="Window events sent during the replay")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    tree, workspaces, ids = layout(args.windows, args.floating)
+    points = gaze_path(args.frames, rng)
+    # Every tenth event creates a window, the others change a title
+    event_frames = {frame: "new" if i % 10 == 0 else "title"
+                    for i, frame in enumerate(sorted(rng.sample(range(1, args.frames), args.events)))}
+
+    with tempfile.TemporaryDirectory() as directory:
+        server = ipc.FakeI3Server(os.path.join(directory, "i3.sock"), tree, workspaces)
+        engine = focus.FocusEngine(server.path)
+        durations = []
+        for frame, point in enumerate(points):
+            change = event_frames.get(frame)
+            if change is not None:
+                server.emit("window", {"change": change, "container": {"id": rng.choice(ids)}})
+                # Let the event thread handle the event like it would between two frames
+                time.sleep(0.001)
+            start = time.perf_counter()
+            engine.update(point, frame / 30)
+            durations.append(time.perf_counter() - start)
+        trees, commands = server.requests.get(ipc.GET_TREE, 0), len(server.commands)
+        engine.close()
+
+        connection = ipc.I3Connection(server.path)
+        start = time.perf_counter()
+        for point in points[:300]:
+            index = focus.WindowIndex()
+            for window, rect, layer, _ in focus.visible_windows(connection.get_tree(), connection.get_workspaces()):
+                index.add(window, rect, layer)
+            index.window_at(*point)
+        polling = (time.perf_counter() - start) / 300
+        connection.close()
+        server.close()
+
+    durations = np.array(durations) * 1e6
+    print("Windows: {} tiled + {} floating, frames: {}, events: {} ({} new windows)".format(
+        args.windows, args.floating, args.frames, args.events, list(event_frames.values()).count("new")))
+    print("update: mean {:.1f} us, median {:.1f} us, p99 {:.1f} us, max {:.1f} us".format(
+        durations.mean(), np.median(durations), np.percentile(durations, 99), durations.max()))
+    print("tree requests: {}, index rebuilds: {}, focus commands: {}".format(trees, engine.rebuilds, commands))
+    print("fetching the tree on every frame instead: {:.1f} us per frame".format(polling * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+Runs MouseControl headless on the samples of a calibration, with the
+in-memory cursor, and reports the time spent per frame for each engine and
+cursor filter, the number of moves and the mean distance from the cursor to
+the position that was looked at.
+
+With --backend, also measures the time a move takes with a real cursor
+backend, which needs a display.
+
+Usage:
+    python -m benchmarks.mouse_control [--calibration calibration.npz] [--fps 30]
+        [--backend pyautogui|xtest] [--moves 100]
+"""
+
+import argparse
+import importlib
+import os
+import time
+import types
+
+import numpy as np
+
+calibration = importlib.import_module("i3-deep-focus.calibration")
+cursor = importlib.import_module("i3-deep-focus.cursor")
+mouse_control = importlib.import_module("i3-deep-focus.mouse_control")
+
+
+class Tracker:
+    """Stands for GazeTracking, MouseControl only reads its snapshot on start"""
+    snapshot = None
+
+
+def snapshot(sample, frame_id, timestamp):
+    """Returns an object with the attributes of a GazeSnapshot read by Gaze and
+    MouseControl, from the 14 values of a calibration sample"""
+    def eye(center, pupil, horizontal_ratio, vertical_ratio):
+        return types.SimpleNamespace(
+            eye_center=tuple(center), pupil_center=tuple(pupil),
+            horizontal_ratio=horizontal_ratio, vertical_ratio=vertical_ratio)
+
+    return types.SimpleNamespace(
+        frame_id=frame_id,
+        timestamp=timestamp,
+        pupils_located=True,
+        nose=tuple(sample[12:14]),
+        eye_left=eye(sample[0:2], sample[4:6], sample[8], sample[10]),
+        eye_right=eye(sample[2:4], sample[6:8], sample[9], sample[11]),
+        is_blinking=lambda: False,
+        blink_event=None,
+    )
+
+
+def measure_backend(name, moves):
+    backend = cursor.create_cursor(name)
+    start = backend.position()
+    durations = []
+    for index in range(moves):
+        begin = time.perf_counter()
+        backend.position()
+        backend.move_to(start[0] + index % 2, start[1])
+        backend.flush()
+        durations.append(time.perf_counter() - begin)
+    return np.array(durations) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calibration", default=os.path.join(
+        os.path.dirname(calibration.__file__), "data", "dummy_calibration.npz"))
+    parser.add_argument("--fps", type=float, default=30, help="Rate of the replayed samples")
+    parser.add_argument("--backend", choices=("pyautogui", "xtest"), help="Real backend to measure")
+    parser.add_argument("--moves", type=int, default=100, help="Number of moves with the real backend")
+    args = parser.parse_args()
+
+    data = calibration.Calibration(None, (1920, 1080), args.calibration)
+    samples, targets = data.training_data()
+    snapshots = [snapshot(sample, index, index / args.fps) for index, sample in enumerate(samples)]
+
+    print("Samples: {}".format(len(samples)))
+    print("{:<12} {:<10} {:>14} {:>14} {:>8} {:>14}".format(
+        "engine", "filter", "mean (us)", "p99 (us)", "moves", "error (px)"))
+    for engine in mouse_control.MouseControl.ENGINES:
+        for cursor_filter in ("none", "one_euro", "kalman"):
+            fake = cursor.FakeCursor()
+            control = mouse_control.MouseControl(Tracker(), data, engine, cursor_filter, fake)
+            control.reset_position()
+            durations, positions = [], []
+            for frame in snapshots:
+                start = time.perf_counter()
+                control.step(frame)
+                durations.append(time.perf_counter() - start)
+                positions.append(fake.position())
+            durations = np.array(durations) * 1e6
+            error = np.linalg.norm(np.array(positions) - targets, axis=1).mean()
+            print("{:<12} {:<10} {:>14.1f} {:>14.1f} {:>8} {:>14.0f}".format(
+                engine, cursor_filter, durations.mean(), np.percentile(durations, 99), len(fake.moves), error))
+
+    if args.backend:
+        durations = measure_backend(args.backend, args.moves)
+        print("{} move: mean {:.2f} ms, p99 {:.2f} ms".format(
+            args.backend, durations.mean(), np.percentile(durations, 99)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Checks that the NumPy NALU of i3-deep-focus/nalu.py gives the same screen
+coordinates as the torch module it is exported from, and compares their speed.
+
+Usage:
+    python -m benchmarks.nalu_parity [--samples 1000] [--tolerance 1e-4]
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+import torch
+
+nalu_torch = importlib.import_module("i3-deep-focus.nalu_torch")
+nalu = importlib.import_module("i3-deep-focus.nalu")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=1000)
+    parser.add_argument("--tolerance", type=float, default=1e-4, help="Accepted relative difference")
+    args = parser.parse_args()
+
+    torch.manual_seed(0)
+    model = nalu_torch.NALU(14, 2)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "weights.npz")
+        nalu_torch.export_weights(model, path)
+        numpy_model = nalu.NALU.load(path)
+
+    # Samples in the range of the calibration data: pixel coordinates and ratios
+    rng = np.random.default_rng(0)
+    inputs = rng.uniform(0, 1, (args.samples, 14))
+    inputs[:, :8] *= 1000
+    inputs[:, 12:] *= 1000
+
+    with torch.no_grad():
+        expected = model(torch.from_numpy(inputs).float()).numpy()
+    result = numpy_model.predict(inputs)
+    difference = np.abs(result - expected) / np.maximum(np.abs(expected), 1)
+    print("Maximum relative difference: {:.2e}".format(difference.max()))
+
+    sample = inputs[0]
+    tensor = torch.from_numpy(sample[np.newaxis]).float()
+    with torch.no_grad():
+        torch_time = min(timeit.repeat(lambda: model(tensor), number=1000, repeat=5)) / 1000
+    numpy_time = min(timeit.repeat(lambda: numpy_model.predict(sample), number=1000, repeat=5)) / 1000
+    print("Single sample: torch {:.1f} us, numpy {:.1f} us".format(torch_time * 1e6, numpy_time * 1e6))
+
+    if difference.max() > args.tolerance:
+        print("NumPy and torch outputs differ", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Compares the time GazeTracking spends per frame when the two eyes are
+analyzed one after the other and when they are analyzed in parallel.
+
+The recording is replayed once with each setting, the face and the landmarks
+are found the same way in both, so the difference comes from the eyes.
+
+Usage:
+    python -m benchmarks.parallel_eyes VIDEO_OR_DIRECTORY [--frames 300]
+        [--preprocessing quality] [--repeat 3]
+"""
+
+import argparse
+
+from gaze_tracking import GazeTracking
+from gaze_tracking.pupil import Pupil
+from gaze_tracking.replay import open_source, replay
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="Video file or directory of frames")
+    parser.add_argument("--frames", type=int, default=300, help="Maximum number of frames to replay")
+    parser.add_argument("--preprocessing", choices=tuple(Pupil.PREPROCESSING), default="quality")
+    parser.add_argument("--repeat", type=int, default=3, help="Replays per setting, the fastest is kept")
+    args = parser.parse_args()
+
+    print("{:<10} {:>10} {:>12} {:>12} {:>10}".format("eyes", "fps", "mean (ms)", "p95 (ms)", "pupils"))
+    baseline = None
+    for parallel in (False, True):
+        best = None
+        for _ in range(args.repeat):
+            tracker = GazeTracking(preprocessing=args.preprocessing, parallel_eyes=parallel)
+            results = replay(tracker, open_source(args.path), args.frames)
+            if best is None or results["latency_ms"]["mean"] < best["latency_ms"]["mean"]:
+                best = results
+        if not best["frames"]:
+            parser.error("No frames could be read")
+        baseline = baseline or best["latency_ms"]["mean"]
+        print("{:<10} {:>10.1f} {:>12.2f} {:>12.2f} {:>10.0%}   {:.2f}x".format(
+            "parallel" if parallel else "serial",
+            best["fps"],
+            best["latency_ms"]["mean"],
+            best["latency_ms"]["p95"],
+            best["pupils_rate"],
+            baseline / best["latency_ms"]["mean"]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Reports the speed and the quality of the preprocessing profiles of
+Pupil.PREPROCESSING, to pick the right one for each machine.
+
+The eye crops are the synthetic ones of benchmarks.pupil_engines, whose iris
+center is known, or the eyes isolated by GazeTracking from a video or a
+directory of frames, for which the pupils found with the "quality" profile
+are used as reference. Each crop is binarized with the threshold the
+calibration finds for it with the same profile.
+
+Usage:
+    python -m benchmarks.preprocessing [VIDEO_OR_DIRECTORY] [--frames 1000]
+        [--engine contours|components]
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+
+from gaze_tracking.calibration import Calibration
+from gaze_tracking.pupil import Pupil
+
+from .pupil_engines import eye_frame
+
+
+def recorded_crops(path, max_frames):
+    """Returns the eye frames isolated by GazeTracking from a recording"""
+    from gaze_tracking import GazeTracking
+    from gaze_tracking.replay import open_source
+
+    tracker = GazeTracking()
+    source = open_source(path)
+    crops = []
+    for _ in range(max_frames):
+        success, frame = source.read()
+        if not success:
+            break
+        tracker.refresh(frame)
+        for eye in (tracker.eye_left, tracker.eye_right):
+            if eye is not None and eye.frame is not None:
+                crops.append(eye.frame.copy())
+    return crops
+
+
+def median_time(function, number=20):
+    return min(timeit.repeat(function, number=number, repeat=3)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", nargs="?", help="Video file or directory of frames, synthetic crops if omitted")
+    parser.add_argument("--frames", type=int, default=1000, help="Number of synthetic crops or of frames read")
+    parser.add_argument("--engine", choices=Pupil.ENGINES, default="contours")
+    parser.add_argument("--noise", type=float, default=6, help="Noise of the synthetic crops")
+    args = parser.parse_args()
+
+    if args.path:
+        crops, centers = recorded_crops(args.path, args.frames), None
+    else:
+        rng = np.random.default_rng(0)
+        crops, centers = zip(*(eye_frame(rng, args.noise) for _ in range(args.frames)))
+    if not crops:
+        parser.error("No eye could be isolated")
+
+    def locate(profile):
+        pupils = []
+        for crop in crops:
+            pupil = Pupil(crop, Calibration.find_best_threshold(crop, profile), args.engine, profile)
+            pupils.append((pupil.x, pupil.y) if pupil.x is not None else None)
+        return pupils
+
+    reference = centers if centers is not None else locate("quality")
+    print("Crops: {}, reference: {}".format(len(crops), "true centers" if centers is not None else "quality profile"))
+    print("{:<10} {:>12} {:>16} {:>8} {:>10} {:>16}".format(
+        "profile", "filter (us)", "calibration (us)", "speedup", "misses", "mean error (px)"))
+    baseline = None
+    for profile in Pupil.PREPROCESSING:
+        filter_time = np.mean([median_time(lambda: Pupil.filter(crop, profile)) for crop in crops[:100]])
+        calibration_time = np.mean([
+            median_time(lambda: Calibration.find_best_threshold(crop, profile)) for crop in crops[:100]])
+        baseline = baseline or filter_time
+        pupils = locate(profile)
+        errors = [np.hypot(found[0] - expected[0], found[1] - expected[1])
+                  for found, expected in zip(pupils, reference) if found is not None and expected is not None]
+        print("{:<10} {:>12.1f} {:>16.1f} {:>7.1f}x {:>10} {:>16.2f}".format(
+            profile,
+            filter_time * 1e6,
+            calibration_time * 1e6,
+            baseline / filter_time,
+            sum(found is None for found in pupils),
+            np.mean(errors) if errors else float("nan")))
+
+
+if __name__ == '__main__':
+    main()
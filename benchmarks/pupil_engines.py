@@ -0,0 +1,92 @@
+"""
+Compares the pupil localisation engines of Pupil: the second largest
+contour found with findContours, and the largest dark connected component
+found with connectedComponentsWithStats.
+
+Synthetic eye frames are drawn like the ones isolated by Eye: a white
+background around a light eye, with a dark iris at a known sub-pixel
+position, partly hidden by the eyelids, and noise. The time spent locating
+the pupil on the binarized frame, the whole Pupil analysis time, the miss
+rate and the distance to the true center are reported for each engine.
+
+Usage:
+    python -m benchmarks.pupil_engines [--frames 2000] [--threshold 60] [--noise 6]
+"""
+
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+from gaze_tracking.pupil import Pupil
+
+# Drawing is done with 4 bits of sub-pixel precision
+SHIFT = 4
+
+
+def eye_frame(rng, noise, width=46, height=26, margin=5):
+    """Returns a synthetic eye frame and the true center of its iris"""
+    frame = np.full((height, width), 255, np.uint8)
+    eye = np.zeros((height, width), np.uint8)
+    center = (width // 2, height // 2)
+    axes = (width // 2 - margin, height // 2 - margin + rng.integers(0, 3))
+    cv2.ellipse(eye, center, axes, 0, 0, 360, 255, -1)
+
+    radius = rng.uniform(5, 7.5)
+    iris = (center[0] + rng.uniform(-0.6, 0.6) * axes[0], center[1] + rng.uniform(-0.4, 0.4) * axes[1])
+    content = np.full((height, width), rng.uniform(170, 210), np.float64)
+    scale = 1 << SHIFT
+    point = (int(round(iris[0] * scale)), int(round(iris[1] * scale)))
+    cv2.circle(content, point, int(radius * scale), rng.uniform(40, 70), -1, cv2.LINE_AA, SHIFT)
+    cv2.circle(content, point, int(radius * scale / 2.5), 20, -1, cv2.LINE_AA, SHIFT)
+    content += rng.normal(0, noise, content.shape)
+    frame[eye > 0] = np.clip(content, 0, 255).astype(np.uint8)[eye > 0]
+    return frame, iris
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--threshold", type=int, default=60, help="Binarization threshold")
+    parser.add_argument("--noise", type=float, default=6, help="Standard deviation of the noise")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    frames = [eye_frame(rng, args.noise) for _ in range(args.frames)]
+
+    print("Frames: {}, size: {}x{}".format(len(frames), frames[0][0].shape[1], frames[0][0].shape[0]))
+    print("{:<12} {:>16} {:>14} {:>10} {:>16} {:>16}".format(
+        "engine", "locate (us)", "pupil (us)", "misses", "mean error (px)", "p95 error (px)"))
+    for engine in Pupil.ENGINES:
+        locate = Pupil.locate_components if engine == "components" else Pupil.locate_contours
+        locate_durations, durations, errors = [], [], []
+        misses = 0
+        for frame, iris in frames:
+            start = time.perf_counter()
+            pupil = Pupil(frame, args.threshold, engine)
+            durations.append(time.perf_counter() - start)
+
+            # Only the localisation, on the frame binarized by Pupil
+            start = time.perf_counter()
+            locate(pupil.iris_frame)
+            locate_durations.append(time.perf_counter() - start)
+
+            if pupil.x is None:
+                misses += 1
+                continue
+            errors.append(np.hypot(pupil.x - iris[0], pupil.y - iris[1]))
+
+        errors = np.array(errors)
+        print("{:<12} {:>16.1f} {:>14.1f} {:>10} {:>16.2f} {:>16.2f}".format(
+            engine,
+            np.median(locate_durations) * 1e6,
+            np.median(durations) * 1e6,
+            misses,
+            errors.mean() if len(errors) else float("nan"),
+            np.percentile(errors, 95) if len(errors) else float("nan")))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Replays a recorded video, or a directory of frames, through GazeTracking and
+reports its throughput, per frame latency, and face and pupil detection rates.
+
+The results are printed as JSON and can be saved with --output. Given a
+previous result with --baseline, the command fails when the throughput or the
+detection rates dropped by more than --tolerance, or when frames of a
+directory could not be replayed, so it can be run in CI. The frame count of a
+video is only approximate, a video giving fewer frames is reported without
+failing.
+
+Usage:
+    python -m benchmarks.replay VIDEO_OR_DIRECTORY [--realtime] [--frames N] [--stages]
+        [--output results.json] [--baseline baseline.json] [--tolerance 0.1]
+"""
+
+import argparse
+import json
+import sys
+
+from gaze_tracking import GazeTracking, Metrics
+from gaze_tracking.replay import open_source, replay
+
+
+def regressions(results, baseline, tolerance):
+    """Returns a message for each metric that got worse than the baseline,
+    and one if a directory gave fewer frames than it holds"""
+    messages = []
+    # Only the directories report skipped frames, their count is exact
+    if results["skipped_frames"] is not None and results["frames"] < results["expected_frames"]:
+        messages.append("only {} of {} frames were replayed".format(results["frames"], results["expected_frames"]))
+    for key in ("fps", "face_rate", "pupils_rate"):
+        if results[key] < baseline[key] * (1 - tolerance):
+            messages.append("{} dropped from {:.3f} to {:.3f}".format(key, baseline[key], results[key]))
+    return messages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="Video file or directory of frames")
+    parser.add_argument("--realtime", action="store_true", help="Feed the frames at their recorded rate")
+    parser.add_argument("--fps", type=float, default=30, help="Recorded rate of a directory of frames")
+    parser.add_argument("--frames", type=int, help="Maximum number of frames to replay")
+    parser.add_argument("--no-tracking", action="store_true", help="Detect the face on every frame")
+    parser.add_argument("--detection-scale", type=float, default=1.0)
+    parser.add_argument("--stages", action="store_true", help="Also report the time spent in each stage")
+    parser.add_argument("--output", help="File to save the results to")
+    parser.add_argument("--baseline", help="Results of a previous run to compare to")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Accepted relative drop from the baseline")
+    args = parser.parse_args()
+
+    metrics = Metrics(window=10000) if args.stages else None
+    tracker = GazeTracking(tracking=not args.no_tracking, detection_scale=args.detection_scale, metrics=metrics)
+    results = replay(tracker, open_source(args.path, args.realtime, args.fps), args.frames)
+    if metrics is not None:
+        results["stages"] = metrics.summary()
+    results["config"] = {
+        "path": args.path,
+        "realtime": args.realtime,
+        "tracking": not args.no_tracking,
+        "detection_scale": args.detection_scale,
+    }
+
+    print(json.dumps(results, indent=2))
+    if results["skipped_frames"] is None and results["expected_frames"] is not None \
+            and results["frames"] < results["expected_frames"]:
+        print("{} of about {} frames were replayed".format(results["frames"], results["expected_frames"]),
+              file=sys.stderr)
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as baseline:
+            messages = regressions(results, json.load(baseline), args.tolerance)
+        for message in messages:
+            print(message, file=sys.stderr)
+        if messages:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
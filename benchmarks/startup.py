@@ -0,0 +1,97 @@
+"""
+Measures how long it takes before the first frame is analyzed, each scenario
+running in a new Python process so nothing is cached.
+
+- lazy: the models are loaded by the first refresh
+
+The first frame always includes a landmarks prediction, on the whole frame
+if no face is found on it, so that the predictor is loaded in every scenario
+even with the default black frame.
+- warm-up: the models are loaded in the background from the creation of the
+  tracker, while the webcam opens, simulated by --camera-delay
+- second tracker: a tracker created after a first one reuses its models
+- i3 import: importing the modules of the i3-deep-focus entry point
+
+Usage:
+    python -m benchmarks.startup [--frame image.png] [--camera-delay 0.5] [--repeat 3]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+SCENARIO = r'''
+import json, sys, time
+start = time.perf_counter()
+import cv2, numpy
+frame = cv2.imread(sys.argv[2]) if sys.argv[2] else numpy.zeros((480, 640, 3), numpy.uint8)
+times = {}
+begin = time.perf_counter()
+from gaze_tracking import GazeTracking
+times["import"] = time.perf_counter() - begin
+begin = time.perf_counter()
+tracker = GazeTracking(warm_up=sys.argv[1] != "lazy")
+times["create"] = time.perf_counter() - begin
+time.sleep(float(sys.argv[3]))
+def first_frame(tracker):
+    tracker.refresh(frame)
+    if tracker.face is None:
+        import dlib
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        tracker._predictor(gray, dlib.rectangle(0, 0, gray.shape[1] - 1, gray.shape[0] - 1))
+begin = time.perf_counter()
+first_frame(tracker)
+times["first_frame"] = time.perf_counter() - begin
+if sys.argv[1] == "second":
+    begin = time.perf_counter()
+    tracker = GazeTracking()
+    first_frame(tracker)
+    times["second_tracker"] = time.perf_counter() - begin
+print(json.dumps(times))
+'''
+
+I3_IMPORT = r'''
+import importlib, json, time
+begin = time.perf_counter()
+importlib.import_module("i3-deep-focus.__main__")
+print(json.dumps({"import": time.perf_counter() - begin}))
+'''
+
+
+def run(code, *arguments):
+    output = subprocess.run(
+        [sys.executable, "-c", code] + list(arguments), check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frame", default="", help="Image analyzed as first frame, a black frame if omitted")
+    parser.add_argument("--camera-delay", type=float, default=0.5,
+                        help="Seconds between the creation of the tracker and the first frame")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario, the fastest is kept")
+    args = parser.parse_args()
+
+    delay = str(args.camera_delay)
+    print("{:<16} {:>12} {:>12} {:>16} {:>16}".format(
+        "scenario", "import (ms)", "create (ms)", "first frame (ms)", "to first frame"))
+    for scenario in ("lazy", "warm-up", "second"):
+        runs = [run(SCENARIO, scenario, args.frame, delay) for _ in range(args.repeat)]
+        best = min(runs, key=lambda times: times["import"] + times["create"] + times["first_frame"])
+        # Time from the start of the import to the analyzed frame, the camera delay included
+        total = best["import"] + best["create"] + args.camera_delay + best["first_frame"]
+        print("{:<16} {:>12.1f} {:>12.1f} {:>16.1f} {:>14.1f}ms".format(
+            scenario, best["import"] * 1000, best["create"] * 1000, best["first_frame"] * 1000, total * 1000))
+        if "second_tracker" in best:
+            print("{:<16} {:>58.1f}ms".format("second tracker", best["second_tracker"] * 1000))
+
+    try:
+        imports = min(run(I3_IMPORT)["import"] for _ in range(args.repeat))
+        print("{:<16} {:>12.1f}".format("i3 import", imports * 1000))
+    except subprocess.CalledProcessError as error:
+        print("i3 import failed: {}".format(error.stderr.strip().splitlines()[-1]), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
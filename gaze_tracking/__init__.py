@@ -1 +1,5 @@
 from .gaze_tracking import GazeTracking
+from .snapshot import GazeSnapshot
+from .capture import FrameCapture
+from .pipeline import AnalysisPipeline
+from .metrics import Metrics, serve_metrics
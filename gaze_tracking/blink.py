@@ -0,0 +1,105 @@
+import typing
+
+import numpy
+
+
+class BlinkDetector(object):
+    """
+    This class follows the openness of one eye over the frames to tell when it
+    is closed. The openness of the last frames the eye was open is kept in a
+    ring buffer, and its median is the baseline the eye is compared to, so
+    the thresholds adapt to the shape of the eyes of the user.
+
+    The eye goes from open to blinking when it closes, then back to open if it
+    reopens quickly, which is a blink, or to closed if it stays shut.
+    """
+
+    OPEN = "open"
+    BLINKING = "blinking"
+    CLOSED = "closed"
+
+    # Openness below which the eye is closed while there is no baseline yet,
+    # the inverse of the fixed blinking ratio used before
+    DEFAULT_THRESHOLD = 1 / 3.8
+
+    def __init__(
+            self,
+            history: int = 90,
+            close_ratio: float = 0.65,
+            open_ratio: float = 0.8,
+            closed_after: float = 0.4,
+            min_samples: int = 15):
+        """
+        :param history: Number of frames the baseline is computed from
+        :param close_ratio: The eye closes when its openness drops below this
+            fraction of the baseline
+        :param open_ratio: The eye opens again when its openness rises above
+            this fraction of the baseline
+        :param closed_after: Seconds after which a shut eye is closed instead
+            of blinking
+        :param min_samples: Number of frames needed before using the baseline
+        """
+        self.close_ratio = close_ratio
+        self.open_ratio = open_ratio
+        self.closed_after = closed_after
+        self.min_samples = min_samples
+        self._history = numpy.empty(history)
+        self._size = 0
+        self._index = 0
+        self.baseline: typing.Optional[float] = None
+        self.state = self.OPEN
+        self._closed_at: typing.Optional[float] = None
+        self._timestamp: typing.Optional[float] = None
+
+    @property
+    def closed(self) -> bool:
+        """Returns true while the eye is shut, blinking or closed"""
+        return self.state != self.OPEN
+
+    def _thresholds(self):
+        if self.baseline is None:
+            return self.DEFAULT_THRESHOLD, self.DEFAULT_THRESHOLD
+        return self.baseline * self.close_ratio, self.baseline * self.open_ratio
+
+    def _record(self, openness):
+        self._history[self._index] = openness
+        self._index = (self._index + 1) % len(self._history)
+        self._size = min(self._size + 1, len(self._history))
+        if self._size >= self.min_samples:
+            self.baseline = float(numpy.median(self._history[:self._size]))
+
+    def update(self, openness: float, timestamp: float) -> typing.Optional[str]:
+        """Updates the state with the openness of the eye on a new frame
+
+        Arguments:
+            openness (float): Height of the eye divided by its width
+            timestamp (float): Time at which the frame was captured, frames
+                older than the last one don't change the state
+
+        Returns:
+            "blink" when the eye reopens after a blink, "closed" when it has
+            been shut for closed_after seconds, "opened" when it reopens after
+            that, None otherwise
+        """
+        if self._timestamp is not None and timestamp < self._timestamp:
+            return None
+        self._timestamp = timestamp
+        close_threshold, open_threshold = self._thresholds()
+
+        if self.state == self.OPEN:
+            if openness < close_threshold:
+                self.state = self.BLINKING
+                self._closed_at = timestamp
+            else:
+                self._record(openness)
+            return None
+
+        if openness > open_threshold:
+            event = "blink" if self.state == self.BLINKING else "opened"
+            self.state = self.OPEN
+            self._record(openness)
+            return event
+        if self.state == self.BLINKING and timestamp - self._closed_at >= self.closed_after:
+            self.state = self.CLOSED
+            return "closed"
+        return None
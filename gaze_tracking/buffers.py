@@ -0,0 +1,31 @@
+import numpy as np
+
+
+class BufferPool(object):
+    """
+    This class keeps scratch arrays that are reused from one frame to the
+    next, so that the per frame work doesn't allocate new arrays.
+    Each buffer only grows, and a view of the requested size is returned.
+    """
+
+    def __init__(self):
+        self._buffers = {}
+
+    def get(self, key, height, width, dtype=np.uint8):
+        """Returns a (height, width) array, its content is undefined and is
+        overwritten the next time the same key is requested.
+
+        Arguments:
+            key: Identifies the buffer, users working concurrently must use different keys
+            height (int): Number of rows of the array
+            width (int): Number of columns of the array
+            dtype: Type of the elements of the array
+        """
+        buffer = self._buffers.get(key)
+        if buffer is None or buffer.dtype != dtype or buffer.shape[0] < height or buffer.shape[1] < width:
+            shape = (height, width)
+            if buffer is not None and buffer.dtype == dtype:
+                shape = (max(height, buffer.shape[0]), max(width, buffer.shape[1]))
+            buffer = np.empty(shape, dtype)
+            self._buffers[key] = buffer
+        return buffer[:height, :width]
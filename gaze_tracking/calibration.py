@@ -1,5 +1,9 @@
 from __future__ import division
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import cv2
+import numpy as np
 from .pupil import Pupil
 
 
@@ -7,16 +11,49 @@ class Calibration(object):
     """
     This class calibrates the pupil detection algorithm by finding the
     best binarization threshold value for the person and the webcam.
+
+    The threshold of each eye is the mean of the thresholds found on a burst
+    of nb_frames frames, kept as a running mean so it takes constant time and
+    memory. Afterwards only the brightness of the eye frames is followed, and
+    a new burst is started when it drifts, after a change of lighting.
     """
 
-    def __init__(self):
-        self.nb_frames = 20
-        self.thresholds_left = []
-        self.thresholds_right = []
+    THRESHOLDS = np.arange(5, 100, 5)
+
+    def __init__(self, preprocessing="quality", nb_frames=20, drift=12.0, smoothing=0.05):
+        """
+        :param preprocessing: Profile of Pupil.PREPROCESSING the pupils are
+            found with, the thresholds are searched with the same one
+        :param nb_frames: Number of frames evaluated by a burst
+        :param drift: Change of the mean brightness of an eye frame, in gray
+            levels, since the last burst that starts a new one
+        :param smoothing: Weight of a new frame in the brightness average
+        """
+        self.nb_frames = nb_frames
+        self.preprocessing = preprocessing
+        self.drift = drift
+        self.smoothing = smoothing
+        # For each eye: running mean of the thresholds of the current burst,
+        # number of thresholds in it, evaluations not done yet, average
+        # brightness of the frames, the brightness the burst started at and
+        # the number of bursts started, which tags the background evaluations
+        self._estimates = [None, None]
+        self._counts = [0, 0]
+        self._pending = [0, 0]
+        self._brightness = [None, None]
+        self._references = [None, None]
+        self._generations = [0, 0]
+        self.bursts = 0
+
+        # Once a first threshold is known, frames are evaluated by background
+        # workers so that calibrating doesn't slow down the tracking, one per
+        # eye so that both can be evaluated at the same time
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="Calibration")
+        self._lock = threading.Lock()
 
     def is_complete(self):
-        """Returns true if the calibration is completed"""
-        return len(self.thresholds_left) >= self.nb_frames and len(self.thresholds_right) >= self.nb_frames
+        """Returns true if no burst is running for either eye"""
+        return self._counts[0] >= self.nb_frames and self._counts[1] >= self.nb_frames
 
     def threshold(self, side):
         """Returns the threshold value for the given eye.
@@ -24,10 +61,7 @@ class Calibration(object):
         Argument:
             side: Indicates whether it's the left eye (0) or the right eye (1)
         """
-        if side == 0:
-            return int(sum(self.thresholds_left) / len(self.thresholds_left))
-        elif side == 1:
-            return int(sum(self.thresholds_right) / len(self.thresholds_right))
+        return int(self._estimates[side])
 
     @staticmethod
     def iris_size(frame):
@@ -44,35 +78,103 @@ class Calibration(object):
         return nb_blacks / nb_pixels
 
     @staticmethod
-    def find_best_threshold(eye_frame):
+    def find_best_threshold(eye_frame, preprocessing="quality"):
         """Calculates the optimal threshold to binarize the
         frame for the given eye.
 
+        The frame is filtered once, then the iris size for every candidate
+        threshold is read from the cumulative histogram of the filtered frame:
+        binarizing with a threshold turns black every pixel lower or equal to it.
+
         Argument:
             eye_frame (numpy.ndarray): Frame of the eye to be analyzed
+            preprocessing (str): Profile of Pupil.PREPROCESSING to filter it with
         """
         # TODO: find best value for this automatically
         average_iris_size = 0.98 #0.48
-        trials = {}
 
-        for threshold in range(5, 100, 5):
-            iris_frame = Pupil.image_processing(eye_frame, threshold)
-            trials[threshold] = Calibration.iris_size(iris_frame)
+        frame = Pupil.filter(eye_frame, preprocessing)[5:-5, 5:-5]
+        nb_blacks = np.cumsum(np.bincount(frame.ravel(), minlength=256))
+        iris_sizes = nb_blacks[Calibration.THRESHOLDS] / frame.size
 
-        best_threshold, iris_size = min(trials.items(), key=(lambda p: abs(p[1] - average_iris_size)))
-        return best_threshold
+        return int(Calibration.THRESHOLDS[np.argmin(np.abs(iris_sizes - average_iris_size))])
+
+    @staticmethod
+    def brightness(eye_frame):
+        """Returns the mean gray level of the eye, the white background around
+        it is left out
+
+        Argument:
+            eye_frame (numpy.ndarray): Frame of the eye
+        """
+        pixels = eye_frame[eye_frame < 255]
+        return float(pixels.mean()) if pixels.size else 255.0
 
     def evaluate(self, eye_frame, side):
         """Improves calibration by taking into consideration the
-        given image.
+        given image, it is meant to be called on every frame.
+
+        The first frame of each eye is evaluated right away so that a threshold
+        is available, the following ones of a burst are evaluated in the
+        background. Between bursts only the brightness is measured.
+        Both eyes can be evaluated from different threads at the same time.
 
         Arguments:
             eye_frame (numpy.ndarray): Frame of the eye
             side: Indicates whether it's the left eye (0) or the right eye (1)
         """
-        threshold = self.find_best_threshold(eye_frame)
+        brightness = self.brightness(eye_frame)
+        with self._lock:
+            if self._brightness[side] is None:
+                self._brightness[side] = self._references[side] = brightness
+            else:
+                self._brightness[side] += self.smoothing * (brightness - self._brightness[side])
+            if (self._counts[side] >= self.nb_frames
+                    and abs(self._brightness[side] - self._references[side]) > self.drift):
+                # The lighting changed, the next thresholds replace the current
+                # one. The average still lags behind the new lighting, it
+                # restarts from this frame so that it doesn't drift further
+                # and start more bursts for the same change.
+                self._counts[side] = 0
+                self._brightness[side] = self._references[side] = brightness
+                self._generations[side] += 1
+                self.bursts += 1
+
+            first = self._estimates[side] is None
+            if not first:
+                if self._counts[side] + self._pending[side] >= self.nb_frames:
+                    return
+                self._pending[side] += 1
+            generation = self._generations[side]
+
+        if first:
+            threshold = self.find_best_threshold(eye_frame, self.preprocessing)
+            with self._lock:
+                self._add(side, threshold)
+            return
+        self._executor.submit(self._evaluate_in_background, eye_frame.copy(), side, generation)
+
+    def _add(self, side, threshold):
+        """Adds a threshold to the running mean of the current burst, the first
+        one of a burst replaces the previous estimate. The lock must be held."""
+        self._counts[side] += 1
+        if self._estimates[side] is None:
+            self._estimates[side] = float(threshold)
+        else:
+            self._estimates[side] += (threshold - self._estimates[side]) / self._counts[side]
+        if self._counts[side] == self.nb_frames:
+            # The next drift is measured from the lighting the burst saw
+            self._references[side] = self._brightness[side]
 
-        if side == 0:
-            self.thresholds_left.append(threshold)
-        elif side == 1:
-            self.thresholds_right.append(threshold)
+    def _evaluate_in_background(self, eye_frame, side, generation):
+        threshold = None
+        try:
+            threshold = self.find_best_threshold(eye_frame, self.preprocessing)
+        finally:
+            # Released and added at once, so no frame is evaluated past the
+            # end of the burst, and a frame seen before a change of lighting
+            # doesn't count in the burst started since
+            with self._lock:
+                self._pending[side] -= 1
+                if threshold is not None and generation == self._generations[side]:
+                    self._add(side, threshold)
@@ -0,0 +1,112 @@
+import collections
+import threading
+import time
+import typing
+
+import numpy
+
+
+class FrameCapture(object):
+    """
+    This class reads frames from a source on its own thread and only keeps
+    the newest ones, so that a slow consumer always gets the freshest frame
+    instead of the frames queued up while it was busy.
+    The source can be anything with a read() method returning (success, frame)
+    like cv2.VideoCapture.
+    A webcam can fail to give a frame now and then, so the source only ends
+    after max_failures failed reads in a row. An exception raised by the
+    source also ends it, and is raised again by read.
+    """
+
+    def __init__(self, source, buffer_size: int = 2, max_failures: int = 5):
+        """
+        :param source: Object whose read() method returns (success, frame)
+        :param buffer_size: Number of frames kept, older ones are dropped
+        :param max_failures: Number of failed reads in a row ending the source
+        """
+        self.source = source
+        self.max_failures = max_failures
+        self.captured_frames = 0
+        self.failed_reads = 0
+        self.dropped_frames = 0
+        self.finished = False
+        self.error: typing.Optional[BaseException] = None
+
+        self._frames = collections.deque(maxlen=buffer_size)
+        self._condition = threading.Condition()
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        """Starts reading frames in the background"""
+        if self._thread is not None:
+            return self
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="ThreadCapture", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops reading frames, waiting for the frame being read"""
+        self._running = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *_):
+        self.stop()
+
+    def _run(self):
+        failures = 0
+        try:
+            while self._running:
+                success, frame = self.source.read()
+                timestamp = time.monotonic()
+                if not success:
+                    self.failed_reads += 1
+                    failures += 1
+                    if failures >= self.max_failures:
+                        break
+                    continue
+                failures = 0
+                with self._condition:
+                    self.captured_frames += 1
+                    if len(self._frames) == self._frames.maxlen:
+                        self.dropped_frames += 1
+                    self._frames.append((self.captured_frames, timestamp, frame))
+                    self._condition.notify_all()
+        except BaseException as error:
+            self.error = error
+        finally:
+            with self._condition:
+                self.finished = True
+                self._condition.notify_all()
+
+    def read(self, timeout: typing.Optional[float] = None) \
+            -> typing.Optional[typing.Tuple[int, float, numpy.ndarray]]:
+        """Waits for a frame that wasn't read yet and returns the newest one,
+        the older frames left in the buffer are dropped.
+
+        Arguments:
+            timeout (float): Maximum number of seconds to wait, forever if None
+
+        Returns:
+            (frame number, capture time as given by time.monotonic(), frame), or
+            None if the source has no more frames or the timeout expired
+
+        Raises:
+            The exception the source raised, once its frames are read
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._frames or self.finished, timeout)
+            if not self._frames:
+                if self.error is not None:
+                    raise self.error
+                return None
+            frame = self._frames.pop()
+            self.dropped_frames += len(self._frames)
+            self._frames.clear()
+            return frame
@@ -1,12 +1,12 @@
-import math
-
-import dlib
 import numpy
 import numpy as np
 import cv2
 import typing
 
+from .blink import BlinkDetector
+from .buffers import BufferPool
 from .calibration import Calibration
+from .metrics import NULL_METRICS
 from .pupil import Pupil
 
 
@@ -22,15 +22,28 @@ class Eye(object):
     def __init__(
             self,
             original_frame: typing.Optional[numpy.ndarray],
-            landmarks: typing.Optional[dlib.full_object_detection],
+            landmarks: typing.Optional[numpy.ndarray],
             side: typing.Optional[int],
-            calibration: typing.Optional[Calibration]):
+            calibration: typing.Optional[Calibration],
+            buffers: typing.Optional[BufferPool] = None,
+            metrics=NULL_METRICS,
+            pupil_engine: str = "contours",
+            blink_detector: typing.Optional[BlinkDetector] = None,
+            timestamp: typing.Optional[float] = None):
         """
 
         :param original_frame:
-        :param landmarks: Facial landmarks for the face region
+        :param landmarks: (68, 2) array of the facial landmarks for the face region
         :param side: Indicates whether it's the left eye (0) or the right eye (1)
         :param calibration:
+        :param buffers: Pool the eye frame is taken from, the frame is then only
+            valid until the next eye of the same side is created with this pool
+        :param metrics: Collects the time spent in each stage of the analysis
+        :param pupil_engine: Method locating the pupil, one of Pupil.ENGINES
+        :param blink_detector: Follows this eye over the frames, the pupil
+            isn't searched while it is shut
+        :param timestamp: Time at which the frame was captured, used by the
+            blink detector
         """
         self.landmarks = landmarks
         self.side = side
@@ -39,18 +52,31 @@ class Eye(object):
         self.center = None
         self.radius = None
         self.pupil = None
-
-        if not self.landmarks: return
-
-        self._analyze(original_frame, calibration)
-
-    def _analyze(self, original_frame, calibration):
+        self.blinking = None
+        # Whether the blink detector considers the eye shut, and the event it
+        # reported on this frame, None without blink detector
+        self.closed = None
+        self.blink_event = None
+        self._buffers = buffers
+        self._metrics = metrics
+        self._pupil_engine = pupil_engine
+        self._eye_center = None
+        self._pupil_center = None
+        self._ratios = None
+
+        if self.landmarks is None: return
+
+        self._analyze(original_frame, calibration, blink_detector, timestamp)
+
+    def _analyze(self, original_frame, calibration, blink_detector=None, timestamp=None):
         """Detects and isolates the eye in a new frame, sends data to the calibration
         and initializes Pupil object.
 
         Arguments:
             original_frame (numpy.ndarray): Frame passed by the user
             calibration (calibration.Calibration): Manages the binarization threshold value
+            blink_detector (blink.BlinkDetector): Tells whether the eye is shut
+            timestamp (float): Time at which the frame was captured
         """
         if self.side == 0:
             points = self.LEFT_EYE_POINTS
@@ -59,112 +85,137 @@ class Eye(object):
         else:
             return
 
-        self.blinking = self._blinking_ratio(points)
-        self._isolate(original_frame, points)
+        self.points = self.landmarks[points]
+        # Left and right corners, then middle of the top and bottom eyelids
+        self.corners = np.vstack((
+            self.points[[0, 3]],
+            ((self.points[[1, 5]] + self.points[[2, 4]]) / 2).astype(int)
+        ))
+
+        self.blinking = self._blinking_ratio()
+        with self._metrics.stage("isolate"):
+            self._isolate(original_frame, self.points)
+        if self.frame is None:
+            # The eye is out of the frame, there is nothing to analyze
+            self._metrics.increment("eyes_out_of_frame")
+            return
 
-        if not calibration.is_complete():
+        if blink_detector is not None:
+            self.blink_event = blink_detector.update(1 / self.blinking if self.blinking else 0.0, timestamp)
+            self.closed = blink_detector.closed
+            if self.closed:
+                # There is no pupil to find, and the frame would mislead the calibration
+                self._metrics.increment("closed_eyes")
+                return
+
+        with self._metrics.stage("calibration"):
             calibration.evaluate(self.frame, self.side)
 
         threshold = calibration.threshold(self.side)
-        self.pupil = Pupil(self.frame, threshold)
-
-    @staticmethod
-    def _middle_point(p1: dlib.point, p2: dlib.point):
-        """Returns the middle point (x,y) between two points
-
-        Arguments:
-            p1 (dlib.point): First point
-            p2 (dlib.point): Second point
-        """
-        x = int((p1.x + p2.x) / 2)
-        y = int((p1.y + p2.y) / 2)
-        return x, y
+        with self._metrics.stage("pupil"):
+            self.pupil = Pupil(self.frame, threshold, self._pupil_engine, calibration.preprocessing)
+        if self.pupil.x is not None and self.pupil.y is not None:
+            self._pupil_center = (self.origin[0] + self.pupil.x, self.origin[1] + self.pupil.y)
+        else:
+            self._metrics.increment("pupil_misses")
 
     def _isolate(self, frame, points):
         """Isolate an eye, to have a frame without other part of the face.
+        The frame is left to None when the eye is entirely out of the frame,
+        dlib places the landmarks outside of it when the face is partly out.
 
         Arguments:
             frame (numpy.ndarray): Frame containing the face
-            points (list): Points of an eye (from the 68 Multi-PIE landmarks)
+            points (numpy.ndarray): Coordinates of the points of the eye
         """
-        region = np.array([(self.landmarks.part(point).x, self.landmarks.part(point).y) for point in points])
-        region = region.astype(np.int32)
-
-        # Applying a mask to get only the eye
-        height, width = frame.shape[:2]
-        black_frame = np.zeros((height, width), np.uint8)
-        mask = np.full((height, width), 255, np.uint8)
-        cv2.fillPoly(mask, [region], (0, 0, 0))
-        eye = cv2.bitwise_not(black_frame, frame.copy(), mask=mask)
+        region = points.astype(np.int32)
 
         # Cropping on the eye
         margin = 5
-        min_x = np.min(region[:, 0]) - margin
-        max_x = np.max(region[:, 0]) + margin
-        min_y = np.min(region[:, 1]) - margin
-        max_y = np.max(region[:, 1]) + margin
-
-        self.frame = eye[min_y:max_y, min_x:max_x]
+        height, width = frame.shape[:2]
+        min_x = max(np.min(region[:, 0]) - margin, 0)
+        max_x = max(min(np.max(region[:, 0]) + margin, width), min_x)
+        min_y = max(np.min(region[:, 1]) - margin, 0)
+        max_y = max(min(np.max(region[:, 1]) + margin, height), min_y)
+        crop_height, crop_width = max_y - min_y, max_x - min_x
         self.origin = (min_x, min_y)
 
-        height, width = self.frame.shape[:2]
+        if crop_height == 0 or crop_width == 0:
+            self.frame = None
+        else:
+            self._mask(frame, region, crop_height, crop_width)
+
+        height, width = crop_height, crop_width
         height = 2 if height <= 1 else height
         width = 2 if width <= 1 else width
         self.radius = int((height + width) / 4)
         self.center = (width / 2, height / 2)
-
-    def _blinking_ratio(self, points):
+        self._eye_center = (int(self.origin[0] + self.center[0]), int(self.origin[1] + self.center[1]))
+
+    def _mask(self, frame, region, crop_height, crop_width):
+        """Crops the eye and makes everything around it white"""
+        min_x, min_y = self.origin
+        # Applying a mask to get only the eye, everything outside of it is white
+        if self._buffers is not None:
+            mask = self._buffers.get((self.side, "mask"), crop_height, crop_width)
+            eye = self._buffers.get((self.side, "eye"), crop_height, crop_width)
+        else:
+            mask = np.empty((crop_height, crop_width), np.uint8)
+            eye = np.empty((crop_height, crop_width), np.uint8)
+        mask.fill(255)
+        cv2.fillPoly(mask, [(region - (min_x, min_y)).astype(np.int32)], (0, 0, 0))
+        self.frame = cv2.bitwise_or(
+            frame[min_y:min_y + crop_height, min_x:min_x + crop_width], mask, dst=eye)
+
+    def _blinking_ratio(self):
         """Calculates a ratio that can indicate whether an eye is closed or not.
         It's the division of the width of the eye, by its height.
 
-        Arguments:
-            points (list): Points of an eye (from the 68 Multi-PIE landmarks)
-
         Returns:
             The computed ratio
         """
-        left = (self.landmarks.part(points[0]).x, self.landmarks.part(points[0]).y)
-        right = (self.landmarks.part(points[3]).x, self.landmarks.part(points[3]).y)
-        top = self._middle_point(self.landmarks.part(points[1]), self.landmarks.part(points[2]))
-        bottom = self._middle_point(self.landmarks.part(points[5]), self.landmarks.part(points[4]))
+        eye_width, eye_height = np.hypot(*(self.corners[[0, 2]] - self.corners[[1, 3]]).T)
 
-        eye_width = math.hypot((left[0] - right[0]), (left[1] - right[1]))
-        eye_height = math.hypot((top[0] - bottom[0]), (top[1] - bottom[1]))
-
-        try:
-            ratio = eye_width / eye_height
-        except ZeroDivisionError:
-            ratio = None
-
-        return ratio
+        if eye_height == 0:
+            return None
+        return float(eye_width / eye_height)
 
     @property
     def eye_center(self):
         """Returns the coordinates of the center of the eye"""
-        if self.center and self.origin:
-            x = int(self.origin[0] + self.center[0])
-            y = int(self.origin[1] + self.center[1])
-            return x, y
+        return self._eye_center
 
     @property
     def pupil_located(self):
         """Check that the pupils have been located"""
-        try:
-            int(self.pupil.x)
-            int(self.pupil.y)
-            return True
-        except (TypeError, AttributeError) as _:
-            return False
+        return self._pupil_center is not None
 
     @property
     def pupil_center(self):
         """Returns the coordinates of the center of the pupil"""
-        if self.pupil_located:
-            x = self.origin[0] + self.pupil.x
-            y = self.origin[1] + self.pupil.y
-            return x, y
-        else:
-            return None
+        return self._pupil_center
+
+    def _gaze_ratios(self):
+        """Computes the horizontal and vertical gaze ratios at once, and only
+        once per eye. Each one is the distance from the first corner of an
+        axis of the eye (left corner, top eyelid) to the pupil, extended by the
+        area of the triangle formed by the axis and the pupil divided by the
+        length of the axis, and divided by the length of the axis.
+        """
+        if self._ratios is None:
+            start = self.corners[[0, 2]]
+            axis = self.corners[[1, 3]] - start
+            to_pupil = np.asarray(self.pupil_center) - start
+            length = np.hypot(*axis.T)
+            if not length.all():
+                self._ratios = (None, None)
+                return self._ratios
+            # Area of the triangle formed by each axis and the pupil (half of the
+            # cross product) divided by the length of the axis
+            height = np.abs(axis[:, 0] * to_pupil[:, 1] - axis[:, 1] * to_pupil[:, 0]) / (2 * length)
+            ratios = np.hypot(np.hypot(*to_pupil.T), height) / length
+            self._ratios = (float(ratios[0]), float(ratios[1]))
+        return self._ratios
 
     def horizontal_ratio(self):
         """Returns a number between 0.0 and 1.0 that indicates the
@@ -172,25 +223,7 @@ class Eye(object):
         the center is 0.5 and the extreme left is 1.0
         """
         if self.pupil_located:
-            # pupil_pos = self.pupil.x / (self.center[0] * 2 - 10)
-            # return pupil_pos
-            if self.side == 0:
-                points = self.LEFT_EYE_POINTS
-            elif self.side == 1:
-                points = self.RIGHT_EYE_POINTS
-            else:
-                return
-
-            left = (self.landmarks.part(points[0]).x, self.landmarks.part(points[0]).y)
-            right = (self.landmarks.part(points[3]).x, self.landmarks.part(points[3]).y)
-            eye_width = math.hypot((left[0] - right[0]), (left[1] - right[1]))
-            pupil_to_left = math.hypot((left[0] - self.pupil_center[0]), (left[1] - self.pupil_center[1]))
-            pupil_to_right = math.hypot((self.pupil_center[0] - right[0]), (self.pupil_center[1]- right[1]))
-            semi_perimeter = (eye_width + pupil_to_left + pupil_to_right) / 2
-            area = math.sqrt(semi_perimeter*(semi_perimeter-eye_width)*(semi_perimeter-pupil_to_left)*(semi_perimeter-pupil_to_right))
-            height = area / eye_width
-            return math.hypot(pupil_to_left, height) / eye_width
-
+            return self._gaze_ratios()[0]
 
     def vertical_ratio(self):
         """Returns a number between 0.0 and 1.0 that indicates the
@@ -198,22 +231,4 @@ class Eye(object):
         the center is 0.5 and the extreme bottom is 1.0
         """
         if self.pupil_located:
-            # pupil_pos = self.pupil.y / (self.center[1] * 2 - 10)
-            # return pupil_pos
-
-            if self.side == 0:
-                points = self.LEFT_EYE_POINTS
-            elif self.side == 1:
-                points = self.RIGHT_EYE_POINTS
-            else:
-                return
-
-            top = self._middle_point(self.landmarks.part(points[1]), self.landmarks.part(points[2]))
-            bottom = self._middle_point(self.landmarks.part(points[5]), self.landmarks.part(points[4]))
-            eye_height = math.hypot((top[0] - bottom[0]), (top[1] - bottom[1]))
-            pupil_to_left = math.hypot((top[0] - self.pupil_center[0]), (top[1] - self.pupil_center[1]))
-            pupil_to_right = math.hypot((self.pupil_center[0] - bottom[0]), (self.pupil_center[1]- bottom[1]))
-            semi_perimeter = (eye_height + pupil_to_left + pupil_to_right) / 2
-            area = math.sqrt(semi_perimeter*(semi_perimeter-eye_height)*(semi_perimeter-pupil_to_left)*(semi_perimeter-pupil_to_right))
-            height = area / eye_height
-            return math.hypot(pupil_to_left, height) / eye_height
\ No newline at end of file
+            return self._gaze_ratios()[1]
@@ -1,13 +1,20 @@
 from __future__ import division
-import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import cv2
 import dlib
 import typing
 
 import numpy
-from imutils import face_utils
+from .blink import BlinkDetector
+from .buffers import BufferPool
 from .eye import Eye
 from .calibration import Calibration
+from .capture import FrameCapture
+from . import models
+from .metrics import NULL_METRICS, Metrics
+from .snapshot import GazeSnapshot
 
 
 class GazeTracking(object):
@@ -17,50 +24,430 @@ class GazeTracking(object):
     and pupils and allows to know if the eyes are open or closed
     """
 
-    def __init__(self):
+    def __init__(
+            self,
+            tracking: bool = True,
+            redetect_interval: int = 10,
+            tracking_margin: float = 0.25,
+            detection_scale: float = 1.0,
+            metrics: typing.Optional[Metrics] = None,
+            pupil_engine: str = "contours",
+            preprocessing: str = "quality",
+            parallel_eyes: bool = False,
+            blink_detection: bool = True,
+            reuse_threshold: typing.Optional[float] = None,
+            max_reuse: int = 10,
+            warm_up: bool = True):
+        """
+        :param tracking: Reuse the face found on previous frames instead of
+            running the face detector on every frame
+        :param redetect_interval: Number of frames tracked before the face
+            detector is run again
+        :param tracking_margin: Fraction of the face size the landmarks can move
+            between two frames before the face is considered lost
+        :param detection_scale: Factor applied to the frame before running the
+            face detector, landmarks are still predicted on the full frame
+        :param metrics: Collects the time spent in each stage of the analysis,
+            nothing is measured if None
+        :param pupil_engine: Method locating the pupils, one of Pupil.ENGINES
+        :param preprocessing: Smoothing of the eye frames before they are
+            binarized, one of Pupil.PREPROCESSING, "quality" is the slowest
+        :param parallel_eyes: Analyze the right eye on a worker thread while
+            the left one is analyzed, OpenCV releases the GIL for most of it
+        :param blink_detection: Follow the openness of the eyes over the frames
+            to detect blinks, and skip the pupils of shut eyes
+        :param reuse_threshold: Mean difference in gray levels between the
+            eyes of a frame and of the last analyzed one under which the
+            results of the last one are reused, every frame is analyzed if None
+        :param max_reuse: Number of frames in a row the results can be reused for
+        :param warm_up: Start loading the models in the background right away
+            instead of on the first frame
+        """
         self.frame:       typing.Optional[numpy.ndarray]              = None
         self.faces:       typing.Optional[typing.List[numpy.ndarray]] = None
         self.landmarks:   typing.Optional[dlib.full_object_detection] = None
-        self.calibration: Calibration                                 = Calibration()
-        self.eye_left:    typing.Optional[Eye]                        = Eye(self.frame, self.landmarks, 0, self.calibration)
-        self.eye_right:   typing.Optional[Eye]                        = Eye(self.frame, self.landmarks, 1, self.calibration)
+        self.points:      typing.Optional[numpy.ndarray]              = None
+        self.calibration: Calibration                                 = Calibration(preprocessing)
+        self.eye_left:    typing.Optional[Eye]                        = Eye(self.frame, self.points, 0, self.calibration)
+        self.eye_right:   typing.Optional[Eye]                        = Eye(self.frame, self.points, 1, self.calibration)
         self.nose:        typing.Optional[typing.Tuple]               = None
 
-        # _face_detector is used to detect faces
-        self._face_detector = dlib.get_frontal_face_detector()
+        # Everything found on the last analyzed frame, other threads should
+        # read this instead of the attributes above as it is replaced at once
+        self.frame_id:    int                                         = 0
+        self.snapshot:    GazeSnapshot                                = GazeSnapshot(
+            self.frame_id, None, None, None, None, self.eye_left, self.eye_right, None)
+        self._published = threading.Condition()
+        self._finished = False
+
+        self.tracking = tracking
+        self.redetect_interval = redetect_interval
+        self.tracking_margin = tracking_margin
+        self.detection_scale = detection_scale
+        self.metrics = metrics if metrics is not None else NULL_METRICS
+        self.pupil_engine = pupil_engine
+        self.preprocessing = preprocessing
+        self.blink_detection = blink_detection
+        self._blink_detectors = (BlinkDetector(), BlinkDetector()) if blink_detection else (None, None)
+        self.reuse_threshold = reuse_threshold
+        self.max_reuse = max_reuse
+        # Region around both eyes on the last analyzed frame and its content,
+        # compared to the same region of the next frames
+        self._gate_box:       typing.Optional[typing.Tuple[int, int, int, int]] = None
+        self._gate_reference: typing.Optional[numpy.ndarray]                    = None
+        self._reused_in_row = 0
+        self.reused_frames = 0
+        # Face box predicted from the last landmarks, and the position of the
+        # detector box relative to the landmarks hull when it was last detected
+        self._tracked_face:   typing.Optional[dlib.rectangle] = None
+        self._hull_to_face:   typing.Optional[numpy.ndarray]  = None
+        self._tracked_hull:   typing.Optional[numpy.ndarray]  = None
+        self._tracked_frames: int                             = 0
+
+        # Capture stage used by run, it counts the dropped frames
+        self.capture:     typing.Optional[FrameCapture]               = None
+
+        # Scratch buffers used to isolate the eyes, each side uses its own
+        self._buffers = BufferPool()
+
+        # Worker analyzing the right eye, kept for the whole session
+        self._eye_executor: typing.Optional[ThreadPoolExecutor] = None
+        if parallel_eyes:
+            self._eye_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="Eye")
+
+        # The models are shared by every tracker, they are loaded in the
+        # background so that creating a tracker doesn't wait for them
+        if warm_up:
+            models.warm_up()
+
+    @property
+    def _face_detector(self):
+        """dlib's face detector, loaded on first use"""
+        return models.face_detector()
+
+    @property
+    def _predictor(self):
+        """Predictor of the facial landmarks of a given face, loaded on first use"""
+        return models.landmarks_predictor()
+
+    @staticmethod
+    def _landmarks_to_array(landmarks: dlib.full_object_detection) -> numpy.ndarray:
+        """Returns the coordinates of the landmarks as a (68, 2) array"""
+        return numpy.array([(point.x, point.y) for point in landmarks.parts()], dtype=int)
+
+    @staticmethod
+    def _hull(points: numpy.ndarray) -> numpy.ndarray:
+        """Returns the bounding box (left, top, right, bottom) of the landmarks"""
+        return numpy.concatenate((points.min(axis=0), points.max(axis=0)))
+
+    def _run_detector(self, frame: numpy.ndarray, left: int = 0, top: int = 0):
+        """Runs the face detector on a downscaled copy of the frame and
+        returns the faces as rectangles of the full resolution frame.
+
+        Arguments:
+            frame (numpy.ndarray): Grayscale frame, or region of it
+            left (int): Horizontal position of the region in the full frame
+            top (int): Vertical position of the region in the full frame
+        """
+        scale = self.detection_scale
+        if scale != 1.0:
+            frame = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        else:
+            frame = numpy.ascontiguousarray(frame)
+        with self.metrics.stage("detect"):
+            faces = self._face_detector(frame)
+        return [
+            dlib.rectangle(
+                int(face.left() / scale) + left,
+                int(face.top() / scale) + top,
+                int(face.right() / scale) + left,
+                int(face.bottom() / scale) + top)
+            for face in faces
+        ]
+
+    def _detect_faces(self, frame: numpy.ndarray, around: typing.Optional[dlib.rectangle] = None):
+        """Runs the face detector, only around the given box if there is one
+        and falling back to the whole frame if no face is found there.
 
-        # _predictor is used to get facial landmarks of a given face
-        cwd = os.path.abspath(os.path.dirname(__file__))
-        model_path = os.path.abspath(os.path.join(cwd, "trained_models/shape_predictor_68_face_landmarks.dat"))
-        self._predictor = dlib.shape_predictor(model_path)
+        Arguments:
+            frame (numpy.ndarray): Grayscale frame
+            around (dlib.rectangle): Last known position of the face
+        """
+        if around is not None:
+            height, width = frame.shape[:2]
+            margin_x, margin_y = around.width() // 2, around.height() // 2
+            left, top = max(around.left() - margin_x, 0), max(around.top() - margin_y, 0)
+            right, bottom = min(around.right() + margin_x, width), min(around.bottom() + margin_y, height)
+            faces = self._run_detector(frame[top:bottom, left:right], left, top)
+            if faces:
+                return faces
+        return self._run_detector(frame)
 
-    def _analyze(self):
-        """Detects the face and initialize Eye objects"""
-        frame = cv2.cvtColor(self.frame, cv2.COLOR_BGR2GRAY)
-        self.faces = self._face_detector(frame)
-        self.landmarks = self._predictor(frame, self.face) if self.faces else None
-        self.eye_left = Eye(frame, self.landmarks, 0, self.calibration)
-        self.eye_right = Eye(frame, self.landmarks, 1, self.calibration)
-        self.nose = (self.landmarks.part(30).x, self.landmarks.part(30).y) if self.landmarks else None
+    def _predict_landmarks(self, frame: numpy.ndarray):
+        """Predicts the landmarks of the face, if one was found
 
-    def refresh(self, frame: numpy.ndarray):
+        Arguments:
+            frame (numpy.ndarray): Grayscale frame
+        """
+        if not self.faces:
+            self.metrics.increment("face_misses")
+            self.landmarks = None
+            self.points = None
+            return
+        with self.metrics.stage("landmarks"):
+            self.landmarks = self._predictor(frame, self.face)
+            self.points = self._landmarks_to_array(self.landmarks)
+
+    def _track(self, frame: numpy.ndarray):
+        """Finds the face and predicts its landmarks. While tracking, the face
+        box is predicted from the previous landmarks and the face detector only
+        runs every `redetect_interval` frames, when the landmarks moved more
+        than the tracking margin or when they look wrong, in which case the
+        face is detected again around its last position.
+
+        Arguments:
+            frame (numpy.ndarray): Grayscale frame
+        """
+        tracked = self.tracking and self._tracked_face is not None and self._tracked_frames < self.redetect_interval
+        if tracked:
+            self._tracked_frames += 1
+            self.faces = [self._tracked_face]
+        else:
+            self._tracked_frames = 0
+            self.faces = self._detect_faces(frame, self._tracked_face if self.tracking else None)
+        self._predict_landmarks(frame)
+
+        if not self.tracking:
+            return
+        if self.points is None:
+            self._tracked_face = None
+            return
+
+        hull = self._hull(self.points)
+        if tracked:
+            previous = self._tracked_hull
+            margin = self.tracking_margin * numpy.tile(previous[2:] - previous[:2], 2)
+            if (numpy.abs(hull - previous) > margin).any() or self._landmarks_lost(frame, hull):
+                self.metrics.increment("tracking_lost")
+                self._tracked_frames = 0
+                self.faces = self._detect_faces(frame, self._tracked_face)
+                self._predict_landmarks(frame)
+                if self.points is None:
+                    self._tracked_face = None
+                    return
+                hull = self._hull(self.points)
+                tracked = False
+
+        size = numpy.tile(hull[2:] - hull[:2], 2)
+        if not tracked:
+            face = self.face
+            self._hull_to_face = (numpy.array([face.left(), face.top(), face.right(), face.bottom()]) - hull) / size
+        left, top, right, bottom = (hull + self._hull_to_face * size).round().astype(int)
+        self._tracked_face = dlib.rectangle(int(left), int(top), int(right), int(bottom))
+        self._tracked_hull = hull
+
+    def _landmarks_lost(self, frame: numpy.ndarray, hull: numpy.ndarray) -> bool:
+        """Returns true if the landmarks predicted on the tracked box don't look
+        like a face anymore. The predictor always places its points in the box,
+        even once the face left it or is covered, but they then lose the
+        position relative to the box the face had when it was detected, or
+        the eyes collapse or leave the frame.
+
+        Arguments:
+            frame (numpy.ndarray): Grayscale frame
+            hull (numpy.ndarray): Bounding box of the landmarks
+        """
+        face = self.face
+        size = numpy.tile(hull[2:] - hull[:2], 2)
+        if (size <= 0).any():
+            return True
+        hull_to_face = (numpy.array([face.left(), face.top(), face.right(), face.bottom()]) - hull) / size
+        if (numpy.abs(hull_to_face - self._hull_to_face) > self.tracking_margin).any():
+            return True
+        height, width = frame.shape[:2]
+        for eye in (self.points[36:42], self.points[42:48]):
+            eye_size = eye.max(axis=0) - eye.min(axis=0)
+            if eye_size[0] < 2 or eye.max(axis=0)[0] < 0 or eye.max(axis=0)[1] < 0 \
+                    or eye.min(axis=0)[0] >= width or eye.min(axis=0)[1] >= height:
+                return True
+        return False
+
+    def _check_pupils(self):
+        """Detects the face again on the next frame when both eyes are open
+        but neither pupil was found on a tracked frame, the landmarks are
+        likely wrong"""
+        if not self.tracking or self._tracked_frames == 0 or self.points is None:
+            return
+        eyes = (self.eye_left, self.eye_right)
+        if any(eye.closed or eye.pupil_located for eye in eyes):
+            return
+        self.metrics.increment("tracking_lost")
+        self._tracked_frames = self.redetect_interval
+
+    def _analyze(self, timestamp: float):
+        """Detects the face, initialize Eye objects and publishes the snapshot
+
+        Arguments:
+            timestamp (float): Time at which the frame was captured
+        """
+        self.metrics.increment("frames")
+        with self.metrics.stage("convert"):
+            frame = cv2.cvtColor(self.frame, cv2.COLOR_BGR2GRAY)
+        if self.reuse_threshold is not None:
+            with self.metrics.stage("gate"):
+                static = self._is_static(frame)
+            if static:
+                self._reuse(timestamp)
+                return
+        self._track(frame)
+        arguments = (frame, self.points, self.calibration, self._buffers, self.metrics, self.pupil_engine, timestamp)
+        if self._eye_executor is not None and self.points is not None:
+            right = self._eye_executor.submit(self._eye, 1, self._blink_detectors[1], *arguments)
+            self.eye_left = self._eye(0, self._blink_detectors[0], *arguments)
+            self.eye_right = right.result()
+        else:
+            self.eye_left = self._eye(0, self._blink_detectors[0], *arguments)
+            self.eye_right = self._eye(1, self._blink_detectors[1], *arguments)
+        self._check_pupils()
+        self.nose = tuple(self.points[30].tolist()) if self.points is not None else None
+        if self.reuse_threshold is not None:
+            self._update_gate(frame)
+
+        self._publish(GazeSnapshot(
+            self.frame_id + 1, timestamp, self.frame, self.face, self.points, self.eye_left, self.eye_right, self.nose))
+
+    def _update_gate(self, frame: numpy.ndarray):
+        """Keeps the region around the eyes of the analyzed frame to compare the
+        next frames to"""
+        self._reused_in_row = 0
+        if self.points is None:
+            self._gate_box = self._gate_reference = None
+            return
+        eyes = self.points[36:48]
+        margin = 5
+        height, width = frame.shape[:2]
+        left, top = numpy.maximum(eyes.min(axis=0) - margin, 0)
+        right, bottom = numpy.minimum(eyes.max(axis=0) + margin, (width, height))
+        self._gate_box = (int(left), int(top), int(right), int(bottom))
+        self._gate_reference = frame[top:bottom, left:right].copy()
+
+    def _is_static(self, frame: numpy.ndarray) -> bool:
+        """Returns true if the eyes barely changed since the last analyzed frame
+
+        Arguments:
+            frame (numpy.ndarray): Grayscale frame
+        """
+        if self._gate_box is None or self._reused_in_row >= self.max_reuse:
+            return False
+        left, top, right, bottom = self._gate_box
+        region = frame[top:bottom, left:right]
+        if region.shape != self._gate_reference.shape or region.size == 0:
+            return False
+        difference = cv2.norm(region, self._gate_reference, cv2.NORM_L1) / region.size
+        return difference <= self.reuse_threshold
+
+    def _reuse(self, timestamp: float):
+        """Publishes the results of the last analyzed frame for the current one"""
+        self._reused_in_row += 1
+        self.reused_frames += 1
+        self.metrics.increment("frames_reused")
+        previous = self.snapshot
+        # Blink events happened on the analyzed frame only
+        eye_left = previous.eye_left._replace(blink_event=None)
+        eye_right = previous.eye_right._replace(blink_event=None)
+        self._publish(GazeSnapshot(
+            self.frame_id + 1, timestamp, self.frame, previous.face, previous.points, eye_left, eye_right,
+            previous.nose))
+
+    @staticmethod
+    def _eye(side, blink_detector, frame, points, calibration, buffers, metrics, pupil_engine, timestamp) -> Eye:
+        return Eye(frame, points, side, calibration, buffers, metrics, pupil_engine, blink_detector, timestamp)
+
+    def _publish(self, snapshot: GazeSnapshot):
+        """Makes the snapshot of a new frame available to the readers
+
+        Arguments:
+            snapshot (GazeSnapshot): Snapshot of the new frame
+        """
+        with self._published:
+            self.frame_id = snapshot.frame_id
+            self.snapshot = snapshot
+            self._published.notify_all()
+
+    def _finish(self):
+        """Wakes up the readers waiting for a snapshot, no more frames will come"""
+        with self._published:
+            self._finished = True
+            self._published.notify_all()
+
+    def wait_for_snapshot(
+            self,
+            after: typing.Optional[int] = None,
+            timeout: typing.Optional[float] = None) -> typing.Optional[GazeSnapshot]:
+        """Waits until a new frame is analyzed and returns its snapshot.
+
+        Arguments:
+            after (int): Frame id the snapshot must be newer than, defaults to
+                the last analyzed frame
+            timeout (float): Maximum number of seconds to wait, forever if None
+
+        Returns:
+            The newest snapshot, or None if the timeout expired or the
+            tracker stopped running
+        """
+        with self._published:
+            if after is None:
+                after = self.frame_id
+            self._published.wait_for(lambda: self.frame_id != after or self._finished, timeout)
+            if self.frame_id == after:
+                return None
+            return self.snapshot
+
+    def snapshots(self, timeout: typing.Optional[float] = None) -> typing.Iterator[GazeSnapshot]:
+        """Yields the snapshot of every new frame as soon as it is analyzed,
+        frames analyzed while the reader was busy are skipped.
+
+        Arguments:
+            timeout (float): Maximum number of seconds to wait for a frame
+                before stopping, forever if None
+        """
+        frame_id = self.frame_id
+        while True:
+            snapshot = self.wait_for_snapshot(frame_id, timeout)
+            if snapshot is None:
+                return
+            frame_id = snapshot.frame_id
+            yield snapshot
+
+    def refresh(self, frame: numpy.ndarray, timestamp: typing.Optional[float] = None):
         """Refreshes the frame and analyzes it.
 
         Arguments:
             frame (numpy.ndarray): The frame to analyze
+            timestamp (float): Time at which the frame was captured, as given
+                by time.monotonic(), defaults to now
         """
         self.frame = frame
-        self._analyze()
+        self._analyze(time.monotonic() if timestamp is None else timestamp)
 
     def run(self, webcam):
         """
-        Gets frame form webcam and calls refresh
-        :param webcam:
+        Reads frames from webcam on a capture thread and calls refresh with the
+        newest one, frames captured while the previous one was analyzed are dropped
+        :param webcam: Object whose read() method returns (success, frame)
         :return:
         """
-        while True:
-            _, frame = webcam.read()
-            self.refresh(frame)
+        self.capture = FrameCapture(webcam)
+        try:
+            with self.capture:
+                while True:
+                    captured = self.capture.read()
+                    if captured is None:
+                        break
+                    _, timestamp, frame = captured
+                    self.refresh(frame, timestamp)
+        finally:
+            self._finish()
 
     @property
     def face(self):
@@ -72,71 +459,24 @@ class GazeTracking(object):
 
     @property
     def pupils_located(self):
-        if self.eye_left and self.eye_right:
-            return self.eye_left.pupil_located and self.eye_right.pupil_located
+        return self.snapshot.pupils_located
 
     def is_right(self):
         """Returns true if the user is looking to the right"""
-        if self.pupils_located:
-            return (self.eye_left.horizontal_ratio() + self.eye_right.horizontal_ratio()) / 2 <= 0.4
+        return self.snapshot.is_right()
 
     def is_left(self):
         """Returns true if the user is looking to the left"""
-        if self.pupils_located:
-            return (self.eye_left.horizontal_ratio() + self.eye_right.horizontal_ratio()) / 2 >= 0.6
+        return self.snapshot.is_left()
 
     def is_center(self):
         """Returns true if the user is looking to the center"""
-        if self.pupils_located:
-            return self.is_right() is not True and self.is_left() is not True
+        return self.snapshot.is_center()
 
     def is_blinking(self):
         """Returns true if the user closes his eyes"""
-        if self.pupils_located:
-            blinking_ratio = (self.eye_left.blinking + self.eye_right.blinking) / 2
-            return blinking_ratio > 3.8
-
+        return self.snapshot.is_blinking()
 
     def annotated_frame(self):
         """Returns the main frame with pupils highlighted"""
-        frame = self.frame.copy()
-
-        red = (0, 0, 255)
-        green = (0, 255, 0)
-        blue = (255, 0, 0)
-
-        if self.face:
-            # All landmarks points
-            shape = face_utils.shape_to_np(self.landmarks)
-            for (x, y) in shape:
-                cv2.circle(frame, (x, y), 2, blue, -1)
-
-            # Face boundaries
-            # left = self.face.left()
-            # top = self.face.top()
-            # bottom = self.face.bottom()
-            # right = self.face.right()
-            # cv2.line(frame, (left, top), (right, top), red)
-            # cv2.line(frame, (right, top), (right, bottom), red)
-            # cv2.line(frame, (right, bottom), (left, bottom), red)
-            # cv2.line(frame, (left, bottom), (left, top), red)
-
-            # Eyes Circle
-            if self.eye_left.radius:
-                left_center = self.eye_left.eye_center
-                cv2.circle(frame, left_center, int(self.eye_left.radius), green)
-            if self.eye_right.radius:
-                right_center = self.eye_right.eye_center
-                cv2.circle(frame, right_center, int(self.eye_right.radius), green)
-
-            # Cross in eyes
-            if self.eye_left.pupil_located:
-                x_left, y_left = self.eye_left.pupil_center
-                cv2.line(frame, (x_left - 5, y_left), (x_left + 5, y_left), green)
-                cv2.line(frame, (x_left, y_left - 5), (x_left, y_left + 5), green)
-            if self.eye_right.pupil_located:
-                x_right, y_right = self.eye_right.pupil_center
-                cv2.line(frame, (x_right - 5, y_right), (x_right + 5, y_right), green)
-                cv2.line(frame, (x_right, y_right - 5), (x_right, y_right + 5), green)
-
-        return frame
+        return self.snapshot.annotated_frame()
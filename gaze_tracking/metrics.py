@@ -0,0 +1,186 @@
+import collections
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy
+
+
+class _StageTimer(object):
+    __slots__ = ("_metrics", "_stage", "_start")
+
+    def __init__(self, metrics, stage):
+        self._metrics = metrics
+        self._stage = stage
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+
+    def __exit__(self, *_):
+        self._metrics.observe(self._stage, time.perf_counter() - self._start)
+
+
+class Metrics(object):
+    """
+    This class measures the time spent in each stage of the analysis and
+    counts events like frames or detection misses.
+    Each stage keeps its last durations, to compute rolling percentiles, and a
+    cumulative histogram served in the Prometheus text format.
+    """
+
+    enabled = True
+
+    BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5)
+
+    def __init__(self, window: int = 300):
+        """
+        :param window: Number of durations kept per stage for the percentiles
+        """
+        self.window = window
+        self._lock = threading.Lock()
+        self._counters = collections.Counter()
+        self._durations = {}
+        self._buckets = {}
+        self._sums = collections.Counter()
+        self._counts = collections.Counter()
+
+    def stage(self, name: str):
+        """Returns a context manager measuring the time spent in it
+
+        Arguments:
+            name (str): Name of the stage
+        """
+        return _StageTimer(self, name)
+
+    def observe(self, name: str, seconds: float):
+        """Records a duration of a stage
+
+        Arguments:
+            name (str): Name of the stage
+            seconds (float): Time spent in the stage
+        """
+        with self._lock:
+            durations = self._durations.get(name)
+            if durations is None:
+                durations = self._durations[name] = collections.deque(maxlen=self.window)
+                self._buckets[name] = [0] * len(self.BUCKETS)
+            durations.append(seconds)
+            buckets = self._buckets[name]
+            for index, bound in enumerate(self.BUCKETS):
+                if seconds <= bound:
+                    buckets[index] += 1
+                    break
+            self._sums[name] += seconds
+            self._counts[name] += 1
+
+    def increment(self, name: str, value: int = 1):
+        """Increments a counter
+
+        Arguments:
+            name (str): Name of the counter
+            value (int): Amount added to the counter
+        """
+        with self._lock:
+            self._counters[name] += value
+
+    def summary(self) -> dict:
+        """Returns the counters, and for each stage its number of calls and
+        the mean and percentiles in milliseconds of its recent durations"""
+        with self._lock:
+            durations = {name: numpy.array(values) * 1000 for name, values in self._durations.items()}
+            counts = dict(self._counts)
+            counters = dict(self._counters)
+        stages = {}
+        for name, values in durations.items():
+            p50, p95, p99 = numpy.percentile(values, (50, 95, 99))
+            stages[name] = {
+                "count": counts[name],
+                "mean_ms": float(values.mean()),
+                "p50_ms": float(p50),
+                "p95_ms": float(p95),
+                "p99_ms": float(p99),
+            }
+        return {"stages": stages, "counters": counters}
+
+    def prometheus(self) -> str:
+        """Returns the counters and the stage histograms in the Prometheus text format"""
+        lines = []
+        with self._lock:
+            lines.append("# TYPE gaze_tracking_stage_seconds histogram")
+            for name in sorted(self._buckets):
+                cumulative = 0
+                for bound, count in zip(self.BUCKETS, self._buckets[name]):
+                    cumulative += count
+                    lines.append('gaze_tracking_stage_seconds_bucket{{stage="{}",le="{}"}} {}'.format(
+                        name, bound, cumulative))
+                lines.append('gaze_tracking_stage_seconds_bucket{{stage="{}",le="+Inf"}} {}'.format(
+                    name, self._counts[name]))
+                lines.append('gaze_tracking_stage_seconds_sum{{stage="{}"}} {}'.format(name, self._sums[name]))
+                lines.append('gaze_tracking_stage_seconds_count{{stage="{}"}} {}'.format(name, self._counts[name]))
+            for name in sorted(self._counters):
+                lines.append("# TYPE gaze_tracking_{}_total counter".format(name))
+                lines.append("gaze_tracking_{}_total {}".format(name, self._counters[name]))
+        return "\n".join(lines) + "\n"
+
+
+class _NullContext(object):
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *_):
+        pass
+
+
+class NullMetrics(object):
+    """
+    Metrics that measure nothing, used when instrumentation is disabled.
+    """
+
+    enabled = False
+
+    _context = _NullContext()
+
+    def stage(self, name):
+        return self._context
+
+    def observe(self, name, seconds):
+        pass
+
+    def increment(self, name, value=1):
+        pass
+
+
+NULL_METRICS = NullMetrics()
+
+
+def serve_metrics(metrics: Metrics, port: int = 9120, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Serves the metrics in the Prometheus text format on a background thread,
+    call shutdown() on the returned server to stop it
+
+    Arguments:
+        metrics (Metrics): Metrics to serve
+        port (int): Port to listen on
+        host (str): Address to listen on, only the local host by default
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = metrics.prometheus().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    thread = threading.Thread(target=server.serve_forever, name="ThreadMetrics", daemon=True)
+    thread.start()
+    return server
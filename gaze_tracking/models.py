@@ -0,0 +1,50 @@
+import os
+import threading
+
+import dlib
+
+PREDICTOR_PATH = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), "trained_models", "shape_predictor_68_face_landmarks.dat"))
+
+_lock = threading.Lock()
+_face_detector = None
+_predictor = None
+
+
+def face_detector():
+    """Returns dlib's HOG face detector, built on first use and shared by every
+    tracker of the process"""
+    global _face_detector
+    if _face_detector is None:
+        with _lock:
+            if _face_detector is None:
+                _face_detector = dlib.get_frontal_face_detector()
+    return _face_detector
+
+
+def landmarks_predictor():
+    """Returns the 68 facial landmarks predictor, loaded on first use and shared
+    by every tracker of the process, loading it takes about a second"""
+    global _predictor
+    if _predictor is None:
+        with _lock:
+            if _predictor is None:
+                _predictor = dlib.shape_predictor(PREDICTOR_PATH)
+    return _predictor
+
+
+def _warm_up():
+    face_detector()
+    try:
+        landmarks_predictor()
+    except RuntimeError:
+        # Missing model file, the error is raised again on first use
+        pass
+
+
+def warm_up() -> threading.Thread:
+    """Loads the models on a background thread, so they are ready by the time
+    the first frame is captured, and returns the thread"""
+    thread = threading.Thread(target=_warm_up, name="ThreadModels", daemon=True)
+    thread.start()
+    return thread
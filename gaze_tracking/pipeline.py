@@ -0,0 +1,264 @@
+import multiprocessing
+import queue
+import threading
+import typing
+from multiprocessing import shared_memory
+
+import cv2
+import dlib
+import numpy
+
+from .blink import BlinkDetector
+from .buffers import BufferPool
+from .calibration import Calibration
+from .capture import FrameCapture
+from .eye import Eye
+from .gaze_tracking import GazeTracking
+from .snapshot import EyeSnapshot, GazeSnapshot
+
+
+def _slot_views(shared: shared_memory.SharedMemory, shape: typing.Tuple[int, ...], slots: int):
+    """Returns the color and grayscale frames of every slot of the shared memory"""
+    height, width = shape[:2]
+    frame_size = height * width * 3
+    slot_size = height * width * 4
+    frames = [numpy.ndarray((height, width, 3), numpy.uint8, shared.buf, slot * slot_size) for slot in range(slots)]
+    grays = [numpy.ndarray((height, width), numpy.uint8, shared.buf, slot * slot_size + frame_size) for slot in range(slots)]
+    return frames, grays
+
+
+def _detection_worker(shared, shape, slots, options, tasks, eye_tasks, results):
+    """Converts the frames to grayscale, in place in their slot, finds the face
+    and its landmarks and hands them to the eye workers. The worker gets every
+    nth frame of the stream, n being the number of detection workers, so its
+    face tracking follows the face over those frames only"""
+    frames, grays = _slot_views(shared, shape, slots)
+    tracker = GazeTracking(**options)
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        frame_id, slot, timestamp = task
+        cv2.cvtColor(frames[slot], cv2.COLOR_BGR2GRAY, dst=grays[slot])
+        tracker._track(grays[slot])
+        face = tracker.face
+        if face is not None:
+            face = (face.left(), face.top(), face.right(), face.bottom())
+        results.put((frame_id, "face", (face, tracker.points)))
+        for eye_queue in eye_tasks:
+            eye_queue.put((frame_id, slot, timestamp, tracker.points))
+
+
+def _eye_worker(shared, shape, slots, side, options, tasks, results):
+    """Isolates one eye and locates its pupil, each side has its own worker
+    so that its calibration and blink detector see every frame"""
+    _, grays = _slot_views(shared, shape, slots)
+    calibration = Calibration(options["preprocessing"])
+    blink_detector = BlinkDetector() if options["blink_detection"] else None
+    buffers = BufferPool()
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        frame_id, slot, timestamp, points = task
+        eye = Eye(grays[slot], points, side, calibration, buffers, pupil_engine=options["pupil_engine"],
+                  blink_detector=blink_detector, timestamp=timestamp)
+        results.put((frame_id, side, EyeSnapshot(eye)))
+
+
+class AnalysisPipeline(object):
+    """
+    This class analyzes frames with several processes: face detection and
+    landmarks are spread over a pool of workers and each eye is analyzed by its
+    own worker. Frames are shared through slots of a shared memory block
+    instead of being pickled, and the snapshots are published on the tracker
+    in frame order.
+
+    Frames are dealt to the detection workers in turn, so with n workers each
+    one tracks the face over every nth frame: the tracking margin has to allow
+    for the motion over n frames, and the face is detected again every
+    `redetect_interval` frames of a worker, every n * `redetect_interval`
+    frames of the stream.
+    """
+
+    # Seconds between two checks that the workers are still alive while
+    # waiting for a free slot
+    POLL_INTERVAL = 0.5
+
+    def __init__(self, tracker: GazeTracking, detection_workers: int = 4, slots: typing.Optional[int] = None):
+        """
+        :param tracker: Tracker the snapshots are published on, its face
+            tracking and detection options are used by the workers
+        :param detection_workers: Number of processes detecting the faces
+        :param slots: Number of frames being analyzed at the same time
+        """
+        self.tracker = tracker
+        self.detection_workers = detection_workers
+        self.slots = slots or 2 * detection_workers
+        self.capture: typing.Optional[FrameCapture] = None
+
+        self._shared = None
+        self._frames = None
+        self._processes = []
+        self._free_slots = queue.Queue()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._collector = None
+
+    def _start(self, shape):
+        """Allocates the shared memory and starts the workers
+
+        Arguments:
+            shape (tuple): Shape of the color frames
+        """
+        height, width = shape[:2]
+        self._shared = shared_memory.SharedMemory(create=True, size=self.slots * height * width * 4)
+        self._frames, _ = _slot_views(self._shared, shape, self.slots)
+        for slot in range(self.slots):
+            self._free_slots.put(slot)
+
+        options = dict(
+            tracking=self.tracker.tracking,
+            redetect_interval=self.tracker.redetect_interval,
+            tracking_margin=self.tracker.tracking_margin,
+            detection_scale=self.tracker.detection_scale,
+        )
+        eye_options = dict(
+            pupil_engine=self.tracker.pupil_engine,
+            preprocessing=self.tracker.preprocessing,
+            blink_detection=self.tracker.blink_detection,
+        )
+        # One queue per detection worker, so each one sees frames in order
+        self._detections = [multiprocessing.Queue() for _ in range(self.detection_workers)]
+        self._eyes = [multiprocessing.Queue(), multiprocessing.Queue()]
+        self._results = multiprocessing.Queue()
+        for detections in self._detections:
+            self._processes.append(multiprocessing.Process(
+                target=_detection_worker,
+                args=(self._shared, shape, self.slots, options, detections, self._eyes, self._results),
+                daemon=True))
+        for side in (0, 1):
+            self._processes.append(multiprocessing.Process(
+                target=_eye_worker,
+                args=(self._shared, shape, self.slots, side, eye_options, self._eyes[side], self._results),
+                daemon=True))
+        for process in self._processes:
+            process.start()
+
+        self._collector = threading.Thread(target=self._collect, name="ThreadPipelineCollector", daemon=True)
+        self._collector.start()
+
+    def _free_slot(self) -> int:
+        """Waits for a free slot, raises RuntimeError if a worker died as its
+        slots would never be freed"""
+        while True:
+            try:
+                return self._free_slots.get(timeout=self.POLL_INTERVAL)
+            except queue.Empty:
+                for process in self._processes:
+                    if not process.is_alive():
+                        raise RuntimeError("Pipeline worker {} died with exit code {}".format(
+                            process.name, process.exitcode))
+
+    def _stop(self):
+        """Waits for the frames being analyzed, then stops the workers and
+        releases the shared memory"""
+        for _ in range(self.slots):
+            self._free_slot()
+        self._release()
+
+    def _release(self, terminate: bool = False):
+        """Stops the workers, or kills them if terminate is set, and releases
+        the shared memory"""
+        if terminate:
+            for process in self._processes:
+                process.terminate()
+        else:
+            for detections in self._detections:
+                detections.put(None)
+            for eye_queue in self._eyes:
+                eye_queue.put(None)
+        for process in self._processes:
+            process.join()
+        self._results.put(None)
+        self._collector.join()
+
+        self._frames = None
+        self._shared.close()
+        self._shared.unlink()
+        self._shared = None
+        self._processes = []
+
+    def _collect(self):
+        """Gathers the results of the workers and publishes complete frames in order"""
+        parts = {}
+        complete = {}
+        next_id = 1
+        while True:
+            result = self._results.get()
+            if result is None:
+                break
+            frame_id, part, value = result
+            frame_parts = parts.setdefault(frame_id, {})
+            frame_parts[part] = value
+            if len(frame_parts) < 3:
+                continue
+
+            del parts[frame_id]
+            with self._lock:
+                slot, timestamp, frame = self._pending.pop(frame_id)
+            self._free_slots.put(slot)
+            complete[frame_id] = (timestamp, frame, frame_parts)
+
+            while next_id in complete:
+                timestamp, frame, frame_parts = complete.pop(next_id)
+                face, points = frame_parts["face"]
+                if face is not None:
+                    face = dlib.rectangle(*face)
+                nose = tuple(points[30].tolist()) if points is not None else None
+                self.tracker._publish(GazeSnapshot(
+                    next_id, timestamp, frame, face, points, frame_parts[0], frame_parts[1], nose))
+                next_id += 1
+
+    def run(self, webcam):
+        """
+        Reads frames from webcam and analyzes them with the workers until
+        webcam has no more frames
+        :param webcam: Object whose read() method returns (success, frame)
+        :return:
+        """
+        self.capture = FrameCapture(webcam)
+        try:
+            self._produce()
+        except BaseException:
+            # A worker died or the source failed, the other workers are killed
+            if self._shared is not None:
+                self._release(terminate=True)
+            raise
+        finally:
+            self.tracker._finish()
+
+    def _produce(self):
+        """Copies the captured frames into free slots and queues them"""
+        frame_id = 0
+        with self.capture:
+            while True:
+                slot = self._free_slot() if self._shared is not None else None
+                captured = self.capture.read()
+                if captured is None:
+                    if slot is not None:
+                        self._free_slots.put(slot)
+                    break
+                _, timestamp, frame = captured
+                if self._shared is None:
+                    self._start(frame.shape)
+                    slot = self._free_slot()
+
+                frame_id += 1
+                numpy.copyto(self._frames[slot], frame)
+                with self._lock:
+                    self._pending[frame_id] = (slot, timestamp, frame)
+                self._detections[(frame_id - 1) % self.detection_workers].put((frame_id, slot, timestamp))
+
+        if self._shared is not None:
+            self._stop()
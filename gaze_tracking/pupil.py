@@ -2,34 +2,99 @@ import numpy as np
 import cv2
 
 
+# Eroding once with a 7x7 kernel gives the same frame as three erosions with
+# a 3x3 kernel, the kernel is built only once
+_ERODE_KERNEL = np.ones((7, 7), np.uint8)
+
+
+def _quality(eye_frame):
+    return cv2.erode(cv2.bilateralFilter(eye_frame, 10, 15, 15), _ERODE_KERNEL)
+
+
+def _bilateral(eye_frame):
+    return cv2.erode(cv2.bilateralFilter(eye_frame, 5, 15, 15), _ERODE_KERNEL)
+
+
+def _gaussian(eye_frame):
+    return cv2.erode(cv2.GaussianBlur(eye_frame, (5, 5), 0), _ERODE_KERNEL)
+
+
+def _median(eye_frame):
+    return cv2.erode(cv2.medianBlur(eye_frame, 3), _ERODE_KERNEL)
+
+
+def _erode(eye_frame):
+    return cv2.erode(eye_frame, _ERODE_KERNEL)
+
+
 class Pupil(object):
     """
     This class detects the iris of an eye and estimates
     the position of the pupil
     """
 
-    def __init__(self, eye_frame, threshold):
+    ENGINES = ("contours", "components")
+
+    # Smoothing applied before the binarization, from the slowest to the fastest
+    PREPROCESSING = {
+        "quality": _quality,
+        "bilateral": _bilateral,
+        "gaussian": _gaussian,
+        "median": _median,
+        "erode": _erode,
+    }
+
+    def __init__(self, eye_frame, threshold, engine="contours", preprocessing="quality"):
+        """
+        :param eye_frame: Frame containing an eye and nothing else
+        :param threshold: Threshold value used to binarize the eye frame
+        :param engine: "contours" to take the centroid of the second largest
+            contour, as integers, "components" to take the sub-pixel centroid
+            of the largest dark connected component
+        :param preprocessing: Name of the profile of PREPROCESSING smoothing
+            the frame before it is binarized
+        """
+        if engine not in self.ENGINES:
+            raise ValueError("Unknown pupil engine {}, expected one of {}".format(engine, self.ENGINES))
+        if preprocessing not in self.PREPROCESSING:
+            raise ValueError("Unknown preprocessing {}, expected one of {}".format(
+                preprocessing, tuple(self.PREPROCESSING)))
         self.iris_frame = None
         self.threshold = threshold
+        self.engine = engine
+        self.preprocessing = preprocessing
         self.x = None
         self.y = None
 
         self.detect_iris(eye_frame)
 
     @staticmethod
-    def image_processing(eye_frame, threshold):
+    def filter(eye_frame, preprocessing="quality"):
+        """Smooths the eye frame before it is binarized, this doesn't depend
+        on the threshold so it can be shared by several binarizations
+
+        Arguments:
+            eye_frame (numpy.ndarray): Frame containing an eye and nothing else
+            preprocessing (str): Name of the profile of PREPROCESSING to apply
+
+        Returns:
+            The filtered frame
+        """
+        return Pupil.PREPROCESSING[preprocessing](eye_frame)
+
+    @staticmethod
+    def image_processing(eye_frame, threshold, preprocessing="quality"):
         """Performs operations on the eye frame to isolate the iris
 
         Arguments:
             eye_frame (numpy.ndarray): Frame containing an eye and nothing else
             threshold (int): Threshold value used to binarize the eye frame
+            preprocessing (str): Name of the profile of PREPROCESSING to apply
 
         Returns:
             A frame with a single element representing the iris
         """
-        kernel = np.ones((3, 3), np.uint8)
-        new_frame = cv2.bilateralFilter(eye_frame, 10, 15, 15)
-        new_frame = cv2.erode(new_frame, kernel, iterations=3)
+        new_frame = Pupil.filter(eye_frame, preprocessing)
         new_frame = cv2.threshold(new_frame, threshold, 255, cv2.THRESH_BINARY)[1]
 
         return new_frame
@@ -41,14 +106,45 @@ class Pupil(object):
         Arguments:
             eye_frame (numpy.ndarray): Frame containing an eye and nothing else
         """
-        self.iris_frame = self.image_processing(eye_frame, self.threshold)
+        self.iris_frame = self.image_processing(eye_frame, self.threshold, self.preprocessing)
 
-        contours, _ = cv2.findContours(self.iris_frame, cv2.RETR_TREE, cv2.CHAIN_APPROX_NONE)[-2:]
+        if self.engine == "components":
+            center = self.locate_components(self.iris_frame)
+        else:
+            center = self.locate_contours(self.iris_frame)
+        if center is not None:
+            self.x, self.y = center
+
+    @staticmethod
+    def locate_contours(iris_frame):
+        """Returns the integer centroid of the second largest contour of the
+        binarized frame, or None
+
+        Arguments:
+            iris_frame (numpy.ndarray): Binarized eye frame
+        """
+        contours, _ = cv2.findContours(iris_frame, cv2.RETR_TREE, cv2.CHAIN_APPROX_NONE)[-2:]
         contours = sorted(contours, key=cv2.contourArea)
 
         try:
             moments = cv2.moments(contours[-2])
-            self.x = int(moments['m10'] / moments['m00'])
-            self.y = int(moments['m01'] / moments['m00'])
+            return int(moments['m10'] / moments['m00']), int(moments['m01'] / moments['m00'])
         except (IndexError, ZeroDivisionError):
-            pass
+            return None
+
+    @staticmethod
+    def locate_components(iris_frame):
+        """Returns the sub-pixel centroid of the largest dark connected
+        component of the binarized frame, found in a single pass, or None
+
+        Arguments:
+            iris_frame (numpy.ndarray): Binarized eye frame
+        """
+        # The iris is dark on a white background, it has to be white to be labeled
+        dark = cv2.bitwise_not(iris_frame)
+        count, _, stats, centroids = cv2.connectedComponentsWithStats(dark, connectivity=8)
+        if count < 2:
+            return None
+        # Label 0 is the background
+        label = 1 + int(np.argmax(stats[1:, cv2.CC_STAT_AREA]))
+        return float(centroids[label, 0]), float(centroids[label, 1])
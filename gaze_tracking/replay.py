@@ -0,0 +1,152 @@
+import os
+import time
+import typing
+import warnings
+
+import cv2
+import numpy
+
+from .gaze_tracking import GazeTracking
+
+
+class VideoSource(object):
+    """
+    Reads the frames of a video file, like a webcam would.
+    """
+
+    def __init__(self, path: str, realtime: bool = False):
+        """
+        :param path: Path of the video file
+        :param realtime: Return the frames at the rate they were recorded at
+            instead of as fast as possible
+        """
+        self._capture = cv2.VideoCapture(path)
+        if not self._capture.isOpened():
+            raise IOError("Cannot open video {}".format(path))
+        self.fps = self._capture.get(cv2.CAP_PROP_FPS) or None
+        # As found in the container, can be approximate
+        self.expected_frames = int(self._capture.get(cv2.CAP_PROP_FRAME_COUNT)) or None
+        self.realtime = realtime and self.fps is not None
+        self._start = None
+        self._count = 0
+
+    def read(self):
+        success, frame = self._capture.read()
+        if success and self.realtime:
+            self._start = self._start or time.monotonic()
+            delay = self._start + self._count / self.fps - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        self._count += 1
+        return success, frame
+
+
+class FrameDirectorySource(object):
+    """
+    Reads the images of a directory, sorted by name, like a webcam would.
+    The files that can't be read as images are skipped with a warning and
+    listed in skipped.
+    """
+
+    EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+    def __init__(self, path: str, fps: typing.Optional[float] = None):
+        """
+        :param path: Directory containing the frames
+        :param fps: Rate to return the frames at, as fast as possible if None
+        """
+        self.paths = sorted(
+            os.path.join(path, name) for name in os.listdir(path) if name.lower().endswith(self.EXTENSIONS))
+        self.fps = fps
+        self.expected_frames = len(self.paths)
+        self.skipped = []
+        self._start = None
+        self._count = 0
+
+    def read(self):
+        while self._count < len(self.paths):
+            path = self.paths[self._count]
+            frame = cv2.imread(path)
+            self._count += 1
+            if frame is None:
+                warnings.warn("Skipping unreadable frame {}".format(path))
+                self.skipped.append(path)
+                continue
+            if self.fps:
+                self._start = self._start or time.monotonic()
+                delay = self._start + (self._count - 1) / self.fps - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+            return True, frame
+        return False, None
+
+
+def open_source(path: str, realtime: bool = False, fps: float = 30):
+    """Returns a source reading the video file or the directory of frames at path
+
+    Arguments:
+        path (str): Video file or directory of frames
+        realtime (bool): Return the frames at their recorded rate
+        fps (float): Rate of a directory of frames, when realtime
+    """
+    if os.path.isdir(path):
+        return FrameDirectorySource(path, fps if realtime else None)
+    return VideoSource(path, realtime)
+
+
+def replay(tracker: GazeTracking, source, max_frames: typing.Optional[int] = None) -> dict:
+    """Analyzes every frame of the source with tracker.refresh and returns
+    statistics about the run
+
+    Arguments:
+        tracker (GazeTracking): Tracker analyzing the frames
+        source: Object whose read() method returns (success, frame)
+        max_frames (int): Stop after this number of frames
+
+    Returns:
+        A dictionary with the number of frames, the number the source was
+        expected to give and the number it skipped when known, the
+        throughput in frames per second, the percentiles of the time spent
+        analyzing a frame in milliseconds, the rates of frames where a face
+        and both pupils were found, and the rate of frames whose analysis was
+        reused
+    """
+    reused = tracker.reused_frames
+    latencies = []
+    faces = 0
+    pupils = 0
+    start = time.perf_counter()
+    while max_frames is None or len(latencies) < max_frames:
+        success, frame = source.read()
+        if not success:
+            break
+        frame_start = time.perf_counter()
+        tracker.refresh(frame)
+        latencies.append(time.perf_counter() - frame_start)
+        snapshot = tracker.snapshot
+        faces += snapshot.face is not None
+        pupils += bool(snapshot.pupils_located)
+    duration = time.perf_counter() - start
+
+    count = len(latencies)
+    latencies = numpy.array(latencies) * 1000
+    expected = getattr(source, "expected_frames", None)
+    if expected is not None and max_frames is not None:
+        expected = min(expected, max_frames)
+    skipped = getattr(source, "skipped", None)
+    return {
+        "frames": count,
+        "expected_frames": expected,
+        "skipped_frames": len(skipped) if skipped is not None else None,
+        "duration_s": duration,
+        "fps": count / duration if duration else 0.0,
+        "latency_ms": {
+            "mean": float(latencies.mean()) if count else None,
+            "p50": float(numpy.percentile(latencies, 50)) if count else None,
+            "p95": float(numpy.percentile(latencies, 95)) if count else None,
+            "p99": float(numpy.percentile(latencies, 99)) if count else None,
+        },
+        "face_rate": faces / count if count else 0.0,
+        "pupils_rate": pupils / count if count else 0.0,
+        "reuse_rate": (tracker.reused_frames - reused) / count if count else 0.0,
+    }
@@ -0,0 +1,165 @@
+import typing
+
+import cv2
+import numpy
+
+from .eye import Eye
+
+
+class _Immutable(object):
+    __slots__ = ()
+
+    def _set_values(self, values):
+        for name, value in zip(self.__slots__, values):
+            object.__setattr__(self, name, value)
+
+    def _replace(self, **values):
+        """Returns a copy with some of the values replaced"""
+        instance = type(self).__new__(type(self))
+        instance._set_values(tuple(values.get(name, getattr(self, name)) for name in self.__slots__))
+        return instance
+
+    def __reduce__(self):
+        return _rebuild, (type(self), tuple(getattr(self, name) for name in self.__slots__))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("{} is immutable".format(type(self).__name__))
+
+    def __delattr__(self, name):
+        raise AttributeError("{} is immutable".format(type(self).__name__))
+
+
+def _rebuild(cls, values):
+    instance = cls.__new__(cls)
+    instance._set_values(values)
+    return instance
+
+
+class EyeSnapshot(_Immutable):
+    """
+    Values derived from an Eye, computed once when the snapshot is built.
+    """
+
+    __slots__ = (
+        "eye_center", "radius", "pupil_center", "horizontal_ratio", "vertical_ratio", "blinking", "closed",
+        "blink_event")
+
+    def __init__(self, eye: typing.Optional[Eye]):
+        values = (None,) * 8
+        if eye is not None:
+            values = (
+                eye.eye_center,
+                eye.radius,
+                eye.pupil_center,
+                eye.horizontal_ratio(),
+                eye.vertical_ratio(),
+                eye.blinking,
+                eye.closed,
+                eye.blink_event,
+            )
+        self._set_values(values)
+
+    @property
+    def pupil_located(self):
+        """Check that the pupil has been located"""
+        return self.pupil_center is not None
+
+
+class GazeSnapshot(_Immutable):
+    """
+    This class holds everything GazeTracking found on one frame.
+    A new snapshot is built for every frame and published by replacing the
+    previous one, so readers on other threads always see values that belong
+    to the same frame.
+    """
+
+    __slots__ = ("frame_id", "timestamp", "frame", "face", "points", "eye_left", "eye_right", "nose")
+
+    def __init__(
+            self,
+            frame_id: int,
+            timestamp: typing.Optional[float],
+            frame: typing.Optional[numpy.ndarray],
+            face,
+            points: typing.Optional[numpy.ndarray],
+            eye_left: typing.Union[Eye, EyeSnapshot, None],
+            eye_right: typing.Union[Eye, EyeSnapshot, None],
+            nose: typing.Optional[typing.Tuple]):
+        """
+        :param frame_id: Number of the frame, increasing with every refresh
+        :param timestamp: Time at which the frame was captured
+        :param frame: The analyzed frame
+        :param face: Face the landmarks were predicted on
+        :param points: (68, 2) array of the facial landmarks
+        :param eye_left: Left eye of the frame, or its snapshot
+        :param eye_right: Right eye of the frame, or its snapshot
+        :param nose: Coordinates of the tip of the nose
+        """
+        if not isinstance(eye_left, EyeSnapshot):
+            eye_left = EyeSnapshot(eye_left)
+        if not isinstance(eye_right, EyeSnapshot):
+            eye_right = EyeSnapshot(eye_right)
+        self._set_values((frame_id, timestamp, frame, face, points, eye_left, eye_right, nose))
+
+    @property
+    def pupils_located(self):
+        return self.eye_left.pupil_located and self.eye_right.pupil_located
+
+    def is_right(self):
+        """Returns true if the user is looking to the right"""
+        if self.pupils_located:
+            return (self.eye_left.horizontal_ratio + self.eye_right.horizontal_ratio) / 2 <= 0.4
+
+    def is_left(self):
+        """Returns true if the user is looking to the left"""
+        if self.pupils_located:
+            return (self.eye_left.horizontal_ratio + self.eye_right.horizontal_ratio) / 2 >= 0.6
+
+    def is_center(self):
+        """Returns true if the user is looking to the center"""
+        if self.pupils_located:
+            return self.is_right() is not True and self.is_left() is not True
+
+    def is_blinking(self):
+        """Returns true if the user closes his eyes"""
+        if self.eye_left.closed is not None and self.eye_right.closed is not None:
+            return self.eye_left.closed and self.eye_right.closed
+        if self.pupils_located:
+            blinking_ratio = (self.eye_left.blinking + self.eye_right.blinking) / 2
+            return blinking_ratio > 3.8
+
+    @property
+    def blink_event(self):
+        """Returns the event the blink detector reported on this frame for
+        either eye: "closed", "blink", "opened", or None"""
+        events = (self.eye_left.blink_event, self.eye_right.blink_event)
+        for event in ("closed", "blink", "opened"):
+            if event in events:
+                return event
+        return None
+
+    def annotated_frame(self):
+        """Returns the frame with pupils highlighted"""
+        frame = self.frame.copy()
+
+        green = (0, 255, 0)
+        blue = (255, 0, 0)
+
+        if self.face:
+            # All landmarks points
+            for (x, y) in self.points.tolist():
+                cv2.circle(frame, (x, y), 2, blue, -1)
+
+            # Eyes Circle
+            for eye in (self.eye_left, self.eye_right):
+                if eye.radius:
+                    cv2.circle(frame, eye.eye_center, int(eye.radius), green)
+
+            # Cross in eyes
+            for eye in (self.eye_left, self.eye_right):
+                if eye.pupil_located:
+                    x, y = (int(value) for value in eye.pupil_center)
+                    cv2.line(frame, (x - 5, y), (x + 5, y), green)
+                    cv2.line(frame, (x, y - 5), (x, y + 5), green)
+
+        return frame
@@ -2,24 +2,28 @@
 # from PyQt5.QtGui import QPainter, QPen
 # from PyQt5.QtWidgets import QMainWindow, QApplication
 # from PyQt5.QtCore import Qt
+import subprocess
 import sys
 from threading import Thread
 
 import cv2
-import pyautogui
-from PyQt5.QtWidgets import QApplication
 
 from gaze_tracking import GazeTracking
 from .calibration import Calibration
 from .annotated_frame import  AnnotatedFrame
+from .focus import FocusEngine
 from .mouse_control import MouseControl
 
 def main():
+    # Imported here as importing it needs a display
+    import pyautogui
+
+    # Start GazeTracking first, its models load while the webcam opens
+    gaze = GazeTracking()
+
     # Initialize webcam
     webcam = cv2.VideoCapture(0)
 
-    # Start GazeTracking
-    gaze = GazeTracking()
     thread_gaze = Thread(target=gaze.run, args=(webcam,))
     thread_gaze.name = "ThreadGaze"
     #thread_gaze.daemon = True
@@ -38,8 +42,14 @@ def main():
     #thread_annotated.daemon = True
     thread_annotated.start()
 
+    # Focus the window looked at when running under i3
+    try:
+        focus_engine = FocusEngine()
+    except (OSError, subprocess.CalledProcessError):
+        focus_engine = None
+
     # Initialize mouse control
-    mouse_control = MouseControl(gaze, calibration)
+    mouse_control = MouseControl(gaze, calibration, focus_engine=focus_engine)
     mouse_control.run()
 
 
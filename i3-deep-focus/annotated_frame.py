@@ -11,27 +11,24 @@ class AnnotatedFrame:
         self.gaze = gaze
 
     def show(self):
-        while True:
-            try:
-                frame = self.gaze.annotated_frame()
-            except AttributeError:
-                continue
+        for snapshot in self.gaze.snapshots():
+            frame = snapshot.annotated_frame()
 
             text = ""
 
-            if self.gaze.is_blinking():
+            if snapshot.is_blinking():
                 text = "Blinking"
-            elif self.gaze.is_right():
+            elif snapshot.is_right():
                 text = "Looking right"
-            elif self.gaze.is_left():
+            elif snapshot.is_left():
                 text = "Looking left"
-            elif self.gaze.is_center():
+            elif snapshot.is_center():
                 text = "Looking center"
 
             cv2.putText(frame, text, (10, 50), cv2.FONT_HERSHEY_DUPLEX, 1.6, (147, 58, 31), 2)
 
-            left_pupil = self.gaze.eye_left.pupil_center
-            right_pupil = self.gaze.eye_right.pupil_center
+            left_pupil = snapshot.eye_left.pupil_center
+            right_pupil = snapshot.eye_right.pupil_center
             cv2.putText(frame, "Left pupil:  " + str(left_pupil), (10, 80), cv2.FONT_HERSHEY_DUPLEX, 0.9, (147, 58, 31), 1)
             cv2.putText(frame, "Right pupil: " + str(right_pupil), (10, 115), cv2.FONT_HERSHEY_DUPLEX, 0.9, (147, 58, 31), 1)
 
@@ -1,22 +1,52 @@
+import os
 import time
 
-import pyautogui
+import numpy as np
+
+from .gaze import Gaze
 
 class Calibration:
-    def __init__(self, gaze, display_size):
+    FEATURES = 14
+    DUMMY_CALIBRATION_PATH = os.path.join(os.path.dirname(__file__), "data", "dummy_calibration.npz")
+
+    def __init__(self, gaze, display_size, path = None):
+        """
+        :param gaze: GazeTracking recording the calibration samples
+        :param display_size: Size of the screen
+        :param path: Calibration data saved with save, the dummy calibration
+            data is used if None
+        """
         self.gaze = gaze
         self.size = display_size
-        self.calibration_data = []
+        # Samples of every calibration step one after the other, the screen
+        # position of each step and its number of samples
+        self.samples = np.empty((0, self.FEATURES), dtype=np.float64)
+        self.targets = np.empty((0, 2), dtype=np.int32)
+        self.counts = np.empty(0, dtype=np.int32)
+        # Called with the samples and targets of every new step
+        self.step_listeners = []
+        # Called when a new calibration discards the previous samples
+        self.reset_listeners = []
         #self.calibrate()
-        self.load_dummy_calibration_data()
+        if path:
+            self.load(path)
+        else:
+            self.load_dummy_calibration_data()
 
-    def calibrate(self, failed = False):
+    def calibrate(self, failed = False, path = None):
+        # Imported here so that the calibration data can be used without a display
+        import pyautogui
         answer = pyautogui.confirm(
                 ('Calibration Failed, please start again\n' if failed else 'Start Calibration?\n') +
                 'Mouse will move to the center, then top-left corner and then circle the screen clockwise '
                 'stopping for 5 seconds in each of the 9 positions, focus on it with your gaze until '
                 'it returns to the center of the screen')
         if answer == "OK":
+            self.samples = self.samples[:0]
+            self.targets = self.targets[:0]
+            self.counts = self.counts[:0]
+            for listener in self.reset_listeners:
+                listener()
             self.record_position(   int(self.size[0]/2) ,int(self.size[1]/2) )
             self.record_position(   10             ,10             )
             self.record_position(   int(self.size[0]/2) ,10             )
@@ -27,46 +57,59 @@ class Calibration:
             self.record_position(   10             ,self.size[1] - 10   )
             self.record_position(   10             ,int(self.size[1]/2) )
             pyautogui.moveTo(int(self.size[0]/2) ,int(self.size[1]/2))
-            print(self.calibration_data)
-            # DeepFocusNALU(self.calibration_data)
+            print("Recorded {} samples for {} positions".format(len(self.samples), len(self.targets)))
+            if path:
+                self.save(path)
+            # DeepFocusNALU(self)
 
     def record_position(self, x, y):
+        import pyautogui
         pyautogui.moveTo(x, y)
-        start_time = time.process_time()
-        seconds = 5
+        end_time = time.monotonic() + 5
         calibration_step = []
+        frame_id = self.gaze.frame_id
         while True:
-            time.sleep(0.1)
-            current_time = time.process_time()
-            elapsed_time = current_time - start_time
-            try:
-                points = [
-                    self.gaze.eye_left.eye_center[0],
-                    self.gaze.eye_left.eye_center[1],
-                    self.gaze.eye_right.eye_center[0],
-                    self.gaze.eye_right.eye_center[1],
-                    self.gaze.eye_left.pupil_center[0],
-                    self.gaze.eye_left.pupil_center[1],
-                    self.gaze.eye_right.pupil_center[0],
-                    self.gaze.eye_right.pupil_center[1],
-                    self.gaze.eye_left.horizontal_ratio(),
-                    self.gaze.eye_right.horizontal_ratio(),
-                    self.gaze.eye_left.vertical_ratio(),
-                    self.gaze.eye_right.vertical_ratio(),
-                    self.gaze.nose[0],
-                    self.gaze.nose[1]
-                ]
-                if all(points):
-                    calibration_step.append(points)
-            except TypeError:
-                pass
-            if elapsed_time > seconds:
+            remaining_time = end_time - time.monotonic()
+            if remaining_time <= 0:
                 break
+            snapshot = self.gaze.wait_for_snapshot(frame_id, remaining_time)
+            if snapshot is None:
+                break
+            frame_id = snapshot.frame_id
+            gaze = Gaze(snapshot)
+            if gaze:
+                calibration_step.append(gaze.__list__())
         if not calibration_step:
             self.calibrate(True)
             return
-        self.calibration_data.append( [ calibration_step, [x, y] ] )
+        self.add_step(calibration_step, x, y)
+
+
+    def add_step(self, samples, x, y):
+        """Adds the samples recorded while looking at the screen position (x, y)"""
+        samples = np.asarray(samples, dtype=np.float64).reshape(-1, self.FEATURES)
+        self.samples = np.concatenate((self.samples, samples))
+        self.targets = np.concatenate((self.targets, [[x, y]])).astype(np.int32)
+        self.counts = np.append(self.counts, len(samples)).astype(np.int32)
+        for listener in self.step_listeners:
+            listener(samples, np.repeat([[x, y]], len(samples), axis=0))
+
+    def training_data(self):
+        """Returns the samples and, for each of them, the screen position that
+        was looked at, as two contiguous (samples, 14) and (samples, 2) arrays"""
+        return self.samples, np.repeat(self.targets, self.counts, axis=0)
+
+    def save(self, path):
+        """Saves the calibration data to an .npz file"""
+        np.savez_compressed(path, samples=self.samples, targets=self.targets, counts=self.counts)
 
+    def load(self, path):
+        """Loads calibration data saved with save"""
+        with np.load(path, allow_pickle=False) as data:
+            samples, targets, counts = data["samples"], data["targets"], data["counts"]
+        if len(targets) != len(counts) or counts.sum() != len(samples):
+            raise ValueError("Inconsistent calibration data in {}".format(path))
+        self.samples, self.targets, self.counts = samples, targets, counts
 
     def load_dummy_calibration_data(self):
-        self.calibration_data = [[[[382, 146, 467, 148, 384, 145, 468, 148, 0.5698512542604046, 0.5198624075829533, 0.5017331074496789, 0.5086064839889041, 429, 172], [383, 146, 468, 148, 383, 145, 469, 147, 0.5034317492677621, 0.5255719807126259, 0.4359484148476321, 0.42857142857142855, 430, 172], [383, 146, 468, 147, 383, 145, 469, 147, 0.5023670927728233, 0.519771294194971, 0.46948290829745, 0.5041058966437999, 429, 172], [381, 146, 467, 147, 383, 145, 468, 147, 0.5698512542604046, 0.5255719807126259, 0.5287587340333663, 0.5, 428, 172], [380, 146, 466, 147, 380, 146, 467, 147, 0.5023670927728233, 0.5255719807126259, 0.5055694567754828, 0.5, 427, 173], [379, 147, 465, 149, 381, 146, 465, 148, 0.5681435291146583, 0.5044989332028896, 0.5693740872318239, 0.46948290829745, 425, 173], [378, 148, 463, 148, 380, 147, 463, 148, 0.5681435291146583, 0.5050727546468557, 0.5693740872318239, 0.46948290829745, 423, 174], [375, 148, 461, 148, 376, 147, 461, 148, 0.5410013254498927, 0.5044989332028896, 0.49254801826406536, 0.5063373885270652, 421, 174], [376, 147, 461, 149, 375, 147, 462, 148, 0.4880167832418866, 0.5255719807126259, 0.5086064839889041, 0.46948290829745, 422, 174], [377, 147, 463, 149, 377, 147, 464, 149, 0.5023670927728233, 0.5198624075829533, 0.528880539863113, 0.5452864184137625, 423, 175], [377, 148, 462, 149, 377, 147, 463, 149, 0.5123179672041988, 0.5198624075829533, 0.45198728844731345, 0.5452864184137625, 423, 175], [377, 148, 462, 149, 379, 147, 463, 149, 0.5876103311287646, 0.5198624075829533, 0.5693740872318239, 0.5086064839889041, 422, 175], [377, 148, 462, 149, 379, 147, 463, 149, 0.5698512542604046, 0.5198624075829533, 0.5693740872318239, 0.5452864184137625, 423, 175], [378, 148, 463, 149, 380, 147, 464, 149, 0.5698512542604046, 0.519771294194971, 0.5287587340333663, 0.46948290829745, 424, 175], [378, 148, 463, 149, 379, 147, 464, 148, 0.5410013254498927, 0.5255719807126259, 0.49254801826406536, 0.4698615713098609, 425, 175], [379, 148, 464, 149, 381, 147, 465, 149, 0.5620374845754972, 0.519771294194971, 0.5287587340333663, 0.5372701085582307, 425, 175], [379, 148, 464, 149, 382, 147, 464, 148, 0.5914915544225193, 0.5113917043835519, 0.5345224838248488, 0.46948290829745, 424, 174], [379, 148, 464, 149, 381, 147, 465, 149, 0.5876103311287646, 0.5359957487860989, 0.5287587340333663, 0.5086064839889041, 425, 175], [380, 148, 464, 149, 381, 147, 465, 149, 0.5578596387637043, 0.5198624075829533, 0.4865952885889479, 0.5455069703232767, 425, 175], [379, 148, 464, 149, 381, 147, 465, 149, 0.5698512542604046, 0.5198624075829533, 0.5287587340333663, 0.5063373885270652, 425, 175], [379, 148, 464, 149, 381, 146, 465, 149, 0.5805969663228162, 0.5198624075829533, 0.5101817981151695, 0.46948290829745, 425, 175], [380, 148, 465, 149, 382, 147, 465, 148, 0.5698512542604046, 0.5115251816639413, 0.5693740872318239, 0.4359484148476321, 426, 175], [380, 149, 464, 150, 383, 147, 465, 149, 0.5988436799792497, 0.519771294194971, 0.5160156871153361, 0.46948290829745, 425, 175], [381, 148, 465, 150, 383, 147, 466, 150, 0.5876103311287646, 0.5198624075829533, 0.55203654948015, 0.5452864184137625, 426, 176], [381, 148, 465, 149, 383, 147, 465, 149, 0.5812741571943647, 0.5045695680749487, 0.5101817981151695, 0.46948290829745, 426, 175], [381, 148, 465, 149, 382, 147, 466, 149, 0.5578596387637043, 0.5255719807126259, 0.5017331074496789, 0.5086064839889041, 426, 176], [381, 148, 465, 150, 383, 147, 466, 149, 0.5812741571943647, 0.533734983337169, 0.5101817981151695, 0.46948290829745, 426, 175], [380, 148, 466, 150, 382, 147, 467, 149, 0.5698512542604046, 0.5255719807126259, 0.5017331074496789, 0.46153846153846156, 426, 176], [380, 148, 466, 149, 382, 147, 467, 149, 0.5698512542604046, 0.5255719807126259, 0.5287587340333663, 0.5, 426, 176], [381, 148, 466, 149, 383, 147, 467, 149, 0.5681435291146583, 0.519771294194971, 0.5693740872318239, 0.5384615384615384, 426, 176], [380, 148, 465, 150, 379, 147, 466, 149, 0.47431744977268264, 0.5255719807126259, 0.46698065726114957, 0.46948290829745, 426, 175], [381, 148, 466, 149, 383, 147, 467, 149, 0.5812741571943647, 0.5255719807126259, 0.5756395979652218, 0.5, 426, 175], [380, 148, 465, 150, 380, 147, 466, 149, 0.5034317492677621, 0.519771294194971, 0.46948290829745, 0.46948290829745, 427, 175], [380, 148, 465, 149, 382, 147, 466, 149, 0.5698512542604046, 0.5255719807126259, 0.5756395979652218, 0.49870223971837035, 425, 176], [380, 148, 465, 149, 380, 147, 466, 149, 0.5034317492677621, 0.519771294194971, 0.48862493311282795, 0.46948290829745, 427, 176], [381, 148, 465, 149, 381, 147, 466, 149, 0.5170116420954983, 0.5255719807126259, 0.49254801826406536, 0.46948290829745, 426, 175], [380, 147, 465, 149, 383, 147, 466, 149, 0.5914915544225193, 0.525082528823135, 0.5756395979652218, 0.5086064839889041, 427, 175], [380, 148, 465, 150, 383, 147, 466, 149, 0.5988436799792497, 0.519771294194971, 0.5345224838248488, 0.49254801826406536, 427, 175], [381, 148, 465, 149, 383, 147, 466, 149, 0.5876103311287646, 0.525082528823135, 0.5756395979652218, 0.5086064839889041, 426, 175], [381, 149, 464, 150, 383, 147, 465, 150, 0.5876103311287646, 0.5198624075829533, 0.5101817981151695, 0.5452864184137625, 426, 175], [380, 148, 465, 150, 380, 147, 465, 149, 0.5180258136473481, 0.5101051911348422, 0.48862493311282795, 0.46948290829745, 426, 176], [380, 148, 465, 149, 382, 147, 466, 149, 0.5698512542604046, 0.5255719807126259, 0.55203654948015, 0.5086064839889041, 426, 176], [380, 149, 465, 149, 383, 147, 466, 149, 0.5988436799792497, 0.5255719807126259, 0.5160156871153361, 0.46153846153846156, 425, 177], [379, 148, 464, 149, 379, 148, 465, 149, 0.5023670927728233, 0.5255719807126259, 0.5086064839889041, 0.46948290829745, 425, 177], [380, 148, 465, 149, 383, 147, 466, 149, 0.5988436799792497, 0.5255719807126259, 0.5756395979652218, 0.5, 426, 177], [380, 148, 465, 149, 379, 147, 465, 149, 0.48862493311282795, 0.5096389250342193, 0.46698065726114957, 0.46948290829745, 426, 178], [380, 148, 464, 150, 382, 147, 465, 150, 0.5698512542604046, 0.5198624075829533, 0.5101817981151695, 0.5455069703232767, 425, 177], [380, 147, 465, 150, 380, 147, 466, 150, 0.5034317492677621, 0.5198624075829533, 0.48862493311282795, 0.5452864184137625, 425, 177], [380, 148, 465, 149, 383, 147, 466, 149, 0.5988436799792497, 0.5198624075829533, 0.5590169943749475, 0.5086064839889041, 426, 176], [379, 147, 465, 149, 379, 147, 466, 149, 0.5023670927728233, 0.5255719807126259, 0.5086064839889041, 0.5, 425, 176], [380, 147, 465, 149, 380, 147, 465, 149, 0.5160013911496257, 0.5045695680749487, 0.5335936864527374, 0.528880539863113, 426, 175], [380, 148, 465, 149, 380, 147, 465, 149, 0.5034317492677621, 0.5096389250342193, 0.46948290829745, 0.49254801826406536, 426, 176], [380, 148, 465, 150, 383, 147, 466, 150, 0.5988436799792497, 0.5198624075829533, 0.5756395979652218, 0.5452864184137625, 427, 177], [380, 148, 465, 150, 380, 148, 466, 150, 0.5023670927728233, 0.5198624075829533, 0.5086064839889041, 0.5086064839889041, 426, 176], [381, 148, 464, 149, 383, 147, 465, 149, 0.5876103311287646, 0.5255719807126259, 0.46313825303047285, 0.4698615713098609, 426, 176], [381, 148, 465, 149, 384, 147, 466, 149, 0.5988436799792497, 0.5255719807126259, 0.5590169943749475, 0.5086064839889041, 426, 176], [381, 148, 465, 149, 381, 147, 466, 149, 0.5034317492677621, 0.5198624075829533, 0.46948290829745, 0.5086064839889041, 426, 175], [381, 150, 465, 151, 382, 149, 466, 151, 0.5330455522184625, 0.5170945517832358, 0.5091750772173156, 0.5, 426, 175], [381, 148, 466, 150, 381, 148, 466, 150, 0.5023670927728233, 0.5050727546468557, 0.5086064839889041, 0.5086064839889041, 427, 176], [381, 148, 466, 150, 384, 147, 467, 150, 0.5988436799792497, 0.5255719807126259, 0.5590169943749475, 0.5055694567754828, 427, 175], [381, 148, 467, 150, 383, 147, 468, 149, 0.5698512542604046, 0.5255719807126259, 0.5287587340333663, 0.46153846153846156, 427, 176], [382, 148, 466, 149, 384, 147, 467, 149, 0.5876103311287646, 0.5255719807126259, 0.55203654948015, 0.46948290829745, 427, 176], [382, 148, 467, 150, 384, 147, 468, 150, 0.5698512542604046, 0.5198624075829533, 0.5017331074496789, 0.5384615384615384, 428, 176]], [960, 540]], [[[381, 148, 466, 150, 384, 147, 467, 150, 0.5988436799792497, 0.5198624075829533, 0.5590169943749475, 0.5452864184137625, 427, 176], [381, 148, 466, 150, 384, 147, 467, 150, 0.5988436799792497, 0.5198624075829533, 0.5590169943749475, 0.5452864184137625, 427, 175], [381, 147, 466, 149, 385, 146, 467, 148, 0.6279588659660291, 0.5255719807126259, 0.6170872471783891, 0.4657704893618, 426, 176], [381, 146, 466, 148, 385, 144, 467, 148, 0.6392431245372421, 0.5255719807126259, 0.48175905059882235, 0.49254801826406536, 427, 176], [382, 146, 467, 148, 386, 144, 468, 147, 0.6399834366780134, 0.5333742102352678, 0.5357142857142857, 0.46948290829745, 427, 175], [382, 146, 467, 147, 388, 145, 468, 146, 0.694881389028119, 0.5461616356419261, 0.7043958186898579, 0.4605172359070549, 427, 175], [382, 146, 467, 148, 388, 145, 469, 147, 0.6803013430498074, 0.5620374845754972, 0.7585801124352316, 0.46153846153846156, 427, 175], [382, 146, 468, 148, 388, 145, 470, 148, 0.6803013430498074, 0.5548434370788046, 0.6462668580890237, 0.5, 428, 176], [383, 146, 467, 148, 388, 145, 469, 148, 0.6676211448715392, 0.555324253488824, 0.6, 0.5, 428, 176], [382, 146, 467, 147, 388, 145, 468, 146, 0.6891396772858813, 0.5455069703232769, 0.7585801124352316, 0.46948290829745, 427, 175], [383, 146, 467, 148, 386, 144, 468, 147, 0.610781166391035, 0.5455069703232769, 0.5189238931870598, 0.46948290829745, 428, 175], [382, 146, 467, 148, 388, 145, 469, 147, 0.6878520886555253, 0.5627264481670572, 0.6462668580890237, 0.46153846153846156, 427, 175], [382, 146, 467, 148, 388, 145, 469, 148, 0.694881389028119, 0.555324253488824, 0.7043958186898579, 0.5, 428, 175], [382, 146, 467, 148, 386, 144, 469, 148, 0.6292896865847027, 0.555324253488824, 0.48175905059882235, 0.5063373885270652, 429, 175], [383, 146, 467, 148, 388, 145, 469, 147, 0.6663494181712103, 0.5627264481670572, 0.6462668580890237, 0.4605172359070549, 428, 175], [383, 146, 467, 148, 388, 145, 469, 147, 0.6676211448715392, 0.5620374845754972, 0.6428571428571429, 0.4605172359070549, 428, 175], [383, 146, 466, 147, 387, 144, 467, 147, 0.6391562885911979, 0.525082528823135, 0.5769230769230769, 0.5086064839889041, 427, 176], [383, 146, 468, 149, 387, 144, 470, 148, 0.6483943436779002, 0.555324253488824, 0.5976143046671968, 0.46153846153846156, 428, 175], [383, 146, 469, 149, 387, 144, 470, 148, 0.6483943436779002, 0.538982920697943, 0.5385557150741863, 0.46153846153846156, 427, 175], [383, 145, 468, 148, 387, 144, 470, 147, 0.6391562885911979, 0.5627264481670572, 0.5495683880190667, 0.42775345904126305, 428, 175], [383, 146, 468, 148, 387, 144, 470, 147, 0.6483943436779002, 0.5627264481670572, 0.5976143046671968, 0.4166666666666667, 428, 174], [384, 146, 469, 148, 390, 145, 470, 147, 0.6891396772858813, 0.5326786615529376, 0.7043958186898579, 0.46948290829745, 429, 175], [383, 145, 469, 148, 389, 145, 470, 148, 0.6878520886555253, 0.5421081508848813, 0.7585801124352316, 0.5086064839889041, 429, 175], [384, 145, 469, 148, 388, 144, 470, 147, 0.6391562885911979, 0.5390799236573075, 0.585757838102026, 0.46948290829745, 430, 175], [384, 145, 470, 149, 388, 144, 472, 148, 0.6391562885911979, 0.5669495707495846, 0.6428571428571429, 0.46153846153846156, 430, 175], [383, 145, 469, 147, 388, 144, 470, 147, 0.6585246609727494, 0.5420056612465588, 0.6428571428571429, 0.5086064839889041, 429, 175], [384, 145, 468, 148, 389, 145, 470, 147, 0.6791035566281478, 0.5678190577743096, 0.6961088090582125, 0.4155851997653086, 429, 174], [385, 146, 469, 148, 390, 145, 471, 147, 0.6602924800189307, 0.5627264481670572, 0.6428571428571429, 0.42857142857142855, 430, 175], [384, 145, 469, 148, 390, 145, 470, 147, 0.6891396772858813, 0.5256860410051086, 0.7585801124352316, 0.46948290829745, 429, 175], [384, 146, 469, 149, 390, 145, 471, 148, 0.6864949785758065, 0.555324253488824, 0.7739239842086127, 0.45454545454545453, 429, 175], [385, 148, 469, 149, 391, 147, 470, 149, 0.6791624829964524, 0.5359957487860989, 0.8328449702216745, 0.51234753829798, 429, 175], [384, 146, 470, 148, 391, 145, 471, 148, 0.7223301080302311, 0.5420056612465588, 0.788226981996892, 0.5, 429, 175], [385, 145, 469, 148, 389, 144, 470, 147, 0.6377044356335186, 0.5333742102352678, 0.5769230769230769, 0.4269562819149833, 430, 175], [384, 146, 470, 148, 388, 144, 471, 147, 0.6377044356335186, 0.5500581333184195, 0.6435846357954428, 0.4155851997653086, 429, 176], [384, 146, 469, 149, 388, 144, 471, 148, 0.6483943436779002, 0.555324253488824, 0.5385557150741863, 0.46153846153846156, 429, 175], [384, 146, 470, 149, 389, 145, 471, 148, 0.6585246609727494, 0.5421081508848813, 0.6428571428571429, 0.46948290829745, 430, 175], [384, 145, 470, 149, 388, 144, 471, 148, 0.6392431245372421, 0.5420056612465588, 0.5769230769230769, 0.4657704893618, 429, 175], [384, 146, 469, 148, 389, 144, 471, 147, 0.6585246609727494, 0.5554097032451911, 0.5769230769230769, 0.4166666666666667, 429, 175], [384, 146, 470, 148, 389, 144, 471, 147, 0.6676211448715392, 0.5461616356419261, 0.6435846357954428, 0.46948290829745, 431, 176], [385, 146, 469, 149, 389, 144, 471, 148, 0.6483943436779002, 0.5554097032451911, 0.5357142857142857, 0.46153846153846156, 431, 175], [385, 146, 469, 149, 390, 145, 471, 148, 0.6676211448715392, 0.555324253488824, 0.6435846357954428, 0.46948290829745, 430, 176], [385, 146, 469, 149, 391, 145, 471, 148, 0.6961647281496838, 0.555324253488824, 0.6462668580890237, 0.4605172359070549, 430, 175], [385, 147, 469, 149, 390, 145, 471, 148, 0.666488504796853, 0.5554097032451911, 0.5976143046671968, 0.46153846153846156, 430, 175], [384, 146, 470, 148, 389, 144, 472, 148, 0.6585246609727494, 0.555324253488824, 0.5769230769230769, 0.5, 430, 176], [385, 146, 470, 149, 389, 144, 471, 148, 0.6483943436779002, 0.5420056612465588, 0.5976143046671968, 0.46948290829745, 430, 175], [384, 146, 470, 149, 389, 144, 471, 148, 0.666488504796853, 0.5421081508848813, 0.6435846357954428, 0.4605172359070549, 430, 175], [384, 146, 469, 148, 389, 144, 471, 148, 0.668042657122685, 0.555324253488824, 0.5385557150741863, 0.46153846153846156, 430, 175], [385, 146, 470, 149, 389, 144, 471, 149, 0.6592194721790309, 0.5359957487860989, 0.5976143046671968, 0.5, 430, 175], [384, 146, 469, 148, 391, 146, 470, 147, 0.7158909062001009, 0.5500581333184195, 0.8284868934053085, 0.4155851997653086, 430, 175], [385, 146, 470, 149, 389, 144, 472, 148, 0.6483943436779002, 0.5627264481670572, 0.5385557150741863, 0.46153846153846156, 431, 175], [385, 146, 471, 149, 390, 144, 472, 148, 0.666488504796853, 0.5421081508848813, 0.5976143046671968, 0.4166666666666667, 430, 175], [386, 146, 471, 149, 392, 145, 473, 148, 0.6891396772858813, 0.5554097032451911, 0.769309258162072, 0.46153846153846156, 431, 175], [386, 145, 470, 148, 392, 144, 472, 147, 0.6961647281496838, 0.555097193636601, 0.7176470588235293, 0.4166666666666667, 431, 175], [386, 145, 470, 148, 392, 145, 471, 147, 0.6891396772858813, 0.5256860410051086, 0.8284868934053085, 0.4657704893618, 431, 174], [386, 146, 471, 148, 391, 144, 472, 148, 0.6749994739719366, 0.5420056612465588, 0.7143913700387196, 0.5086064839889041, 432, 174], [386, 145, 471, 148, 390, 143, 472, 147, 0.646936916162406, 0.5390799236573075, 0.6435846357954428, 0.4269562819149833, 432, 174], [386, 145, 471, 148, 390, 143, 472, 147, 0.646936916162406, 0.5256860410051086, 0.5357142857142857, 0.46948290829745, 432, 173], [386, 145, 472, 148, 391, 144, 473, 147, 0.6585246609727494, 0.5421081508848813, 0.6428571428571429, 0.46948290829745, 433, 174], [386, 145, 471, 148, 390, 143, 473, 147, 0.6483943436779002, 0.5627264481670572, 0.5976143046671968, 0.46153846153846156, 432, 174], [385, 145, 470, 147, 389, 143, 471, 147, 0.646936916162406, 0.5390799236573075, 0.5769230769230769, 0.5086064839889041, 431, 173], [386, 145, 471, 148, 390, 143, 473, 147, 0.6483943436779002, 0.5554097032451911, 0.5976143046671968, 0.46153846153846156, 431, 173], [386, 145, 471, 148, 390, 143, 472, 147, 0.646936916162406, 0.5256860410051086, 0.5976143046671968, 0.46948290829745, 431, 174], [385, 144, 470, 148, 389, 143, 471, 147, 0.6377044356335186, 0.5256860410051086, 0.5769230769230769, 0.4269562819149833, 431, 174]], [10, 10]], [[[386, 145, 471, 149, 392, 144, 473, 148, 0.695400740617482, 0.5554097032451911, 0.7143913700387196, 0.46153846153846156, 432, 174], [385, 145, 471, 148, 391, 145, 472, 147, 0.6803013430498074, 0.5421081508848813, 0.7585801124352316, 0.4269562819149833, 431, 174], [386, 145, 470, 148, 389, 144, 472, 148, 0.610781166391035, 0.5497896869204211, 0.5769230769230769, 0.5055694567754828, 431, 174], [385, 146, 470, 148, 387, 144, 471, 148, 0.5805969663228162, 0.5255719807126259, 0.47915742374995496, 0.5055694567754828, 431, 174], [385, 146, 470, 149, 387, 144, 471, 148, 0.5912025767024786, 0.5255719807126259, 0.47915742374995496, 0.46948290829745, 432, 174], [385, 146, 470, 149, 387, 144, 471, 148, 0.5711538431809322, 0.5255719807126259, 0.47915742374995496, 0.46153846153846156, 430, 174], [385, 146, 470, 148, 385, 144, 470, 147, 0.5305819372609016, 0.5199038944731996, 0.39123039821797584, 0.39411349099844617, 430, 175], [385, 146, 470, 149, 387, 144, 471, 148, 0.5926306376355849, 0.5255719807126259, 0.47915742374995496, 0.46948290829745, 431, 173], [385, 146, 470, 149, 386, 144, 470, 147, 0.553808087348396, 0.5199038944731996, 0.40155025034271347, 0.39411349099844617, 430, 173], [385, 145, 470, 148, 386, 144, 470, 147, 0.5601752508985156, 0.5199038944731996, 0.4229673558125319, 0.4155851997653086, 430, 174], [384, 146, 470, 149, 382, 144, 470, 148, 0.4577055393416657, 0.4958851384471846, 0.3659625273557, 0.4698615713098609, 430, 174], [385, 146, 470, 149, 387, 145, 470, 148, 0.5796011559684815, 0.5113917043835519, 0.46556138676257347, 0.4269562819149833, 429, 174], [385, 146, 470, 149, 387, 144, 470, 148, 0.5986850552334716, 0.5115251816639413, 0.47915742374995496, 0.46948290829745, 429, 174], [385, 146, 470, 149, 387, 145, 470, 148, 0.5890024007803364, 0.5113917043835519, 0.5160156871153361, 0.46948290829745, 430, 173], [386, 148, 469, 150, 388, 146, 470, 149, 0.5876103311287646, 0.5420056612465588, 0.5454545454545454, 0.4657704893618, 431, 174], [385, 147, 470, 149, 386, 145, 470, 148, 0.5695265575041766, 0.5115251816639413, 0.4350127712046063, 0.4269562819149833, 431, 174], [385, 146, 470, 149, 387, 145, 470, 148, 0.5805969663228162, 0.5199038944731996, 0.5160156871153361, 0.4564354645876385, 431, 174], [385, 147, 470, 149, 385, 144, 470, 148, 0.5432981440145995, 0.4958851384471846, 0.3273268353539886, 0.4269562819149833, 429, 174], [385, 147, 470, 149, 386, 145, 470, 148, 0.542288792974948, 0.5113917043835519, 0.4300569492425819, 0.46948290829745, 431, 174], [385, 146, 470, 149, 386, 145, 470, 148, 0.542288792974948, 0.5113917043835519, 0.46313825303047285, 0.46948290829745, 429, 174], [385, 148, 469, 150, 388, 146, 469, 149, 0.6065114440465722, 0.5050727546468557, 0.5454545454545454, 0.49250291764762877, 430, 174], [385, 147, 469, 149, 385, 146, 470, 149, 0.5282807466615435, 0.5193143890554585, 0.4153311931459037, 0.51234753829798, 431, 173], [385, 147, 470, 149, 388, 145, 470, 148, 0.6090667045999986, 0.5115251816639413, 0.5, 0.45198728844731345, 431, 174], [385, 146, 470, 149, 387, 145, 470, 148, 0.5825088917746576, 0.5115251816639413, 0.5160156871153361, 0.46948290829745, 430, 173], [384, 146, 470, 148, 386, 144, 470, 147, 0.5805969663228162, 0.5199038944731996, 0.46313825303047285, 0.46948290829745, 430, 173], [384, 146, 470, 149, 384, 144, 471, 147, 0.5135894320205543, 0.5333742102352678, 0.39123039821797584, 0.38461538461538464, 431, 173], [385, 146, 470, 149, 387, 144, 470, 148, 0.5912025767024786, 0.5115251816639413, 0.47915742374995496, 0.46948290829745, 430, 174], [384, 146, 469, 148, 386, 144, 469, 147, 0.5720404195178502, 0.5041332403708344, 0.4300569492425819, 0.49254801826406536, 430, 174], [384, 146, 469, 148, 386, 144, 470, 147, 0.5821022034029861, 0.5256860410051086, 0.4300569492425819, 0.4269562819149833, 429, 173], [384, 146, 470, 148, 386, 144, 470, 147, 0.5821022034029861, 0.5199038944731996, 0.43222538003819994, 0.4269562819149833, 429, 173], [384, 146, 469, 149, 386, 144, 470, 147, 0.5805969663228162, 0.5333742102352678, 0.47915742374995496, 0.39411349099844617, 430, 173], [384, 146, 470, 148, 386, 144, 470, 147, 0.5805969663228162, 0.5199038944731996, 0.47915742374995496, 0.4269562819149833, 430, 174], [384, 146, 469, 148, 387, 144, 469, 147, 0.6090667045999986, 0.4958851384471846, 0.47915742374995496, 0.49254801826406536, 430, 174], [384, 146, 469, 148, 386, 144, 469, 147, 0.5821022034029861, 0.5034317492677621, 0.4350127712046063, 0.46948290829745, 430, 174], [384, 146, 469, 148, 386, 144, 469, 147, 0.5926306376355849, 0.5034317492677621, 0.40155025034271347, 0.49254801826406536, 430, 174], [384, 147, 470, 149, 386, 145, 470, 148, 0.5805969663228162, 0.5102283184808404, 0.46556138676257347, 0.46948290829745, 429, 174], [384, 146, 469, 148, 386, 144, 470, 148, 0.5821022034029861, 0.5255719807126259, 0.40155025034271347, 0.5086064839889041, 430, 174], [384, 146, 469, 148, 386, 145, 469, 147, 0.5711538431809322, 0.5034317492677621, 0.46313825303047285, 0.49254801826406536, 430, 175], [384, 146, 470, 149, 386, 144, 470, 148, 0.5821022034029861, 0.5115251816639413, 0.4300569492425819, 0.46948290829745, 431, 173], [384, 147, 469, 149, 385, 145, 469, 148, 0.5592353177554151, 0.5115251816639413, 0.46313825303047285, 0.46948290829745, 429, 175], [384, 146, 469, 148, 385, 145, 469, 148, 0.542288792974948, 0.4958851384471846, 0.46313825303047285, 0.46948290829745, 430, 175], [384, 147, 469, 149, 385, 145, 470, 148, 0.5543552007344342, 0.5255719807126259, 0.46313825303047285, 0.46948290829745, 429, 175], [384, 147, 469, 149, 385, 145, 470, 148, 0.5649815503617218, 0.5326786615529376, 0.4300569492425819, 0.46948290829745, 429, 176], [383, 147, 469, 149, 385, 145, 469, 148, 0.5821022034029861, 0.5191639914323797, 0.4300569492425819, 0.46948290829745, 429, 176], [383, 147, 469, 149, 386, 145, 470, 148, 0.6090667045999986, 0.5333742102352678, 0.47915742374995496, 0.39411349099844617, 429, 175], [384, 147, 469, 149, 383, 146, 470, 148, 0.48862493311282795, 0.5326786615529376, 0.46698065726114957, 0.4269562819149833, 429, 176], [383, 147, 469, 149, 386, 145, 470, 148, 0.6001606763738897, 0.5326786615529376, 0.5160156871153361, 0.46948290829745, 430, 176], [383, 146, 469, 149, 384, 145, 469, 148, 0.5431789268000492, 0.5034317492677621, 0.42132504423474326, 0.48862493311282795, 429, 176], [384, 147, 469, 149, 386, 145, 469, 148, 0.5825088917746576, 0.5034317492677621, 0.5160156871153361, 0.49254801826406536, 429, 176], [384, 146, 470, 149, 386, 145, 470, 148, 0.5890024007803364, 0.5113917043835519, 0.5160156871153361, 0.4166666666666667, 427, 176], [384, 146, 469, 149, 385, 145, 469, 148, 0.5592353177554151, 0.5034317492677621, 0.46313825303047285, 0.4269562819149833, 427, 176], [384, 146, 470, 149, 386, 145, 470, 148, 0.5720404195178502, 0.5191639914323797, 0.46556138676257347, 0.4155851997653086, 428, 176], [384, 146, 469, 149, 384, 145, 469, 148, 0.5305819372609016, 0.4958851384471846, 0.39411349099844617, 0.4269562819149833, 427, 175], [384, 147, 469, 149, 385, 145, 470, 149, 0.5649815503617218, 0.5255719807126259, 0.40155025034271347, 0.46948290829745, 429, 176], [383, 147, 469, 149, 381, 145, 469, 148, 0.4577055393416657, 0.5041332403708344, 0.3659625273557, 0.4573660169594892, 429, 176], [383, 146, 469, 149, 383, 145, 469, 148, 0.5041332403708344, 0.5034317492677621, 0.4359484148476321, 0.46948290829745, 429, 176], [384, 146, 470, 149, 385, 145, 471, 148, 0.5431789268000492, 0.5500581333184195, 0.46313825303047285, 0.46153846153846156, 429, 174], [384, 147, 469, 149, 386, 145, 470, 148, 0.5825088917746576, 0.5256860410051086, 0.5160156871153361, 0.46948290829745, 429, 175], [384, 146, 469, 148, 385, 144, 469, 148, 0.5711145900780334, 0.4958851384471846, 0.4300569492425819, 0.46948290829745, 426, 176], [383, 147, 470, 148, 383, 145, 470, 148, 0.5135894320205543, 0.5096389250342193, 0.41761598890230633, 0.4605172359070549, 426, 176], [384, 146, 470, 148, 385, 145, 470, 147, 0.5592353177554151, 0.5176722419590498, 0.46313825303047285, 0.42857142857142855, 427, 175], [384, 146, 469, 148, 386, 145, 469, 148, 0.5720404195178502, 0.4958851384471846, 0.46556138676257347, 0.46948290829745, 427, 176], [384, 147, 470, 149, 385, 145, 470, 148, 0.5649815503617218, 0.5170116420954983, 0.4300569492425819, 0.46948290829745, 429, 175], [384, 147, 469, 149, 386, 145, 470, 149, 0.5821022034029861, 0.5255719807126259, 0.40155025034271347, 0.5086064839889041, 429, 175]], [960, 10]], [[[384, 147, 469, 150, 385, 145, 470, 148, 0.5711145900780334, 0.5333742102352678, 0.4300569492425819, 0.38461538461538464, 428, 175], [383, 146, 470, 147, 384, 145, 469, 147, 0.5523211992849183, 0.48862493311282795, 0.46313825303047285, 0.46948290829745, 426, 176], [383, 147, 468, 149, 379, 145, 462, 148, 0.41659779045053086, 0.34992181810342243, 0.35250582268891084, 0.7585801124352316, 429, 175], [383, 147, 468, 148, 378, 145, 467, 148, 0.39042723414318553, 0.47431744977268264, 0.40155025034271347, 0.524890659167824, 429, 176], [383, 147, 468, 148, 377, 146, 467, 147, 0.36181456980466103, 0.4746642207381757, 0.46313825303047285, 0.4359484148476321, 424, 176], [383, 147, 468, 149, 378, 145, 462, 147, 0.4026280852101602, 0.3589262856418957, 0.39705882352941174, 0.5976143046671968, 427, 175], [382, 147, 467, 149, 376, 146, 463, 148, 0.34716482537544247, 0.3880681356019909, 0.5160156871153361, 0.6308161333406433, 428, 175], [382, 148, 467, 149, 377, 146, 463, 148, 0.3739079599773656, 0.3880681356019909, 0.5160156871153361, 0.6308161333406433, 429, 175], [383, 147, 467, 148, 378, 145, 463, 147, 0.39042723414318553, 0.4011576452992038, 0.4300569492425819, 0.585757838102026, 428, 175], [383, 147, 468, 149, 378, 145, 462, 148, 0.4026280852101602, 0.34992181810342243, 0.40155025034271347, 0.6923076923076923, 429, 176], [382, 147, 467, 148, 377, 146, 462, 148, 0.3739079599773656, 0.3598285480920581, 0.5017331074496789, 0.6923076923076923, 428, 175], [383, 147, 467, 148, 380, 145, 463, 147, 0.4297075733598504, 0.4011576452992038, 0.39411349099844617, 0.585757838102026, 428, 176], [382, 147, 468, 149, 379, 146, 462, 148, 0.42881732418439106, 0.34924535550111524, 0.42132504423474326, 0.7499999999999999, 428, 175], [382, 147, 467, 148, 377, 146, 461, 147, 0.3739079599773656, 0.3629106670368549, 0.5160156871153361, 0.6971337866607125, 429, 176], [382, 147, 467, 149, 377, 146, 462, 148, 0.3739079599773656, 0.3598285480920581, 0.5101817981151695, 0.6923076923076923, 428, 176], [382, 148, 468, 149, 377, 146, 462, 148, 0.3739079599773656, 0.3629106670368549, 0.46313825303047285, 0.6428571428571429, 428, 176], [382, 148, 467, 148, 378, 146, 466, 148, 0.4011576452992038, 0.47431744977268264, 0.46313825303047285, 0.524890659167824, 429, 176], [382, 147, 467, 148, 378, 146, 461, 147, 0.4011576452992038, 0.3629106670368549, 0.42132504423474326, 0.6462668580890237, 428, 176], [382, 147, 467, 148, 378, 145, 466, 147, 0.41659779045053086, 0.48508516950248864, 0.39123039821797584, 0.4573660169594892, 428, 175], [382, 147, 467, 147, 378, 145, 467, 147, 0.4152316280591612, 0.5034317492677621, 0.42132504423474326, 0.5063373885270652, 428, 175], [383, 147, 467, 148, 377, 145, 466, 147, 0.37894408019779785, 0.48508516950248864, 0.5160156871153361, 0.4573660169594892, 428, 175], [382, 147, 467, 147, 380, 145, 467, 147, 0.4690074798553387, 0.5034317492677621, 0.38461538461538464, 0.5063373885270652, 428, 175], [383, 148, 467, 148, 381, 146, 467, 148, 0.45557664553793736, 0.4960274077656917, 0.36363636363636365, 0.46948290829745, 428, 174], [383, 147, 467, 147, 379, 144, 466, 147, 0.4477046494342001, 0.48913987007807896, 0.35250582268891084, 0.524890659167824, 427, 175], [382, 147, 467, 148, 377, 145, 461, 147, 0.39042723414318553, 0.33266338421094777, 0.4350127712046063, 0.6462668580890237, 428, 174], [382, 147, 466, 147, 377, 145, 466, 147, 0.38909494235834136, 0.5041332403708344, 0.46313825303047285, 0.47258156262526085, 427, 174], [383, 147, 467, 147, 381, 145, 466, 147, 0.48328460956338193, 0.48862493311282795, 0.38461538461538464, 0.524890659167824, 428, 174], [382, 147, 467, 148, 379, 144, 467, 148, 0.4598179062270762, 0.5034317492677621, 0.3273268353539886, 0.5063373885270652, 428, 174], [382, 148, 466, 147, 377, 145, 465, 147, 0.39042723414318553, 0.48862493311282795, 0.40155025034271347, 0.4898979485566357, 428, 174], [382, 147, 466, 147, 378, 145, 465, 147, 0.43025702465669974, 0.48424146447652267, 0.39123039821797584, 0.4898979485566357, 428, 174], [382, 147, 466, 147, 379, 145, 465, 147, 0.4432951163129635, 0.47431744977268264, 0.3659625273557, 0.4898979485566357, 428, 174], [382, 147, 466, 147, 377, 145, 465, 146, 0.39042723414318553, 0.48508516950248864, 0.46313825303047285, 0.4573660169594892, 428, 174], [382, 147, 466, 147, 377, 145, 465, 147, 0.39042723414318553, 0.4750240869417223, 0.40155025034271347, 0.4898979485566357, 428, 174], [382, 147, 467, 148, 379, 146, 466, 148, 0.42881732418439106, 0.48862493311282795, 0.4269562819149833, 0.5066043253739226, 428, 174], [382, 147, 467, 148, 378, 146, 461, 147, 0.4011576452992038, 0.34924535550111524, 0.42132504423474326, 0.6428571428571429, 427, 175], [382, 147, 467, 148, 377, 145, 466, 147, 0.4043449142608094, 0.4892908643371968, 0.4300569492425819, 0.43634158726581923, 428, 175], [382, 147, 467, 147, 378, 145, 466, 147, 0.41659779045053086, 0.49729124502318517, 0.39123039821797584, 0.4898979485566357, 428, 175], [382, 148, 466, 147, 377, 145, 462, 146, 0.4076121081013407, 0.4152316280591612, 0.40155025034271347, 0.5467073155618909, 428, 175], [382, 148, 467, 148, 376, 146, 466, 147, 0.34716482537544247, 0.4892908643371968, 0.5160156871153361, 0.43634158726581923, 427, 175], [382, 148, 467, 149, 377, 146, 463, 147, 0.38909494235834136, 0.4162050499436737, 0.46313825303047285, 0.5769230769230769, 428, 175], [382, 147, 467, 148, 376, 146, 466, 147, 0.34716482537544247, 0.49848386049053806, 0.5160156871153361, 0.4573660169594892, 428, 175], [382, 147, 466, 147, 379, 145, 465, 147, 0.4432951163129635, 0.47431744977268264, 0.3659625273557, 0.4898979485566357, 428, 175], [382, 148, 467, 148, 378, 146, 467, 147, 0.4011576452992038, 0.5135894320205543, 0.42132504423474326, 0.4359484148476321, 428, 175], [382, 148, 467, 148, 378, 146, 461, 147, 0.4011576452992038, 0.3629106670368549, 0.42132504423474326, 0.6428571428571429, 427, 175], [382, 148, 466, 148, 379, 145, 463, 147, 0.4725218079755606, 0.42881732418439106, 0.31948553318915673, 0.5345224838248488, 428, 175], [382, 148, 467, 149, 378, 146, 467, 149, 0.4011576452992038, 0.5101051911348422, 0.42132504423474326, 0.5, 428, 175], [382, 148, 467, 148, 377, 146, 462, 147, 0.38909494235834136, 0.3893588910256978, 0.46313825303047285, 0.585757838102026, 427, 175], [382, 148, 467, 148, 378, 145, 466, 148, 0.4326155033314811, 0.48862493311282795, 0.35250582268891084, 0.5063373885270652, 427, 175], [382, 147, 467, 148, 378, 145, 466, 147, 0.41659779045053086, 0.48862493311282795, 0.39123039821797584, 0.43634158726581923, 428, 175], [382, 147, 467, 148, 376, 146, 462, 147, 0.34716482537544247, 0.3739079599773656, 0.5769230769230769, 0.6428571428571429, 428, 175], [382, 147, 467, 149, 377, 145, 463, 147, 0.39042723414318553, 0.4011576452992038, 0.40155025034271347, 0.5769230769230769, 428, 175], [382, 147, 467, 147, 380, 145, 463, 146, 0.4690074798553387, 0.4011576452992038, 0.38461538461538464, 0.5345224838248488, 428, 175], [382, 148, 466, 148, 377, 145, 461, 147, 0.42029677059406795, 0.3739079599773656, 0.40155025034271347, 0.6428571428571429, 428, 175], [382, 147, 466, 147, 379, 145, 462, 146, 0.4432951163129635, 0.4011576452992038, 0.39411349099844617, 0.585757838102026, 427, 175], [382, 147, 467, 148, 377, 145, 466, 147, 0.39042723414318553, 0.49848386049053806, 0.46313825303047285, 0.43634158726581923, 427, 175], [382, 147, 467, 147, 380, 145, 466, 147, 0.4690074798553387, 0.47431744977268264, 0.38461538461538464, 0.47258156262526085, 427, 175], [382, 148, 466, 147, 377, 145, 466, 147, 0.39042723414318553, 0.5034317492677621, 0.40155025034271347, 0.47258156262526085, 427, 174], [382, 147, 467, 148, 380, 145, 466, 147, 0.4690074798553387, 0.4892908643371968, 0.38461538461538464, 0.4573660169594892, 428, 175], [382, 148, 467, 148, 376, 146, 466, 147, 0.34716482537544247, 0.48508516950248864, 0.5160156871153361, 0.4573660169594892, 428, 174], [382, 147, 467, 147, 377, 145, 466, 147, 0.38909494235834136, 0.48862493311282795, 0.46313825303047285, 0.5063373885270652, 428, 174], [382, 147, 467, 148, 378, 145, 466, 147, 0.41659779045053086, 0.48862493311282795, 0.42132504423474326, 0.46948290829745, 427, 175], [382, 147, 467, 147, 380, 145, 467, 147, 0.4690074798553387, 0.5041332403708344, 0.35714285714285715, 0.47258156262526085, 428, 174], [382, 147, 467, 148, 376, 146, 461, 147, 0.34716482537544247, 0.3629106670368549, 0.5160156871153361, 0.6428571428571429, 427, 174], [382, 147, 467, 148, 376, 146, 461, 147, 0.34716482537544247, 0.3629106670368549, 0.5160156871153361, 0.6462668580890237, 428, 175]], [1910, 10]], [[[382, 148, 467, 148, 377, 146, 462, 147, 0.3739079599773656, 0.3739079599773656, 0.46313825303047285, 0.5889418767637288, 428, 174], [382, 147, 467, 148, 378, 146, 467, 147, 0.4011576452992038, 0.5135894320205543, 0.42132504423474326, 0.4359484148476321, 428, 174], [382, 148, 467, 149, 378, 147, 461, 148, 0.3999644900490883, 0.34992181810342243, 0.42132504423474326, 0.6462668580890237, 428, 174], [382, 149, 467, 149, 376, 147, 466, 149, 0.3629106670368549, 0.48862493311282795, 0.5160156871153361, 0.5063373885270652, 427, 174], [382, 149, 467, 150, 377, 148, 461, 149, 0.3882390743491871, 0.34992181810342243, 0.42132504423474326, 0.6462668580890237, 427, 175], [382, 148, 467, 149, 380, 146, 466, 149, 0.47042953625030376, 0.48862493311282795, 0.35714285714285715, 0.47258156262526085, 428, 175], [382, 149, 467, 149, 377, 147, 466, 149, 0.4030624211268392, 0.48862493311282795, 0.4300569492425819, 0.47258156262526085, 428, 175], [382, 149, 467, 149, 376, 148, 466, 149, 0.34924535550111524, 0.48129097770727997, 0.5756395979652218, 0.46948290829745, 427, 175], [382, 149, 466, 149, 378, 147, 465, 149, 0.4011576452992038, 0.48862493311282795, 0.3946440733581061, 0.524890659167824, 427, 175], [382, 149, 466, 150, 377, 147, 461, 149, 0.3739079599773656, 0.3766543669078147, 0.46313825303047285, 0.6923076923076923, 427, 175], [382, 149, 467, 150, 377, 148, 461, 149, 0.3598285480920581, 0.34924535550111524, 0.5287587340333663, 0.6923076923076923, 427, 175], [381, 149, 466, 150, 377, 147, 461, 149, 0.4152316280591612, 0.3739079599773656, 0.3927126776473244, 0.6428571428571429, 428, 175], [382, 149, 467, 150, 377, 147, 466, 149, 0.3893588910256978, 0.48862493311282795, 0.46313825303047285, 0.4359484148476321, 427, 175], [382, 149, 467, 149, 377, 147, 466, 149, 0.3739079599773656, 0.48862493311282795, 0.46313825303047285, 0.524890659167824, 427, 175], [382, 149, 467, 150, 377, 147, 466, 150, 0.38909494235834136, 0.48129097770727997, 0.4300569492425819, 0.5063373885270652, 427, 175], [382, 149, 467, 150, 378, 147, 466, 150, 0.4011576452992038, 0.48129097770727997, 0.42132504423474326, 0.5066043253739226, 427, 175], [382, 149, 467, 151, 376, 148, 462, 150, 0.3319530651546462, 0.36696814825289753, 0.5590169943749475, 0.6923076923076923, 428, 175], [382, 149, 467, 150, 376, 148, 466, 150, 0.3460263567159676, 0.48129097770727997, 0.5590169943749475, 0.46948290829745, 428, 174], [382, 149, 467, 149, 378, 147, 467, 149, 0.4011576452992038, 0.5170116420954983, 0.42132504423474326, 0.4666666666666667, 428, 175], [382, 148, 467, 150, 377, 147, 466, 150, 0.3727402242963828, 0.48081713894917094, 0.5017331074496789, 0.565266863719195, 428, 174], [382, 148, 467, 149, 378, 147, 466, 149, 0.4011576452992038, 0.48129097770727997, 0.45879451996947496, 0.524890659167824, 428, 175], [382, 149, 467, 149, 377, 147, 466, 149, 0.3739079599773656, 0.48862493311282795, 0.46313825303047285, 0.47258156262526085, 428, 174], [383, 149, 467, 150, 377, 147, 462, 149, 0.3629106670368549, 0.3665358045505242, 0.5160156871153361, 0.6428571428571429, 428, 175], [382, 148, 467, 149, 377, 147, 467, 149, 0.3598285480920581, 0.5096389250342193, 0.5044510561137411, 0.5063373885270652, 428, 174], [382, 149, 467, 149, 379, 147, 467, 149, 0.42760167798694904, 0.4958851384471846, 0.39411349099844617, 0.49904570221480693, 427, 175], [382, 149, 467, 149, 379, 147, 466, 149, 0.4418993312257893, 0.48129097770727997, 0.39411349099844617, 0.5063373885270652, 427, 174], [382, 148, 467, 150, 377, 147, 461, 149, 0.38909494235834136, 0.34992181810342243, 0.46313825303047285, 0.6961088090582125, 428, 175], [382, 149, 467, 149, 378, 147, 467, 149, 0.3999644900490883, 0.5101051911348422, 0.42132504423474326, 0.5063373885270652, 428, 175], [382, 149, 467, 150, 378, 147, 467, 150, 0.4011576452992038, 0.5101051911348422, 0.42132504423474326, 0.5452864184137625, 427, 174], [382, 149, 467, 150, 377, 148, 461, 149, 0.3598285480920581, 0.34992181810342243, 0.5044510561137411, 0.6435846357954428, 428, 175], [382, 150, 466, 150, 379, 148, 466, 150, 0.42760167798694904, 0.48978280593809076, 0.3783166508489868, 0.5086064839889041, 428, 174], [382, 150, 466, 151, 378, 149, 466, 151, 0.3991233701556477, 0.48978280593809076, 0.45825756949558405, 0.4657704893618, 428, 175], [382, 149, 467, 150, 379, 148, 467, 150, 0.42760167798694904, 0.5101051911348422, 0.4564354645876385, 0.5055694567754828, 427, 174], [382, 149, 466, 150, 379, 147, 466, 149, 0.4418993312257893, 0.5041332403708344, 0.39411349099844617, 0.4359484148476321, 428, 175], [382, 149, 467, 150, 377, 148, 467, 150, 0.3598285480920581, 0.4958851384471846, 0.5017331074496789, 0.5452864184137625, 428, 175], [382, 149, 467, 150, 378, 147, 466, 150, 0.4011576452992038, 0.48129097770727997, 0.42132504423474326, 0.5452864184137625, 428, 175], [382, 149, 467, 150, 377, 148, 466, 150, 0.3598285480920581, 0.48129097770727997, 0.5590169943749475, 0.5086064839889041, 428, 175], [382, 149, 467, 150, 377, 147, 466, 149, 0.3739079599773656, 0.48862493311282795, 0.46313825303047285, 0.46948290829745, 428, 175], [382, 149, 467, 150, 378, 147, 467, 150, 0.4011576452992038, 0.4958851384471846, 0.42132504423474326, 0.5063373885270652, 428, 174], [382, 149, 467, 150, 378, 148, 467, 150, 0.3880681356019909, 0.5101051911348422, 0.45825756949558416, 0.5452864184137625, 428, 175], [383, 149, 467, 150, 380, 147, 467, 149, 0.45565806397681907, 0.5170116420954983, 0.3659625273557, 0.4359484148476321, 428, 176], [383, 149, 467, 150, 378, 148, 467, 150, 0.37107319021993496, 0.4958851384471846, 0.5017331074496789, 0.46948290829745, 428, 175], [382, 149, 467, 150, 377, 148, 466, 150, 0.3727402242963828, 0.48129097770727997, 0.5590169943749475, 0.49254801826406536, 428, 175], [383, 149, 467, 150, 380, 147, 466, 150, 0.4418993312257893, 0.48129097770727997, 0.39411349099844617, 0.524890659167824, 428, 175], [383, 149, 467, 151, 379, 147, 462, 150, 0.4152316280591612, 0.36696814825289753, 0.38188130791298674, 0.6923076923076923, 428, 175], [383, 149, 467, 150, 379, 147, 467, 150, 0.4011576452992038, 0.49552242555997383, 0.42132504423474326, 0.5063373885270652, 428, 176], [382, 149, 467, 150, 378, 148, 462, 149, 0.3880681356019909, 0.37733190833858476, 0.5017331074496789, 0.6363349317212752, 428, 175], [383, 149, 468, 150, 378, 148, 467, 150, 0.3598285480920581, 0.48129097770727997, 0.5017331074496789, 0.5063373885270652, 428, 175], [383, 149, 467, 150, 379, 147, 467, 149, 0.4011576452992038, 0.4958851384471846, 0.42132504423474326, 0.46948290829745, 428, 175], [383, 149, 467, 149, 379, 147, 467, 149, 0.3999644900490883, 0.4958851384471846, 0.42132504423474326, 0.46948290829745, 429, 175], [383, 148, 467, 150, 379, 146, 467, 149, 0.4162050499436737, 0.49552242555997383, 0.42132504423474326, 0.46948290829745, 429, 175], [383, 148, 467, 150, 380, 147, 467, 149, 0.44221727312706577, 0.5101051911348422, 0.46948290829745, 0.46948290829745, 428, 174], [383, 149, 468, 150, 379, 147, 467, 149, 0.3999644900490883, 0.48129097770727997, 0.42132504423474326, 0.46948290829745, 429, 175], [383, 149, 468, 150, 379, 147, 467, 149, 0.3999644900490883, 0.48129097770727997, 0.42132504423474326, 0.46948290829745, 429, 174], [383, 148, 468, 150, 379, 147, 467, 149, 0.4150642802761788, 0.48862493311282795, 0.4564354645876385, 0.46948290829745, 429, 174], [383, 148, 467, 150, 379, 147, 467, 149, 0.4011576452992038, 0.4958851384471846, 0.42132504423474326, 0.46948290829745, 428, 174], [383, 149, 467, 150, 378, 147, 466, 150, 0.3727402242963828, 0.47539019582628395, 0.4350127712046063, 0.5335936864527374, 428, 174], [383, 149, 467, 150, 380, 147, 466, 150, 0.42760167798694904, 0.48129097770727997, 0.39411349099844617, 0.565266863719195, 428, 175], [383, 149, 467, 150, 380, 147, 467, 150, 0.42881732418439106, 0.5101051911348422, 0.39411349099844617, 0.5452864184137625, 428, 174], [383, 149, 467, 151, 379, 147, 462, 150, 0.4162050499436737, 0.3766543669078147, 0.42132504423474326, 0.6428571428571429, 428, 175], [382, 149, 467, 150, 378, 147, 466, 150, 0.4152316280591612, 0.48129097770727997, 0.46313825303047285, 0.5063373885270652, 429, 175], [383, 149, 468, 150, 380, 147, 468, 149, 0.4552586675544866, 0.5170116420954983, 0.39411349099844617, 0.4605172359070549, 428, 175], [383, 149, 468, 150, 378, 147, 467, 150, 0.3893588910256978, 0.48129097770727997, 0.46313825303047285, 0.5452864184137625, 429, 175], [383, 149, 467, 150, 379, 147, 466, 150, 0.4152316280591612, 0.48129097770727997, 0.38188130791298674, 0.524890659167824, 428, 175]], [1910, 540]], [[[382, 149, 468, 150, 378, 148, 468, 150, 0.3999644900490883, 0.5101051911348422, 0.5017331074496789, 0.5384615384615384, 428, 175], [383, 150, 467, 151, 377, 149, 467, 151, 0.33098928925807963, 0.48978280593809076, 0.5590169943749475, 0.5086064839889041, 428, 174], [383, 151, 467, 152, 379, 149, 467, 151, 0.3880681356019909, 0.5101051911348422, 0.4186751734138404, 0.46948290829745, 429, 175], [383, 150, 467, 151, 381, 149, 467, 151, 0.45671801896473063, 0.4858156165734796, 0.4531423030224586, 0.5086064839889041, 428, 174], [383, 150, 467, 151, 381, 149, 467, 152, 0.4443256698645686, 0.5045695680749487, 0.4269562819149833, 0.49870223971837035, 429, 175], [383, 150, 467, 151, 380, 149, 467, 151, 0.41557734326881174, 0.48978280593809076, 0.4269562819149833, 0.46948290829745, 428, 175], [384, 151, 467, 152, 382, 150, 467, 152, 0.45671801896473063, 0.4858156165734796, 0.45454545454545453, 0.5086064839889041, 428, 175], [383, 152, 468, 153, 383, 152, 468, 153, 0.4917817536569309, 0.498358971328439, 0.5728219618694801, 0.552998693512715, 427, 175], [383, 151, 467, 152, 382, 151, 467, 152, 0.48652624300156944, 0.4858156165734796, 0.46147910349544863, 0.51234753829798, 428, 176], [383, 152, 467, 153, 382, 151, 467, 153, 0.47188055861699557, 0.4858156165734796, 0.45454545454545453, 0.5548434370788046, 428, 176], [383, 152, 467, 153, 381, 150, 467, 152, 0.4443256698645686, 0.48978280593809076, 0.36363636363636365, 0.4657704893618, 428, 177], [383, 151, 467, 152, 380, 150, 467, 152, 0.4285262433334288, 0.48984382629612083, 0.49792959773196926, 0.5086064839889041, 429, 177], [383, 151, 467, 151, 382, 150, 467, 151, 0.47188055861699557, 0.48978280593809076, 0.4622979885968386, 0.4269562819149833, 429, 176], [382, 151, 467, 153, 381, 150, 467, 152, 0.47188055861699557, 0.48978280593809076, 0.45454545454545453, 0.4657704893618, 429, 176], [383, 151, 467, 152, 381, 150, 467, 152, 0.4443256698645686, 0.48978280593809076, 0.4657704893618, 0.4657704893618, 429, 176], [383, 151, 467, 152, 381, 150, 467, 152, 0.4443256698645686, 0.48978280593809076, 0.4155851997653086, 0.46948290829745, 429, 175], [383, 151, 467, 153, 382, 150, 468, 152, 0.47188055861699557, 0.519771294194971, 0.4166666666666667, 0.4166666666666667, 428, 175], [383, 151, 467, 153, 378, 150, 468, 152, 0.35884374397479657, 0.519771294194971, 0.6, 0.4622979885968386, 429, 176], [384, 151, 468, 152, 382, 149, 468, 152, 0.45817214370355736, 0.5008583595328244, 0.36251384241796686, 0.5086064839889041, 429, 175], [384, 151, 467, 152, 382, 149, 468, 152, 0.4680838434715186, 0.516007937348689, 0.36251384241796686, 0.5, 429, 174], [384, 151, 467, 152, 382, 149, 468, 152, 0.4680838434715186, 0.5153442952066594, 0.36363636363636365, 0.5, 429, 175], [384, 151, 467, 152, 381, 149, 467, 152, 0.4285262433334288, 0.4858156165734796, 0.3783166508489868, 0.5548434370788046, 429, 175], [384, 151, 467, 152, 381, 149, 468, 152, 0.44221727312706577, 0.5184046363637305, 0.37757381195082157, 0.46153846153846156, 429, 175], [384, 151, 467, 152, 382, 150, 468, 152, 0.45671801896473063, 0.519771294194971, 0.4657704893618, 0.45454545454545453, 429, 174], [383, 151, 467, 153, 378, 150, 468, 152, 0.35884374397479657, 0.519771294194971, 0.5454545454545454, 0.45454545454545453, 429, 174], [383, 151, 468, 152, 381, 150, 468, 152, 0.43624788026933237, 0.5045695680749487, 0.4662774640435375, 0.5, 429, 176], [384, 151, 468, 153, 380, 150, 468, 153, 0.3991233701556477, 0.5008583595328244, 0.4564354645876385, 0.5086064839889041, 428, 174], [383, 151, 468, 152, 381, 150, 468, 152, 0.4443256698645686, 0.5044989332028896, 0.4657704893618, 0.5086064839889041, 429, 175], [384, 151, 468, 152, 383, 150, 468, 152, 0.49508780571540056, 0.48978280593809076, 0.4657704893618, 0.5086064839889041, 431, 174], [383, 152, 468, 153, 380, 150, 468, 153, 0.42607085790564525, 0.5008583595328244, 0.4165977904505309, 0.5, 429, 174], [384, 151, 468, 153, 382, 150, 468, 153, 0.4443256698645686, 0.5008583595328244, 0.4269562819149833, 0.5055694567754828, 429, 175], [384, 152, 468, 153, 382, 150, 468, 153, 0.4540082753687489, 0.5045695680749487, 0.36363636363636365, 0.5055694567754828, 430, 175], [383, 151, 468, 153, 381, 150, 468, 153, 0.4443256698645686, 0.5008583595328244, 0.4657704893618, 0.5510885614184009, 429, 175], [384, 151, 467, 153, 381, 150, 467, 152, 0.43927638977341305, 0.48978280593809076, 0.41607725523664746, 0.4657704893618, 429, 175], [384, 151, 467, 153, 382, 150, 468, 152, 0.45671801896473063, 0.5153442952066594, 0.45454545454545453, 0.4622979885968386, 429, 175], [384, 152, 468, 152, 382, 150, 468, 152, 0.4443256698645686, 0.5044989332028896, 0.37757381195082157, 0.4657704893618, 429, 175], [385, 151, 468, 152, 384, 150, 468, 152, 0.49508780571540056, 0.5050727546468557, 0.4153311931459037, 0.4622979885968386, 429, 175], [384, 152, 468, 153, 382, 150, 469, 153, 0.468143930427085, 0.519771294194971, 0.36363636363636365, 0.5, 430, 174], [384, 151, 467, 152, 383, 150, 467, 152, 0.48652624300156944, 0.48978280593809076, 0.4657704893618, 0.4657704893618, 429, 174], [384, 151, 468, 152, 381, 150, 468, 152, 0.43129127744160395, 0.5044989332028896, 0.4269562819149833, 0.5086064839889041, 429, 175], [384, 152, 468, 152, 383, 150, 468, 152, 0.48222624622533034, 0.5044989332028896, 0.36363636363636365, 0.4622979885968386, 429, 174], [385, 151, 469, 153, 383, 150, 469, 153, 0.45671801896473063, 0.5008583595328244, 0.36363636363636365, 0.5510885614184009, 429, 175], [384, 152, 468, 153, 382, 150, 468, 153, 0.4540082753687489, 0.5008583595328244, 0.36363636363636365, 0.5548434370788046, 429, 174], [384, 151, 468, 153, 382, 150, 468, 153, 0.44297291111203796, 0.4852035162160995, 0.45454545454545453, 0.5548434370788046, 430, 174], [384, 151, 467, 153, 382, 151, 467, 153, 0.4489988864128729, 0.48978280593809076, 0.45454545454545453, 0.51234753829798, 429, 174], [384, 151, 468, 153, 382, 150, 468, 153, 0.4443256698645686, 0.5044989332028896, 0.4153311931459037, 0.45454545454545453, 429, 175], [384, 152, 468, 153, 382, 150, 468, 152, 0.4540082753687489, 0.48978280593809076, 0.37757381195082157, 0.4269562819149833, 430, 174], [384, 151, 468, 153, 382, 150, 469, 153, 0.4540082753687489, 0.5198624075829533, 0.42413793103448294, 0.5, 430, 174], [385, 151, 468, 153, 383, 150, 468, 153, 0.45671801896473063, 0.4852035162160995, 0.4153311931459037, 0.5548434370788046, 430, 175], [384, 151, 468, 153, 382, 150, 468, 153, 0.44297291111203796, 0.4858156165734796, 0.4153311931459037, 0.5548434370788046, 431, 174], [384, 152, 468, 153, 382, 150, 468, 153, 0.4540082753687489, 0.5002578126610004, 0.36251384241796686, 0.5055694567754828, 430, 175], [384, 152, 468, 153, 383, 150, 468, 152, 0.4802840391051078, 0.48978280593809076, 0.37757381195082157, 0.4657704893618, 430, 175], [385, 151, 468, 153, 383, 150, 468, 153, 0.45671801896473063, 0.4858156165734796, 0.4, 0.51234753829798, 431, 175], [384, 151, 469, 152, 383, 150, 469, 152, 0.47188055861699557, 0.48978280593809076, 0.45454545454545453, 0.5055694567754828, 430, 175], [385, 152, 468, 152, 383, 150, 468, 152, 0.4660494893603316, 0.4858156165734796, 0.36363636363636365, 0.5086064839889041, 430, 175], [385, 151, 469, 152, 383, 150, 469, 152, 0.4580896913044749, 0.5044989332028896, 0.45454545454545453, 0.4622979885968386, 431, 175], [384, 152, 469, 153, 383, 150, 469, 152, 0.47188055861699557, 0.5044989332028896, 0.36363636363636365, 0.4622979885968386, 431, 176], [384, 151, 469, 152, 383, 150, 469, 152, 0.47188055861699557, 0.4852035162160995, 0.4622979885968386, 0.4657704893618, 430, 176], [385, 151, 469, 153, 383, 150, 469, 153, 0.4489988864128729, 0.5009680404748922, 0.45454545454545453, 0.5510885614184009, 431, 175], [385, 151, 469, 152, 383, 150, 469, 152, 0.45671801896473063, 0.5044989332028896, 0.4166666666666667, 0.4622979885968386, 431, 174], [384, 151, 468, 153, 383, 150, 469, 152, 0.47188055861699557, 0.5153442952066594, 0.45454545454545453, 0.4622979885968386, 430, 175], [385, 151, 468, 152, 383, 150, 468, 152, 0.45671801896473063, 0.4852035162160995, 0.45454545454545453, 0.49250291764762877, 431, 175], [384, 151, 469, 153, 383, 150, 469, 152, 0.46493399810154884, 0.4852035162160995, 0.4622979885968386, 0.4657704893618, 431, 175], [385, 151, 469, 152, 383, 150, 469, 152, 0.4489988864128729, 0.4858156165734796, 0.4531423030224586, 0.5086064839889041, 430, 174]], [1910, 1070]], [[[385, 152, 469, 153, 384, 150, 469, 153, 0.49508780571540056, 0.4852035162160995, 0.37757381195082157, 0.4622979885968386, 430, 175], [385, 151, 469, 152, 384, 150, 469, 152, 0.47134199850122516, 0.5050727546468557, 0.4153311931459037, 0.4622979885968386, 431, 175], [385, 151, 470, 153, 385, 150, 470, 152, 0.500948124580496, 0.5002892548966168, 0.37757381195082157, 0.4657704893618, 430, 175], [386, 152, 470, 153, 388, 150, 470, 153, 0.5835094814032689, 0.5002892548966168, 0.4745593867686614, 0.51234753829798, 431, 175], [386, 151, 470, 153, 386, 150, 470, 152, 0.516499408748486, 0.5050727546468557, 0.4662774640435375, 0.4657704893618, 432, 175], [385, 150, 470, 153, 385, 150, 471, 153, 0.500948124580496, 0.5321011673151751, 0.51234753829798, 0.5079748296964495, 431, 175], [385, 151, 470, 153, 385, 150, 471, 152, 0.5023670927728233, 0.519771294194971, 0.4269562819149833, 0.4622979885968386, 431, 175], [385, 151, 469, 153, 385, 150, 470, 153, 0.500948124580496, 0.5153442952066594, 0.4657704893618, 0.5548434370788046, 431, 174], [385, 151, 470, 154, 385, 150, 470, 154, 0.5023670927728233, 0.498358971328439, 0.4657704893618, 0.5548434370788046, 430, 175], [386, 151, 470, 154, 386, 150, 471, 153, 0.516499408748486, 0.5153442952066594, 0.49792959773196926, 0.4622979885968386, 431, 175], [385, 151, 470, 153, 385, 150, 470, 152, 0.5023670927728233, 0.5050727546468557, 0.4269562819149833, 0.4657704893618, 431, 174], [386, 150, 470, 153, 386, 150, 471, 152, 0.49334710329079784, 0.5153442952066594, 0.51234753829798, 0.4657704893618, 432, 174], [387, 150, 471, 153, 386, 150, 471, 152, 0.47943080469467586, 0.4992449920932383, 0.5548434370788046, 0.4622979885968386, 432, 174], [387, 151, 471, 153, 388, 150, 472, 153, 0.548172237443332, 0.531365873522194, 0.5017331074496789, 0.5079748296964495, 432, 174], [386, 151, 471, 153, 386, 150, 471, 152, 0.516499408748486, 0.5002892548966168, 0.4662774640435375, 0.4657704893618, 431, 175], [386, 150, 471, 152, 386, 150, 471, 152, 0.49453902719952175, 0.5002892548966168, 0.5548434370788046, 0.51234753829798, 432, 174], [386, 150, 471, 153, 386, 149, 471, 152, 0.5023670927728233, 0.5002892548966168, 0.37757381195082157, 0.4657704893618, 432, 174], [387, 150, 471, 153, 387, 150, 471, 152, 0.5099602811982146, 0.5002892548966168, 0.4657704893618, 0.4657704893618, 432, 174], [387, 150, 470, 153, 387, 149, 471, 152, 0.516499408748486, 0.5153442952066594, 0.4153311931459037, 0.4622979885968386, 432, 175], [387, 151, 471, 153, 390, 150, 471, 153, 0.588872915892118, 0.5009680404748922, 0.6098367211363063, 0.4657704893618, 433, 175], [387, 150, 471, 153, 386, 150, 471, 152, 0.47943080469467586, 0.4992449920932383, 0.51234753829798, 0.49250291764762877, 433, 175], [387, 150, 471, 153, 387, 150, 471, 153, 0.5099602811982146, 0.5002892548966168, 0.49792959773196926, 0.5548434370788046, 433, 175], [386, 151, 470, 153, 386, 150, 471, 153, 0.5023670927728233, 0.5153442952066594, 0.4269562819149833, 0.5548434370788046, 431, 175], [387, 151, 471, 153, 387, 150, 471, 153, 0.5180258136473481, 0.5002892548966168, 0.49792959773196926, 0.49250291764762877, 432, 175], [386, 150, 471, 153, 386, 150, 471, 153, 0.49453902719952175, 0.5009680404748922, 0.4657704893618, 0.5763408469261293, 432, 175], [387, 151, 470, 153, 388, 150, 471, 153, 0.548172237443332, 0.5153442952066594, 0.49792959773196926, 0.5510885614184009, 432, 175], [386, 150, 471, 153, 386, 150, 472, 153, 0.49453902719952175, 0.531365873522194, 0.4657704893618, 0.5, 432, 175], [387, 150, 470, 153, 387, 150, 471, 152, 0.49453902719952175, 0.519771294194971, 0.4662774640435375, 0.4622979885968386, 433, 175], [387, 151, 472, 153, 388, 150, 472, 153, 0.548172237443332, 0.5009680404748922, 0.49994960778043074, 0.5079748296964495, 432, 175], [387, 150, 471, 153, 387, 150, 472, 153, 0.500948124580496, 0.5153442952066594, 0.4657704893618, 0.5510885614184009, 433, 176], [387, 151, 471, 154, 388, 150, 471, 153, 0.548172237443332, 0.5050727546468557, 0.5473452081269224, 0.4657704893618, 433, 176], [387, 151, 471, 153, 388, 150, 471, 153, 0.5466103833371705, 0.5002892548966168, 0.5473452081269224, 0.5548434370788046, 432, 175], [387, 151, 471, 154, 389, 150, 471, 153, 0.5594631786418255, 0.5002892548966168, 0.5473452081269224, 0.4657704893618, 432, 175], [387, 150, 472, 153, 388, 149, 472, 153, 0.5560604330431561, 0.5009680404748922, 0.5220153254455275, 0.5548434370788046, 433, 174], [387, 150, 471, 153, 386, 150, 471, 153, 0.47943080469467586, 0.5002892548966168, 0.4981339553836166, 0.5763408469261293, 433, 176], [387, 151, 471, 154, 389, 150, 471, 153, 0.5784345733284396, 0.5002892548966168, 0.4745593867686614, 0.4622979885968386, 432, 175], [387, 150, 471, 153, 387, 150, 472, 153, 0.5099602811982146, 0.5153442952066594, 0.5477225575051662, 0.5548434370788046, 433, 174], [387, 151, 470, 154, 388, 150, 471, 153, 0.5301493051388059, 0.5153442952066594, 0.45825756949558405, 0.4622979885968386, 433, 175], [387, 151, 471, 154, 389, 150, 471, 153, 0.5594631786418255, 0.5002892548966168, 0.5220153254455275, 0.49250291764762877, 433, 175], [386, 151, 471, 153, 387, 150, 472, 153, 0.5316007131665695, 0.516007937348689, 0.4564354645876385, 0.5055694567754828, 433, 176], [387, 151, 471, 154, 388, 151, 472, 153, 0.5229992827148148, 0.5153442952066594, 0.49792959773196926, 0.4622979885968386, 434, 175], [387, 151, 471, 154, 387, 150, 471, 153, 0.500948124580496, 0.5002578126610004, 0.49250291764762877, 0.49250291764762877, 433, 175], [388, 151, 471, 153, 389, 150, 472, 153, 0.5466103833371705, 0.5153442952066594, 0.5473452081269224, 0.5055694567754828, 433, 176], [387, 151, 471, 154, 389, 150, 472, 153, 0.5609467210018348, 0.5153442952066594, 0.5017331074496789, 0.4657704893618, 433, 177], [387, 151, 471, 154, 389, 150, 471, 153, 0.5641247478948378, 0.5002892548966168, 0.5473452081269224, 0.4657704893618, 431, 177], [387, 151, 472, 154, 389, 150, 472, 153, 0.5579710045270924, 0.5002892548966168, 0.5473452081269224, 0.4622979885968386, 433, 178], [386, 150, 472, 154, 387, 150, 473, 153, 0.5301493051388059, 0.5153442952066594, 0.5477225575051662, 0.4622979885968386, 433, 178], [387, 150, 470, 153, 387, 150, 471, 153, 0.5099602811982146, 0.5153442952066594, 0.5477225575051662, 0.51234753829798, 432, 177], [387, 150, 471, 153, 387, 150, 472, 153, 0.49334710329079784, 0.5153442952066594, 0.51234753829798, 0.4563404205382355, 434, 175], [387, 150, 471, 154, 387, 150, 472, 153, 0.5099602811982146, 0.519771294194971, 0.5477225575051662, 0.4622979885968386, 433, 176], [387, 150, 471, 154, 387, 150, 472, 154, 0.49453902719952175, 0.5123331017029757, 0.5127766646915316, 0.5079748296964495, 434, 176], [387, 150, 472, 154, 388, 150, 472, 153, 0.548172237443332, 0.4992449920932383, 0.5473452081269224, 0.4622979885968386, 433, 177], [387, 150, 471, 153, 387, 150, 472, 153, 0.5108682101334941, 0.516007937348689, 0.45825756949558405, 0.5, 432, 176], [387, 151, 471, 154, 387, 151, 472, 154, 0.5099602811982146, 0.516007937348689, 0.49792959773196926, 0.5079748296964495, 434, 176], [386, 151, 471, 154, 387, 150, 472, 153, 0.5301493051388059, 0.5153442952066594, 0.45825756949558405, 0.4622979885968386, 433, 177], [387, 152, 471, 154, 387, 151, 471, 154, 0.5099602811982146, 0.498358971328439, 0.4657704893618, 0.51234753829798, 433, 177], [387, 151, 471, 154, 387, 151, 472, 154, 0.5099602811982146, 0.5135612767587864, 0.5477225575051662, 0.5079748296964495, 434, 177], [387, 151, 471, 154, 387, 150, 471, 153, 0.495387355280964, 0.5050727546468557, 0.4269562819149833, 0.4657704893618, 433, 177], [387, 151, 471, 154, 389, 150, 472, 154, 0.5784345733284396, 0.5123331017029757, 0.4774018469959915, 0.51234753829798, 433, 176], [386, 150, 471, 153, 386, 150, 471, 153, 0.49453902719952175, 0.5002578126610004, 0.4657704893618, 0.528880539863113, 433, 176], [387, 150, 470, 154, 387, 150, 471, 153, 0.49453902719952175, 0.5153442952066594, 0.4657704893618, 0.49250291764762877, 434, 176], [387, 151, 471, 154, 387, 150, 472, 153, 0.5099602811982146, 0.5153442952066594, 0.4657704893618, 0.4622979885968386, 434, 175], [387, 150, 471, 154, 389, 150, 472, 153, 0.5579710045270924, 0.5153442952066594, 0.5473452081269224, 0.4622979885968386, 433, 176]], [960, 1070]], [[[387, 150, 471, 154, 388, 150, 472, 153, 0.5263738586799914, 0.516007937348689, 0.49792959773196926, 0.4622979885968386, 433, 175], [388, 150, 471, 153, 389, 150, 471, 153, 0.540570786973115, 0.5009680404748922, 0.6020797289396147, 0.5763408469261293, 434, 176], [388, 150, 472, 154, 388, 150, 473, 153, 0.5099602811982146, 0.531365873522194, 0.45825756949558405, 0.4563404205382355, 434, 175], [388, 151, 472, 154, 392, 150, 473, 154, 0.6375744928495679, 0.5295064070364663, 0.687386354243376, 0.5079748296964495, 434, 176], [387, 149, 472, 152, 391, 149, 472, 152, 0.6199119974687319, 0.5009680404748922, 0.6, 0.5477225575051662, 434, 176], [389, 149, 472, 153, 393, 149, 473, 153, 0.6392410729262346, 0.5129321519219104, 0.687386354243376, 0.5079748296964495, 433, 176], [389, 150, 472, 153, 393, 149, 472, 153, 0.6392410729262346, 0.498358971328439, 0.687386354243376, 0.5409647660885145, 433, 175], [389, 150, 472, 153, 393, 149, 473, 153, 0.6392410729262346, 0.5295064070364663, 0.5486295255961151, 0.5079748296964495, 434, 176], [389, 150, 472, 154, 393, 149, 473, 153, 0.6392410729262346, 0.531365873522194, 0.687386354243376, 0.4657704893618, 434, 176], [388, 149, 473, 153, 392, 149, 473, 153, 0.6199119974687319, 0.497092136043185, 0.6, 0.5409647660885145, 433, 176], [389, 150, 472, 154, 393, 149, 473, 153, 0.6392410729262346, 0.531365873522194, 0.6248966856757964, 0.41133817975922754, 435, 175], [389, 150, 472, 153, 393, 149, 473, 153, 0.6392410729262346, 0.5143245139024779, 0.687386354243376, 0.5079748296964495, 434, 176], [388, 150, 472, 153, 389, 150, 473, 153, 0.5377090819016022, 0.5295064070364663, 0.5477225575051662, 0.5079748296964495, 435, 176], [388, 150, 473, 154, 390, 149, 474, 153, 0.5609467210018348, 0.528160394545884, 0.4165977904505309, 0.45454545454545453, 433, 175], [389, 150, 473, 154, 393, 149, 474, 153, 0.6392410729262346, 0.528160394545884, 0.687386354243376, 0.4622979885968386, 434, 176], [389, 150, 472, 153, 393, 149, 473, 153, 0.6392410729262346, 0.5295064070364663, 0.687386354243376, 0.51234753829798, 435, 176], [389, 150, 473, 153, 393, 149, 473, 153, 0.6392410729262346, 0.497092136043185, 0.6035544813516107, 0.51234753829798, 434, 176], [389, 150, 473, 153, 393, 149, 474, 153, 0.6392410729262346, 0.5163397198986234, 0.687386354243376, 0.5079748296964495, 435, 175], [389, 150, 473, 153, 393, 149, 473, 153, 0.6392410729262346, 0.498358971328439, 0.687386354243376, 0.51234753829798, 435, 176], [389, 150, 473, 153, 393, 149, 474, 153, 0.6392410729262346, 0.5295064070364663, 0.687386354243376, 0.5079748296964495, 434, 176], [388, 149, 474, 153, 389, 149, 474, 153, 0.525082528823135, 0.5009680404748922, 0.41607725523664746, 0.5079748296964495, 435, 176], [389, 150, 473, 154, 393, 149, 474, 153, 0.6283869763430427, 0.5163397198986234, 0.6035544813516107, 0.41133817975922754, 434, 176], [389, 150, 472, 154, 392, 149, 473, 153, 0.6087955360866831, 0.5163397198986234, 0.5454545454545454, 0.41133817975922754, 435, 176], [389, 150, 474, 153, 393, 149, 474, 153, 0.6392410729262346, 0.5002892548966168, 0.687386354243376, 0.51234753829798, 434, 176], [389, 150, 473, 153, 392, 149, 474, 153, 0.6087955360866831, 0.5295064070364663, 0.5454545454545454, 0.5079748296964495, 435, 176], [388, 150, 472, 153, 389, 149, 473, 152, 0.5316007131665695, 0.531365873522194, 0.4153311931459037, 0.41133817975922754, 435, 175], [388, 150, 472, 153, 390, 150, 473, 153, 0.553972158835549, 0.5295064070364663, 0.5477225575051662, 0.5079748296964495, 434, 176], [388, 150, 473, 153, 390, 149, 474, 153, 0.5609467210018348, 0.5295064070364663, 0.45825756949558405, 0.5079748296964495, 435, 176], [389, 150, 473, 153, 393, 149, 474, 153, 0.6392410729262346, 0.5123331017029757, 0.687386354243376, 0.51234753829798, 434, 176], [389, 150, 473, 153, 393, 149, 473, 153, 0.6199119974687319, 0.498358971328439, 0.6, 0.5409647660885145, 435, 176], [389, 150, 473, 153, 393, 149, 474, 153, 0.6199119974687319, 0.5295064070364663, 0.6, 0.5079748296964495, 435, 176], [389, 150, 472, 153, 393, 149, 473, 152, 0.6392410729262346, 0.531365873522194, 0.6035544813516107, 0.41133817975922754, 435, 176], [389, 150, 473, 153, 393, 149, 474, 153, 0.6199119974687319, 0.5129321519219104, 0.6, 0.51234753829798, 435, 176], [389, 150, 473, 153, 394, 149, 474, 153, 0.6479277255968203, 0.5295064070364663, 0.6909444088066496, 0.5079748296964495, 435, 176], [389, 150, 473, 154, 393, 149, 474, 153, 0.6199119974687319, 0.528160394545884, 0.5454545454545454, 0.41133817975922754, 435, 176], [389, 150, 474, 154, 393, 149, 475, 154, 0.6199119974687319, 0.5295064070364663, 0.5486295255961151, 0.5079748296964495, 436, 176], [390, 150, 473, 154, 394, 149, 474, 153, 0.6327707406573132, 0.5163397198986234, 0.687386354243376, 0.49250291764762877, 435, 176], [389, 151, 474, 154, 394, 150, 474, 154, 0.6435248495334164, 0.4973450220982585, 0.6248966856757964, 0.5409647660885145, 435, 175], [389, 150, 474, 154, 393, 149, 475, 153, 0.6199119974687319, 0.531365873522194, 0.5486295255961151, 0.4622979885968386, 435, 175], [390, 150, 474, 154, 393, 149, 475, 153, 0.6087955360866831, 0.531365873522194, 0.5454545454545454, 0.4622979885968386, 435, 176], [390, 150, 473, 154, 393, 149, 474, 153, 0.6087955360866831, 0.5163397198986234, 0.6, 0.4519886023965675, 435, 176], [390, 150, 473, 153, 394, 149, 474, 153, 0.6392410729262346, 0.5321011673151751, 0.6248966856757964, 0.5079748296964495, 435, 176], [389, 150, 474, 154, 393, 149, 475, 153, 0.6210273191490666, 0.5153442952066594, 0.6248966856757964, 0.4622979885968386, 434, 176], [390, 150, 473, 154, 394, 149, 474, 153, 0.6392410729262346, 0.5163397198986234, 0.687386354243376, 0.41133817975922754, 436, 176], [389, 151, 474, 154, 395, 150, 475, 154, 0.6775522867702394, 0.5295064070364663, 0.7100226978096958, 0.5079748296964495, 435, 176], [389, 150, 474, 154, 393, 149, 475, 153, 0.6199119974687319, 0.531365873522194, 0.5454545454545454, 0.4622979885968386, 436, 176], [390, 150, 473, 154, 394, 150, 474, 154, 0.6327707406573132, 0.5163397198986234, 0.613509669431015, 0.5409647660885145, 436, 176], [389, 150, 474, 154, 393, 149, 475, 154, 0.6199119974687319, 0.5295064070364663, 0.5454545454545454, 0.5079748296964495, 436, 176], [390, 150, 474, 154, 395, 150, 475, 154, 0.6680585132841987, 0.528160394545884, 0.7810249675906655, 0.5079748296964495, 436, 176], [390, 150, 473, 154, 393, 149, 474, 154, 0.6087955360866831, 0.5295064070364663, 0.6, 0.5079748296964495, 435, 176], [389, 149, 473, 153, 390, 149, 474, 153, 0.525082528823135, 0.516007937348689, 0.4153311931459037, 0.5409647660885145, 435, 176], [389, 149, 474, 154, 393, 149, 475, 153, 0.6199119974687319, 0.531365873522194, 0.6035544813516107, 0.4622979885968386, 435, 176], [389, 150, 473, 154, 393, 149, 474, 154, 0.6199119974687319, 0.5143245139024779, 0.6035544813516107, 0.51234753829798, 435, 176], [390, 150, 474, 155, 394, 149, 475, 154, 0.6199119974687319, 0.531365873522194, 0.6248966856757964, 0.49250291764762877, 436, 176], [390, 150, 474, 154, 394, 149, 475, 154, 0.6199119974687319, 0.5143245139024779, 0.5454545454545454, 0.5079748296964495, 436, 176], [389, 150, 474, 154, 393, 149, 475, 154, 0.6261851557256201, 0.5123331017029757, 0.5454545454545454, 0.5079748296964495, 436, 176], [390, 150, 474, 154, 394, 149, 475, 154, 0.6199119974687319, 0.528160394545884, 0.5486295255961151, 0.5409647660885145, 436, 176], [390, 151, 474, 155, 396, 150, 475, 154, 0.6791624829964524, 0.531365873522194, 0.7100226978096958, 0.4622979885968386, 437, 176], [391, 149, 474, 154, 394, 149, 475, 154, 0.6029306681742106, 0.5129321519219104, 0.613509669431015, 0.5409647660885145, 437, 175], [391, 150, 475, 154, 396, 149, 476, 154, 0.6444294035799011, 0.531365873522194, 0.6909444088066496, 0.5, 437, 175], [390, 149, 475, 153, 394, 149, 476, 153, 0.6136306617238575, 0.5295064070364663, 0.7637626158259734, 0.5079748296964495, 437, 175], [391, 150, 475, 154, 395, 149, 476, 153, 0.6392410729262346, 0.531365873522194, 0.687386354243376, 0.4622979885968386, 437, 176], [391, 150, 475, 155, 395, 149, 476, 154, 0.6199119974687319, 0.531365873522194, 0.5486295255961151, 0.4622979885968386, 438, 176]], [10, 1070]], [[[392, 149, 475, 154, 395, 148, 476, 154, 0.6087955360866831, 0.5143245139024779, 0.6, 0.5079748296964495, 437, 176], [391, 149, 475, 153, 395, 148, 476, 153, 0.6199119974687319, 0.5295064070364663, 0.6, 0.5079748296964495, 438, 175], [392, 149, 475, 154, 396, 148, 476, 153, 0.6199119974687319, 0.5153442952066594, 0.6818181818181818, 0.49250291764762877, 437, 175], [392, 147, 476, 152, 396, 147, 476, 151, 0.6392410729262346, 0.5050727546468557, 0.6818181818181818, 0.4657704893618, 437, 175], [392, 148, 477, 152, 396, 147, 478, 152, 0.6314973692230557, 0.531365873522194, 0.625, 0.5055694567754828, 439, 176], [392, 148, 477, 153, 398, 147, 483, 152, 0.6803013430498074, 0.6868452074336234, 0.7739239842086127, 0.613509669431015, 437, 176], [391, 147, 476, 152, 395, 146, 477, 152, 0.6292896865847027, 0.5153442952066594, 0.5189238931870598, 0.528880539863113, 438, 176], [392, 147, 476, 152, 398, 147, 477, 152, 0.6743700934626633, 0.5153442952066594, 0.6961088090582125, 0.5086064839889041, 438, 176], [392, 147, 477, 152, 396, 146, 478, 151, 0.6217016324475083, 0.5354794734092339, 0.5769230769230769, 0.42413793103448294, 439, 175], [392, 148, 476, 152, 396, 147, 477, 151, 0.6314973692230557, 0.538982920697943, 0.625, 0.4269562819149833, 439, 176], [392, 148, 476, 152, 398, 147, 478, 152, 0.6891396772858813, 0.5454926757063798, 0.7739239842086127, 0.5086064839889041, 439, 176], [392, 149, 477, 153, 398, 148, 478, 152, 0.6791624829964524, 0.5153442952066594, 0.7367594111769781, 0.4622979885968386, 436, 176], [392, 148, 475, 152, 398, 148, 476, 152, 0.6836258411276153, 0.516007937348689, 0.7739239842086127, 0.5335936864527374, 438, 176], [392, 148, 476, 152, 398, 148, 477, 152, 0.6836258411276153, 0.5153442952066594, 0.8217951218048342, 0.528880539863113, 439, 176], [392, 148, 477, 152, 397, 148, 478, 152, 0.6545356789490555, 0.5153442952066594, 0.75, 0.5086064839889041, 438, 176], [392, 148, 476, 152, 397, 148, 477, 151, 0.650609856896703, 0.5359957487860989, 0.7542507365610285, 0.45198728844731345, 438, 176], [392, 148, 475, 152, 396, 147, 476, 151, 0.6210273191490666, 0.519771294194971, 0.6818181818181818, 0.49250291764762877, 438, 176], [392, 148, 476, 152, 398, 148, 477, 151, 0.6836258411276153, 0.5193143890554585, 0.8261481759110993, 0.45198728844731345, 438, 176], [392, 147, 477, 152, 397, 147, 478, 151, 0.6602924800189307, 0.5354794734092339, 0.6972166887783963, 0.4269562819149833, 438, 176], [392, 148, 476, 153, 398, 148, 477, 152, 0.6743700934626633, 0.531365873522194, 0.7739239842086127, 0.49250291764762877, 439, 176], [392, 148, 476, 152, 397, 148, 477, 152, 0.6444294035799011, 0.531365873522194, 0.7405046966140669, 0.5055694567754828, 438, 175], [392, 148, 477, 152, 398, 147, 479, 152, 0.6891396772858813, 0.5497896869204211, 0.7739239842086127, 0.5055694567754828, 439, 176], [392, 147, 477, 152, 396, 146, 478, 152, 0.6321316085990718, 0.531365873522194, 0.625, 0.528880539863113, 439, 176], [392, 147, 476, 152, 396, 146, 477, 152, 0.6391562885911979, 0.5153442952066594, 0.5769230769230769, 0.528880539863113, 439, 176], [392, 147, 476, 152, 396, 146, 477, 151, 0.6391562885911979, 0.519771294194971, 0.5769230769230769, 0.49250291764762877, 439, 176], [392, 148, 476, 152, 398, 147, 477, 151, 0.6803013430498074, 0.5193143890554585, 0.7739239842086127, 0.4564354645876385, 439, 176], [392, 148, 477, 152, 398, 148, 478, 152, 0.6798681336900347, 0.531365873522194, 0.8217951218048342, 0.5055694567754828, 439, 176], [392, 148, 477, 152, 398, 147, 478, 152, 0.6891396772858813, 0.5153442952066594, 0.7008488143972943, 0.528880539863113, 439, 176], [392, 148, 476, 153, 398, 148, 477, 152, 0.6743700934626633, 0.531365873522194, 0.7542507365610285, 0.4657704893618, 438, 176], [392, 148, 476, 152, 398, 148, 478, 151, 0.6836258411276153, 0.5492822676777733, 0.8217951218048342, 0.4269562819149833, 438, 176], [392, 147, 477, 152, 396, 146, 478, 151, 0.6292896865847027, 0.5193143890554585, 0.5769230769230769, 0.4269562819149833, 438, 176], [391, 147, 477, 152, 395, 146, 478, 151, 0.6292896865847027, 0.5331854160711778, 0.5189238931870598, 0.4269562819149833, 439, 176], [392, 148, 476, 153, 398, 147, 478, 153, 0.6891396772858813, 0.5454926757063798, 0.7143913700387196, 0.5055694567754828, 437, 176], [392, 147, 477, 152, 398, 147, 478, 152, 0.6803013430498074, 0.531365873522194, 0.7739239842086127, 0.5086064839889041, 439, 176], [392, 148, 476, 152, 398, 147, 478, 151, 0.6840422007648691, 0.5492822676777733, 0.7739239842086127, 0.4269562819149833, 438, 176], [392, 148, 477, 152, 398, 147, 478, 152, 0.6840422007648691, 0.531365873522194, 0.7739239842086127, 0.5086064839889041, 438, 176], [392, 147, 476, 152, 396, 146, 478, 152, 0.6321316085990718, 0.5454926757063798, 0.5769230769230769, 0.5055694567754828, 439, 176], [392, 147, 477, 152, 396, 146, 478, 152, 0.6391562885911979, 0.531365873522194, 0.5769230769230769, 0.5086064839889041, 439, 176], [392, 147, 477, 152, 396, 146, 478, 151, 0.6217016324475083, 0.5359957487860989, 0.5769230769230769, 0.4657704893618, 439, 176], [393, 147, 477, 152, 398, 147, 478, 152, 0.6602924800189307, 0.516007937348689, 0.6923076923076923, 0.5335936864527374, 440, 176], [392, 148, 477, 152, 398, 147, 478, 152, 0.6694499722205705, 0.5153442952066594, 0.6468515710866761, 0.528880539863113, 439, 175], [392, 147, 477, 152, 396, 146, 478, 151, 0.6391562885911979, 0.5193143890554585, 0.5769230769230769, 0.46948290829745, 438, 176], [392, 147, 477, 152, 396, 146, 478, 151, 0.6279588659660291, 0.5354794734092339, 0.5769230769230769, 0.4269562819149833, 439, 176], [393, 148, 477, 153, 398, 147, 478, 152, 0.6602924800189307, 0.528534548871535, 0.6972166887783963, 0.4657704893618, 439, 176], [392, 148, 476, 152, 398, 147, 477, 152, 0.6803013430498074, 0.5143267959072987, 0.6972166887783963, 0.528880539863113, 438, 176], [393, 147, 477, 152, 396, 146, 478, 152, 0.6034032171729237, 0.5153442952066594, 0.5189238931870598, 0.528880539863113, 439, 175], [393, 148, 477, 153, 399, 148, 478, 152, 0.6836258411276153, 0.5153442952066594, 0.8217951218048342, 0.4657704893618, 438, 176], [393, 147, 477, 153, 398, 147, 479, 152, 0.6602924800189307, 0.5492822676777733, 0.7008488143972943, 0.46698065726114957, 438, 175], [392, 148, 476, 153, 397, 147, 477, 153, 0.6506336531389058, 0.5153442952066594, 0.6285422804675236, 0.528880539863113, 438, 176], [393, 148, 477, 153, 398, 147, 478, 152, 0.6602924800189307, 0.528534548871535, 0.7008488143972943, 0.42413793103448294, 439, 177], [393, 147, 477, 153, 398, 147, 479, 152, 0.6602924800189307, 0.5492822676777733, 0.6972166887783963, 0.4155851997653086, 439, 175], [392, 148, 477, 153, 398, 148, 479, 152, 0.6640936742382548, 0.5492822676777733, 0.8217951218048342, 0.42413793103448294, 440, 176], [392, 148, 477, 152, 398, 148, 478, 152, 0.6640936742382548, 0.5153442952066594, 0.8217951218048342, 0.528880539863113, 438, 176], [393, 148, 477, 152, 399, 148, 478, 152, 0.6836258411276153, 0.519771294194971, 0.8217951218048342, 0.5335936864527374, 440, 176], [392, 148, 476, 153, 396, 147, 477, 152, 0.6314973692230557, 0.5193143890554585, 0.625, 0.45198728844731345, 439, 176], [392, 148, 477, 153, 398, 148, 478, 152, 0.6743700934626633, 0.531365873522194, 0.75, 0.4622979885968386, 439, 177], [393, 147, 477, 153, 397, 147, 478, 153, 0.6314973692230557, 0.5153442952066594, 0.6285422804675236, 0.5086064839889041, 439, 176], [393, 148, 478, 153, 399, 148, 479, 152, 0.6743700934626633, 0.5354794734092339, 0.8217951218048342, 0.45454545454545453, 439, 176], [393, 148, 478, 153, 398, 148, 479, 152, 0.664567822441773, 0.5354794734092339, 0.75, 0.4622979885968386, 439, 176], [393, 148, 478, 153, 397, 147, 479, 153, 0.6314973692230557, 0.5153442952066594, 0.625, 0.5086064839889041, 440, 176], [393, 148, 476, 153, 397, 147, 477, 152, 0.6314973692230557, 0.5153442952066594, 0.625, 0.49792959773196926, 440, 177], [393, 148, 478, 153, 397, 147, 480, 152, 0.6217016324475083, 0.5492822676777733, 0.5769230769230769, 0.4166666666666667, 440, 176], [393, 148, 477, 153, 397, 147, 478, 152, 0.6314973692230557, 0.5331854160711778, 0.625, 0.4657704893618, 440, 176]], [10, 540]]]
+        self.load(self.DUMMY_CALIBRATION_PATH)
@@ -0,0 +1,123 @@
+"""
+Backends reading and moving the mouse cursor.
+
+Every backend has position(), returning the (x, y) position of the cursor,
+move_to(x, y), and flush(), which sends the moves still pending for the
+backends coalescing them.
+"""
+
+
+class PyAutoGUICursor:
+    """
+    Moves the cursor with pyautogui, without the pause pyautogui makes after
+    every call by default.
+    """
+
+    def __init__(self, pause = False):
+        """
+        :param pause: Keep the pause of pyautogui.PAUSE seconds after each move
+        """
+        import pyautogui
+        self._pyautogui = pyautogui
+        self.pause = pause
+
+    def position(self):
+        return tuple(self._pyautogui.position())
+
+    def move_to(self, x, y):
+        self._pyautogui.moveTo(x, y, _pause=self.pause)
+
+    def flush(self):
+        pass
+
+
+class XTestCursor:
+    """
+    Moves the cursor with the XTest extension of the X server, through
+    python-xlib. Moves are coalesced: only the last position given to move_to
+    is sent on flush, and only if it differs from the last position sent.
+    The last position sent is forgotten whenever position() finds the pointer
+    elsewhere, moved by the user or warped by i3, so the next move is sent.
+    """
+
+    def __init__(self, display = None, coalesce = True):
+        """
+        :param display: Name of the X display, $DISPLAY if None
+        :param coalesce: Wait for flush to send the last move instead of
+            sending every move right away
+        """
+        try:
+            from Xlib import X, display as xdisplay
+            from Xlib.ext import xtest
+        except ImportError as error:
+            raise ImportError("XTestCursor needs python-xlib: pip install python-xlib") from error
+        self._motion_notify = X.MotionNotify
+        self._fake_input = xtest.fake_input
+        self._display = xdisplay.Display(display)
+        self._root = self._display.screen().root
+        self.coalesce = coalesce
+        self._pending = None
+        self._sent = None
+
+    def position(self):
+        pointer = self._root.query_pointer()
+        position = (pointer.root_x, pointer.root_y)
+        if position != self._sent:
+            self._sent = None
+        return position
+
+    def move_to(self, x, y):
+        self._pending = (int(x), int(y))
+        if not self.coalesce:
+            self.flush()
+
+    def flush(self):
+        if self._pending is None:
+            return
+        if self._pending != self._sent:
+            self._fake_input(self._display, self._motion_notify, x=self._pending[0], y=self._pending[1])
+            self._display.flush()
+            self._sent = self._pending
+        self._pending = None
+
+    def close(self):
+        self._display.close()
+
+
+class FakeCursor:
+    """
+    Cursor kept in memory, to run MouseControl without a display. Every move
+    is recorded in moves.
+    """
+
+    def __init__(self, position = (0, 0)):
+        self.x, self.y = position
+        self.moves = []
+
+    def position(self):
+        return self.x, self.y
+
+    def move_to(self, x, y):
+        self.x, self.y = int(x), int(y)
+        self.moves.append((self.x, self.y))
+
+    def move_by_user(self, x, y):
+        """Moves the cursor without recording it, like the user would"""
+        self.x, self.y = int(x), int(y)
+
+    def flush(self):
+        pass
+
+
+CURSORS = {
+    "pyautogui": PyAutoGUICursor,
+    "xtest": XTestCursor,
+    "fake": FakeCursor,
+}
+
+
+def create_cursor(name, **parameters):
+    """Returns a new cursor backend by its name in CURSORS"""
+    if name not in CURSORS:
+        raise ValueError("Unknown cursor {}, expected one of {}".format(name, tuple(CURSORS)))
+    return CURSORS[name](**parameters)
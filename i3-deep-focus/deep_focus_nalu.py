@@ -1,80 +1,185 @@
-import torch
-from progressbar import progressbar
-from torch.nn.parameter import Parameter
-from torch.nn import functional
-from torch.nn import init
-from torch.nn.modules import Module
-import torch.optim as optim
-import torch.utils.data
+import multiprocessing
+import queue
+import threading
+import traceback
+
 import numpy as np
 
-class DeepFocusNALU:
-    def __init__(self, calibration_data):
-        inputs  = np.array([np.array(calibration_data_line[0]) for calibration_data_line in calibration_data])
-        outputs = np.array([np.array(calibration_data_line[1]) for calibration_data_line in calibration_data])
+from . import nalu
+
+
+# Task discarding the samples trained on so far, for a new calibration
+RESET = "reset"
+
+
+def _train(tasks, results, epochs, update_epochs):
+    """Runs the training process, an error ends it and is sent back as its
+    traceback instead of weights"""
+    try:
+        _training(tasks, results, epochs, update_epochs)
+    except BaseException:
+        results.put(traceback.format_exc())
+        return
+    results.put(None)
 
-        dataset = torch.utils.data.TensorDataset(torch.Tensor(inputs), torch.Tensor(outputs))
+
+def _training(tasks, results, epochs, update_epochs):
+    """Trains the model in the training process: the first samples are trained
+    for `epochs` epochs, then every batch of new samples adds them to the
+    training set and trains for `update_epochs` more epochs. A RESET task
+    discards the samples and the model, the next samples are trained on by a
+    new model for `epochs` epochs. The weights are sent back after each
+    training."""
+    import torch
+    from torch.nn import functional
+    import torch.optim as optim
+    import torch.utils.data
+    from . import nalu_torch
+
+    crit = functional.mse_loss
+    model = opt = None
+    inputs = np.empty((0, 14), dtype=np.float32)
+    outputs = np.empty((0, 2), dtype=np.float32)
+
+    stop = False
+    while not stop:
+        # Train once with every task received while the previous training ran
+        batch = [tasks.get()]
+        while batch[-1] is not None:
+            try:
+                batch.append(tasks.get_nowait())
+            except queue.Empty:
+                break
+        if batch[-1] is None:
+            stop = True
+            batch.pop()
+
+        new_inputs, new_outputs = [], []
+        for task in batch:
+            if isinstance(task, str) and task == RESET:
+                inputs, outputs = inputs[:0], outputs[:0]
+                new_inputs, new_outputs = [], []
+                model = opt = None
+            else:
+                new_inputs.append(task[0])
+                new_outputs.append(task[1])
+        if not new_inputs:
+            continue
+
+        if model is None:
+            model = nalu_torch.NALU(14, 2)#.cuda()
+            opt = optim.Adam(model.parameters(), 1e-2)
+        first = len(inputs) == 0
+        inputs = np.concatenate([inputs] + new_inputs).astype(np.float32)
+        outputs = np.concatenate([outputs] + new_outputs).astype(np.float32)
+        dataset = torch.utils.data.TensorDataset(torch.from_numpy(inputs), torch.from_numpy(outputs))
         dataloader = torch.utils.data.DataLoader(dataset, batch_size=512, shuffle=True, num_workers=0)
+        nalu_torch.fit(model, dataloader, opt, crit, epochs if first else update_epochs)
+        results.put(nalu_torch.numpy_weights(model))
 
-        self.model = NALU(14, 2)#.cuda()
-        opt = optim.Adam(self.model.parameters(), 1e-2)
-        crit = functional.mse_loss
-        self.fit(self.model, dataloader, opt, crit)
 
-    def fit(self, m, dataloader, opt, crit):
+class DeepFocusNALU:
+    """
+    Trains the NALU model mapping gaze samples to screen coordinates in a
+    background process, so torch is never imported by the process moving the
+    cursor. After each training the new weights replace the model used by
+    predict, which runs with NumPy.
+    """
+
+    # Seconds between two checks that the training process is alive
+    POLL_INTERVAL = 1.0
+
+    def __init__(self, calibration, epochs = 100, update_epochs = 20):
+        """
+        :param calibration: Calibration whose samples are trained on, the steps
+            it records afterwards are added to the training, and a new
+            calibration restarts it
+        :param epochs: Number of epochs of the first training
+        :param update_epochs: Number of epochs of the trainings adding new samples
+        """
+        self.model = None
+        self.version = 0
+        # Why the training process stopped, if it failed
+        self.error = None
+        self._weights = None
+        self._ready = threading.Event()
+
+        # Spawned so that the training process doesn't inherit the threads of this one
+        context = multiprocessing.get_context("spawn")
+        self._tasks = context.Queue()
+        self._results = context.Queue()
+        self._process = context.Process(
+            target=_train, args=(self._tasks, self._results, epochs, update_epochs), daemon=True)
+        self._process.start()
+        self._receiver = threading.Thread(target=self._receive, name="ThreadNALU", daemon=True)
+        self._receiver.start()
+
         print("Starting training")
-        for epoch in progressbar(range(100)):  # loop over the dataset multiple times
-            running_loss = 0.0
-            for i, data in enumerate(dataloader):
-                # get the inputs
-                inputs, labels = data
-                inputs = inputs.float()  # .cuda().float()
-                labels = labels.float()  # .cuda().float()
-
-                # zero the parameter gradients
-                opt.zero_grad()
-
-                # forward + backward + optimize
-                outputs = m(inputs)
-                loss = crit(outputs, labels)
-                loss.backward()
-                opt.step()
-
-                # print statistics
-                running_loss += loss.item()
-                if i % 8 == 7 and epoch % 20 == 19: # Print every eight minibatch of every 20th epoch
-                    print('[%d] loss: %.3f' % (epoch + 1, running_loss / 8))
-                    running_loss = 0.0
-
-class NAC(Module):
-    def __init__(self, n_in, n_out):
-        super().__init__()
-        self.W_hat = Parameter(torch.Tensor(n_out, n_in))
-        self.M_hat = Parameter(torch.Tensor(n_out, n_in))
-        self.reset_parameters()
-
-    def reset_parameters(self):
-        init.kaiming_uniform_(self.W_hat)
-        init.kaiming_uniform_(self.M_hat)
-
-    def forward(self, input):
-        weights = torch.tanh(self.W_hat) * torch.sigmoid(self.M_hat)
-        return functional.linear(input, weights)
-
-
-class NALU(Module):
-    def __init__(self, n_in, n_out):
-        super().__init__()
-        self.NAC = NAC(n_in, n_out)
-        self.G = Parameter(torch.Tensor(1, n_in))
-        self.eps = 1e-6
-        self.reset_parameters()
-
-    def reset_parameters(self):
-        init.kaiming_uniform_(self.G)
-
-    def forward(self, input):
-        g = torch.sigmoid(functional.linear(input, self.G))
-        y1 = g * self.NAC(input)
-        y2 = (1 - g) * torch.exp(self.NAC(torch.log(torch.abs(input) + self.eps)))
-        return y1 + y2
\ No newline at end of file
+        self.update(*calibration.training_data())
+        calibration.step_listeners.append(self.update)
+        calibration.reset_listeners.append(self.reset)
+
+    def update(self, samples, targets):
+        """Adds samples and the screen coordinates they correspond to to the
+        training, the model is replaced once trained on them"""
+        self._tasks.put((
+            np.ascontiguousarray(samples, dtype=np.float32).reshape(-1, 14),
+            np.ascontiguousarray(targets, dtype=np.float32).reshape(-1, 2)
+        ))
+
+    def reset(self):
+        """Discards the samples trained on so far, the next ones are trained
+        on by a new model. The current model is used until then."""
+        self._tasks.put(RESET)
+
+    def _receive(self):
+        while True:
+            try:
+                weights = self._results.get(timeout=self.POLL_INTERVAL)
+            except queue.Empty:
+                if self._process.is_alive():
+                    continue
+                # Killed without a word, the queue may still hold its last message
+                try:
+                    weights = self._results.get(timeout=self.POLL_INTERVAL)
+                except queue.Empty:
+                    weights = "The training process died with exit code {}".format(self._process.exitcode)
+            if weights is None:
+                break
+            if isinstance(weights, str):
+                self.error = RuntimeError("NALU training failed:\n" + weights)
+                # Wakes up wait, which raises the error
+                self._ready.set()
+                break
+            self._weights = weights
+            self.model = nalu.NALU(weights["NAC.W_hat"], weights["NAC.M_hat"], weights["G"])
+            self.version += 1
+            self._ready.set()
+
+    def wait(self, timeout = None):
+        """Waits for the first training to end, returns false on timeout,
+        raises RuntimeError if the training process failed"""
+        ready = self._ready.wait(timeout)
+        if self.error is not None:
+            raise self.error
+        return ready
+
+    def predict(self, gaze):
+        """Returns the screen coordinates for a Gaze with the latest model,
+        or None if the first training didn't end yet or failed, see error"""
+        model = self.model
+        if model is None:
+            return None
+        return model.predict(gaze)
+
+    def export(self, path):
+        """Saves the weights of the latest model, to be loaded with nalu.NALU.load"""
+        if self._weights is None:
+            raise RuntimeError("The model is not trained yet")
+        np.savez(path, **self._weights)
+
+    def stop(self):
+        """Stops the training process once it trained on the samples already given"""
+        self._tasks.put(None)
+        self._process.join()
+        self._receiver.join()
@@ -0,0 +1,141 @@
+"""
+Stateful filters smoothing the cursor positions computed from the gaze.
+
+Every filter is called with a position and the time it was captured at, in
+seconds, and returns the filtered position. reset() forgets the previous
+positions, for when the cursor jumps.
+"""
+
+import math
+
+import numpy as np
+
+
+class NoFilter:
+    """Returns the positions unchanged"""
+
+    def __call__(self, position, timestamp):
+        return np.asarray(position, dtype=np.float64)
+
+    def reset(self):
+        pass
+
+
+class OneEuroFilter:
+    """
+    One Euro filter: a low pass filter whose cutoff frequency rises with the
+    speed of the position. It smooths heavily while the gaze is still and
+    barely at all during a saccade.
+    """
+
+    def __init__(self, min_cutoff = 0.5, beta = 0.002, d_cutoff = 1.0):
+        """
+        :param min_cutoff: Cutoff frequency in Hz while still, lower smooths more
+        :param beta: Increase of the cutoff frequency per pixel per second of
+            speed, higher reduces the lag of fast movements
+        :param d_cutoff: Cutoff frequency in Hz of the speed estimate
+        """
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset()
+
+    @staticmethod
+    def _alpha(cutoff, elapsed):
+        tau = 1 / (2 * math.pi * cutoff)
+        return 1 / (1 + tau / elapsed)
+
+    def __call__(self, position, timestamp):
+        position = np.asarray(position, dtype=np.float64)
+        if self._position is None:
+            self._position = position
+            self._timestamp = timestamp
+            return position
+        elapsed = timestamp - self._timestamp
+        if elapsed <= 0:
+            return self._position
+        self._timestamp = timestamp
+
+        speed = (position - self._position) / elapsed
+        alpha = self._alpha(self.d_cutoff, elapsed)
+        self._speed = alpha * speed + (1 - alpha) * self._speed
+
+        cutoff = self.min_cutoff + self.beta * np.abs(self._speed)
+        alpha = self._alpha(cutoff, elapsed)
+        self._position = alpha * position + (1 - alpha) * self._position
+        return self._position
+
+    def reset(self):
+        self._position = None
+        self._speed = np.zeros(2)
+        self._timestamp = None
+
+
+class KalmanFilter:
+    """
+    Kalman filter with a constant velocity model, the position and speed of
+    both axes are estimated from the noisy positions.
+    """
+
+    def __init__(self, process_noise = 10000.0, measurement_noise = 40.0):
+        """
+        :param process_noise: Standard deviation of the acceleration in pixels
+            per second squared, higher follows fast movements more closely
+        :param measurement_noise: Standard deviation of the noise of the
+            positions in pixels, higher smooths more
+        """
+        self.process_noise = process_noise
+        self.measurement_noise = measurement_noise
+        self._H = np.hstack((np.eye(2), np.zeros((2, 2))))
+        self._R = np.eye(2) * measurement_noise ** 2
+        self.reset()
+
+    def __call__(self, position, timestamp):
+        position = np.asarray(position, dtype=np.float64)
+        if self._state is None:
+            self._state = np.concatenate((position, np.zeros(2)))
+            self._covariance = np.diag([self.measurement_noise ** 2] * 2 + [self.process_noise ** 2] * 2)
+            self._timestamp = timestamp
+            return position
+        elapsed = timestamp - self._timestamp
+        if elapsed <= 0:
+            return self._state[:2]
+        self._timestamp = timestamp
+
+        # Predict
+        F = np.eye(4)
+        F[0, 2] = F[1, 3] = elapsed
+        G = np.array([elapsed ** 2 / 2, elapsed])
+        Q = np.zeros((4, 4))
+        q = np.outer(G, G) * self.process_noise ** 2
+        Q[0::2, 0::2] = q
+        Q[1::2, 1::2] = q
+        state = F @ self._state
+        covariance = F @ self._covariance @ F.T + Q
+
+        # Update
+        innovation = position - self._H @ state
+        S = self._H @ covariance @ self._H.T + self._R
+        K = covariance @ self._H.T @ np.linalg.inv(S)
+        self._state = state + K @ innovation
+        self._covariance = (np.eye(4) - K @ self._H) @ covariance
+        return self._state[:2]
+
+    def reset(self):
+        self._state = None
+        self._covariance = None
+        self._timestamp = None
+
+
+FILTERS = {
+    "none": NoFilter,
+    "one_euro": OneEuroFilter,
+    "kalman": KalmanFilter,
+}
+
+
+def create_filter(name, **parameters):
+    """Returns a new filter by its name in FILTERS"""
+    if name not in FILTERS:
+        raise ValueError("Unknown filter {}, expected one of {}".format(name, tuple(FILTERS)))
+    return FILTERS[name](**parameters)
@@ -0,0 +1,234 @@
+"""
+Focuses the i3 window the user looks at.
+
+The rectangles of the visible windows are kept in a grid index, so finding
+the window under the gaze point only looks at the windows of one cell. The
+index is built from the i3 tree once, then kept up to date from the window
+and workspace events: a closed window is removed right away, and it and the
+other events that move windows, like a new window resizing its siblings, mark
+the index to be rebuilt before the next lookup, at most once however many
+events came in between.
+"""
+
+import collections
+import threading
+
+from .ipc import I3Connection
+
+# Layers of the windows, a window of a higher layer is above the others
+TILED = 0
+FLOATING = 1
+FULLSCREEN = 2
+
+
+class WindowIndex:
+    """Rectangles of windows in a grid of square cells"""
+
+    def __init__(self, cell_size = 256):
+        """
+        :param cell_size: Size in pixels of the cells of the grid
+        """
+        self.cell_size = cell_size
+        self._windows = {}
+        self._cells = collections.defaultdict(set)
+
+    def __len__(self):
+        return len(self._windows)
+
+    def __contains__(self, window):
+        return window in self._windows
+
+    def _cells_of(self, rect):
+        x, y, width, height = rect
+        for column in range(x // self.cell_size, (x + max(width, 1) - 1) // self.cell_size + 1):
+            for row in range(y // self.cell_size, (y + max(height, 1) - 1) // self.cell_size + 1):
+                yield column, row
+
+    def add(self, window, rect, layer = TILED):
+        """Adds or moves a window
+
+        :param window: Id of the i3 container
+        :param rect: (x, y, width, height) of the window on the screen
+        :param layer: TILED, FLOATING or FULLSCREEN
+        """
+        self.remove(window)
+        self._windows[window] = (tuple(rect), layer)
+        for cell in self._cells_of(rect):
+            self._cells[cell].add(window)
+
+    def remove(self, window):
+        entry = self._windows.pop(window, None)
+        if entry is None:
+            return
+        for cell in self._cells_of(entry[0]):
+            self._cells[cell].discard(window)
+            if not self._cells[cell]:
+                del self._cells[cell]
+
+    def clear(self):
+        self._windows.clear()
+        self._cells.clear()
+
+    def window_at(self, x, y):
+        """Returns the id of the topmost window containing the point, or None"""
+        best = None
+        best_key = None
+        for window in self._cells.get((int(x) // self.cell_size, int(y) // self.cell_size), ()):
+            (left, top, width, height), layer = self._windows[window]
+            if left <= x < left + width and top <= y < top + height:
+                # Highest layer first, then the smallest window
+                key = (-layer, width * height)
+                if best_key is None or key < best_key:
+                    best, best_key = window, key
+        return best
+
+
+def visible_windows(tree, workspaces):
+    """Yields the id, rect, layer and whether it has the focus of every window
+    of the visible workspaces
+
+    :param tree: Reply of GET_TREE
+    :param workspaces: Reply of GET_WORKSPACES
+    """
+    visible = {workspace["name"] for workspace in workspaces if workspace.get("visible")}
+
+    def leaves(node, layer):
+        children = node.get("nodes", []) + node.get("floating_nodes", [])
+        if not children:
+            if node.get("window") is not None or node.get("app_id"):
+                rect = node["rect"]
+                yield node["id"], (rect["x"], rect["y"], rect["width"], rect["height"]), \
+                    FULLSCREEN if node.get("fullscreen_mode") else layer, bool(node.get("focused"))
+            return
+        for child in node.get("nodes", []):
+            yield from leaves(child, layer)
+        for child in node.get("floating_nodes", []):
+            yield from leaves(child, FLOATING)
+
+    def walk(node):
+        if node.get("type") == "workspace":
+            if node.get("name") in visible:
+                yield from leaves(node, TILED)
+            return
+        for child in node.get("nodes", []):
+            yield from walk(child)
+
+    yield from walk(tree)
+
+
+class FocusEngine:
+    """
+    Focuses the window under the gaze point once the gaze stayed on it for
+    `dwell` seconds, and at most once every `cooldown` seconds.
+    """
+
+    # Window events that don't move any window
+    STATIC_EVENTS = ("focus", "title", "mark", "urgent")
+
+    def __init__(self, path = None, dwell = 0.3, cooldown = 0.5, cell_size = 256):
+        """
+        :param path: Path of the i3 socket, found with ipc.socket_path if None
+        :param dwell: Seconds the gaze has to stay on a window to focus it
+        :param cooldown: Minimum seconds between two focus changes
+        :param cell_size: Size in pixels of the cells of the window index
+        """
+        self.dwell = dwell
+        self.cooldown = cooldown
+        self.index = WindowIndex(cell_size)
+        self.focused = None
+        self.rebuilds = 0
+        self._commands = I3Connection(path)
+        self._events = I3Connection(path)
+        self._lock = threading.Lock()
+        self._dirty = True
+        # Windows closed and whether the focus changed while the tree is fetched
+        self._closed = set()
+        self._focus_changed = False
+        self._candidate = None
+        self._candidate_since = None
+        self._last_switch = float("-inf")
+
+        self._events.subscribe(("window", "workspace"))
+        self._thread = threading.Thread(target=self._listen, name="ThreadI3Events", daemon=True)
+        self._thread.start()
+
+    def _listen(self):
+        while True:
+            event = self._events.read_event()
+            if event is None:
+                break
+            self.handle_event(*event)
+
+    def handle_event(self, name, payload):
+        """Updates the index with an i3 event"""
+        change = payload.get("change")
+        with self._lock:
+            if name == "window":
+                container = payload.get("container", {})
+                if change == "close":
+                    # Removed right away, but i3 grows the siblings into the
+                    # freed space, so their rectangles are stale too
+                    self.index.remove(container.get("id"))
+                    self._closed.add(container.get("id"))
+                    self._dirty = True
+                elif change in self.STATIC_EVENTS:
+                    if change == "focus":
+                        self.focused = container.get("id")
+                        self._focus_changed = True
+                else:
+                    self._dirty = True
+            elif name == "workspace" and change != "urgent":
+                self._dirty = True
+
+    def _refresh(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            self._closed.clear()
+            self._focus_changed = False
+        # Events received from now on mark the index dirty again, and the
+        # ones received before the tree is fetched must not be undone by it
+        workspaces = self._commands.get_workspaces()
+        tree = self._commands.get_tree()
+        with self._lock:
+            self.index.clear()
+            for window, rect, layer, focused in visible_windows(tree, workspaces):
+                if window in self._closed:
+                    continue
+                self.index.add(window, rect, layer)
+                if focused and not self._focus_changed:
+                    self.focused = window
+            self.rebuilds += 1
+
+    def window_at(self, x, y):
+        """Returns the id of the window under the point"""
+        self._refresh()
+        with self._lock:
+            return self.index.window_at(x, y)
+
+    def update(self, point, timestamp):
+        """Focuses the window under the gaze point if it stayed on it long enough
+
+        :param point: (x, y) position of the gaze on the screen
+        :param timestamp: Time of the gaze point in seconds
+        :return: The id of the window focused, or None if the focus didn't change
+        """
+        window = self.window_at(*point)
+        if window != self._candidate:
+            self._candidate = window
+            self._candidate_since = timestamp
+            return None
+        if window is None or window == self.focused:
+            return None
+        if timestamp - self._candidate_since < self.dwell or timestamp - self._last_switch < self.cooldown:
+            return None
+        self._commands.command("[con_id={}] focus".format(window))
+        self.focused = window
+        self._last_switch = timestamp
+        return window
+
+    def close(self):
+        self._events.close()
+        self._commands.close()
+        self._thread.join()
@@ -1,7 +1,7 @@
 class Gaze:
     def __init__(
             self,
-            gaze_tracking = None,
+            snapshot = None,
             eye_left_x = None,
             eye_left_y = None,
             eye_right_x = None,
@@ -17,23 +17,26 @@ class Gaze:
             nose_x = None,
             nose_y = None,
     ):
-        try:
-            self.success = True
-            self.eye_left_x = gaze_tracking.eye_left.eye_center[0]
-            self.eye_left_y = gaze_tracking.eye_left.eye_center[1]
-            self.eye_right_x = gaze_tracking.eye_right.eye_center[0]
-            self.eye_right_y = gaze_tracking.eye_right.eye_center[1]
-            self.pupil_left_x = gaze_tracking.eye_left.pupil_center[0]
-            self.pupil_left_y = gaze_tracking.eye_left.pupil_center[1]
-            self.pupil_right_x = gaze_tracking.eye_right.pupil_center[0]
-            self.pupil_right_y = gaze_tracking.eye_right.pupil_center[1]
-            self.h_ratio_left = gaze_tracking.eye_left.horizontal_ratio()
-            self.h_ratio_right = gaze_tracking.eye_right.horizontal_ratio()
-            self.v_ratio_left = gaze_tracking.eye_left.vertical_ratio()
-            self.v_ratio_right = gaze_tracking.eye_right.vertical_ratio()
-            self.nose_x = gaze_tracking.nose[0]
-            self.nose_y = gaze_tracking.nose[1]
-        except (TypeError, AttributeError):
+        """
+        :param snapshot: GazeSnapshot to take the values from, when the face
+            and both pupils were found on it, otherwise the given values are used
+        """
+        if snapshot is not None and snapshot.pupils_located and snapshot.nose:
+            eye_left, eye_right = snapshot.eye_left, snapshot.eye_right
+            self.frame_id = snapshot.frame_id
+            self.timestamp = snapshot.timestamp
+            self.eye_left_x, self.eye_left_y = eye_left.eye_center
+            self.eye_right_x, self.eye_right_y = eye_right.eye_center
+            self.pupil_left_x, self.pupil_left_y = eye_left.pupil_center
+            self.pupil_right_x, self.pupil_right_y = eye_right.pupil_center
+            self.h_ratio_left = eye_left.horizontal_ratio
+            self.h_ratio_right = eye_right.horizontal_ratio
+            self.v_ratio_left = eye_left.vertical_ratio
+            self.v_ratio_right = eye_right.vertical_ratio
+            self.nose_x, self.nose_y = snapshot.nose
+        else:
+            self.frame_id = None if snapshot is None else snapshot.frame_id
+            self.timestamp = None if snapshot is None else snapshot.timestamp
             self.eye_left_x = eye_left_x
             self.eye_left_y = eye_left_y
             self.eye_right_x = eye_right_x
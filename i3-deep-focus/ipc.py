@@ -0,0 +1,207 @@
+"""
+Minimal client of the i3 IPC protocol, and a fake i3 server speaking the same
+protocol over a local socket to run the focus engine without i3.
+
+Every message is the "i3-ipc" magic string, the length of the payload and the
+type of the message as native 32 bit integers, then the JSON payload. Events
+have the highest bit of their type set.
+"""
+
+import json
+import os
+import socket
+import struct
+import subprocess
+import threading
+
+MAGIC = b"i3-ipc"
+HEADER = struct.Struct("=6sII")
+
+RUN_COMMAND = 0
+GET_WORKSPACES = 1
+SUBSCRIBE = 2
+GET_TREE = 4
+
+EVENT_MASK = 1 << 31
+EVENTS = {
+    "workspace": 0,
+    "window": 3,
+}
+EVENT_NAMES = {number: name for name, number in EVENTS.items()}
+
+
+def socket_path():
+    """Returns the path of the socket of the running i3"""
+    path = os.environ.get("I3SOCK")
+    if path:
+        return path
+    return subprocess.run(["i3", "--get-socketpath"], check=True, capture_output=True, text=True).stdout.strip()
+
+
+def _receive_exactly(connection, size):
+    data = bytearray()
+    while len(data) < size:
+        chunk = connection.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("The i3 socket was closed")
+        data += chunk
+    return bytes(data)
+
+
+def send_message(connection, message_type, payload=b""):
+    """Sends a message, the payload is a string or bytes"""
+    if isinstance(payload, str):
+        payload = payload.encode()
+    connection.sendall(HEADER.pack(MAGIC, len(payload), message_type) + payload)
+
+
+def receive_raw_message(connection):
+    """Returns the type and the payload as bytes of the next message"""
+    magic, length, message_type = HEADER.unpack(_receive_exactly(connection, HEADER.size))
+    if magic != MAGIC:
+        raise ConnectionError("Not an i3 IPC message")
+    return message_type, _receive_exactly(connection, length)
+
+
+def receive_message(connection):
+    """Returns the type and the decoded JSON payload of the next message"""
+    message_type, payload = receive_raw_message(connection)
+    return message_type, json.loads(payload)
+
+
+class I3Connection:
+    """
+    Connection to i3. A connection subscribed to events only receives events
+    afterwards, so requests and events need two connections.
+    """
+
+    def __init__(self, path = None):
+        """
+        :param path: Path of the i3 socket, found with socket_path if None
+        """
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.connect(path or socket_path())
+        self._lock = threading.Lock()
+
+    def request(self, message_type, payload = b""):
+        """Sends a request and returns the decoded reply"""
+        with self._lock:
+            send_message(self._socket, message_type, payload)
+            reply_type, reply = receive_message(self._socket)
+        if reply_type != message_type:
+            raise ConnectionError("Unexpected reply of type {} to a request of type {}".format(
+                reply_type, message_type))
+        return reply
+
+    def command(self, command):
+        """Runs an i3 command, returns the result of each command it contains"""
+        return self.request(RUN_COMMAND, command)
+
+    def get_tree(self):
+        return self.request(GET_TREE)
+
+    def get_workspaces(self):
+        return self.request(GET_WORKSPACES)
+
+    def subscribe(self, events):
+        """Subscribes to the events of the given names, see EVENTS"""
+        reply = self.request(SUBSCRIBE, json.dumps(list(events)))
+        if not reply.get("success"):
+            raise ConnectionError("Could not subscribe to {}".format(events))
+
+    def read_event(self):
+        """Waits for the next event and returns its name and payload, or None
+        once the connection is closed"""
+        try:
+            message_type, payload = receive_message(self._socket)
+        except (ConnectionError, OSError):
+            return None
+        return EVENT_NAMES.get(message_type & ~EVENT_MASK), payload
+
+    def close(self):
+        try:
+            self._socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._socket.close()
+
+
+class FakeI3Server:
+    """
+    Serves a fixed tree and workspaces on a local socket like i3 would. The
+    commands received are recorded, the requests are counted by type, and
+    emit sends an event to the subscribed connections.
+    """
+
+    def __init__(self, path, tree, workspaces):
+        """
+        :param path: Path of the socket to create
+        :param tree: Reply to GET_TREE, can be replaced later
+        :param workspaces: Reply to GET_WORKSPACES, can be replaced later
+        """
+        self.path = path
+        self.tree = tree
+        self.workspaces = workspaces
+        self.commands = []
+        self.requests = {}
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._connections = []
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(path)
+        self._server.listen()
+        self._thread = threading.Thread(target=self._accept, name="ThreadFakeI3", daemon=True)
+        self._thread.start()
+
+    def _accept(self):
+        while True:
+            try:
+                connection, _ = self._server.accept()
+            except OSError:
+                break
+            self._connections.append(connection)
+            threading.Thread(target=self._serve, args=(connection,), daemon=True).start()
+
+    def _serve(self, connection):
+        while True:
+            try:
+                message_type, payload = receive_raw_message(connection)
+            except (ConnectionError, OSError):
+                break
+            with self._lock:
+                self.requests[message_type] = self.requests.get(message_type, 0) + 1
+            if message_type == GET_TREE:
+                reply = self.tree
+            elif message_type == GET_WORKSPACES:
+                reply = self.workspaces
+            elif message_type == SUBSCRIBE:
+                with self._lock:
+                    self._subscribers.append((connection, set(json.loads(payload))))
+                reply = {"success": True}
+            elif message_type == RUN_COMMAND:
+                with self._lock:
+                    self.commands.append(payload.decode())
+                reply = [{"success": True}]
+            else:
+                reply = {"success": False, "error": "unsupported"}
+            with self._lock:
+                send_message(connection, message_type, json.dumps(reply))
+
+    def emit(self, event, payload):
+        """Sends an event to the connections subscribed to it"""
+        data = json.dumps(payload)
+        with self._lock:
+            for connection, events in self._subscribers:
+                if event in events:
+                    send_message(connection, EVENT_MASK | EVENTS[event], data)
+
+    def close(self):
+        self._server.close()
+        for connection in self._connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            connection.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
@@ -1,85 +1,154 @@
 import math
-import time
-
-import pyautogui
 
 from gaze_tracking import GazeTracking
 
 from .gaze import Gaze
 from .calibration import Calibration
+from .cursor import create_cursor
+from .filters import create_filter
+from .screen_mapper import ScreenMapper
 
 
 class MouseControl:
-    def __init__(self, gaze: GazeTracking, calibration: Calibration):
+    ENGINES = ("heuristic", "regression")
+
+    def __init__(self, gaze: GazeTracking, calibration: Calibration, engine = "heuristic",
+                 cursor_filter = "one_euro", cursor = "pyautogui", focus_engine = None):
+        """
+        :param gaze: GazeTracking analyzing the webcam
+        :param calibration: Calibration of the screen
+        :param engine: "heuristic" to move the cursor by the change of gaze
+            between frames, "regression" to place it where a ScreenMapper
+            fitted on the calibration data maps the gaze, or any object with a
+            predict(gaze) method returning screen coordinates, like a
+            DeepFocusNALU
+        :param cursor_filter: Name of a filter of filters.FILTERS smoothing the
+            cursor positions, or a filter object
+        :param cursor: Name of a backend of cursor.CURSORS moving the cursor,
+            or a backend object
+        :param focus_engine: FocusEngine focusing the i3 window under the
+            cursor, or None to leave the focus alone
+        """
+        if isinstance(engine, str) and engine not in self.ENGINES:
+            raise ValueError("Unknown engine {}, expected one of {}".format(engine, self.ENGINES))
+        if engine == "regression":
+            engine = ScreenMapper(calibration)
+        # None for the heuristic
+        self.mapper = None if engine == "heuristic" else engine
+        self.cursor_filter = create_filter(cursor_filter) if isinstance(cursor_filter, str) else cursor_filter
+        self.cursor = create_cursor(cursor) if isinstance(cursor, str) else cursor
+        self.focus_engine = focus_engine
         self.gaze_tracking = gaze
-        self.last_gaze = Gaze(self.gaze_tracking)
-        self.current_gaze = Gaze(self.gaze_tracking)
+        self.last_gaze = Gaze(self.gaze_tracking.snapshot)
+        self.current_gaze = Gaze(self.gaze_tracking.snapshot)
         self.calibration = calibration
         self.old_pos = [int(self.calibration.size[0]/2), int(self.calibration.size[1]/2)]
         self.new_pos = self.old_pos
-
-    def run(self, sleep = 0.05, sensibility_x = 30, sensibility_y = 50, threshold = 50):
+        self.sensibility_x = 30
+        self.sensibility_y = 50
+        self.threshold = 0
+        self.no_gaze_count = 0
+        # Frames in a row the eyes were closed, without blink detection
+        self.blinking_count = 0
+        # Timestamp until which the cursor is left to the user
+        self._paused_until = float("-inf")
+
+    def run(self, sensibility_x = 30, sensibility_y = 50, threshold = 0):
+        """
+        :param threshold: Moves shorter than this distance in pixels are
+            skipped, the cursor filter already smooths the small movements
+        """
+        self.sensibility_x = sensibility_x
+        self.sensibility_y = sensibility_y
+        self.threshold = threshold
         self.reset_position()
-        self.last_gaze = Gaze(self.gaze_tracking)
-        no_gaze_count = 0
-        blinking_count = 0
-        while True:
-            time.sleep(sleep)
-            # print("old_pos: {}".format(old_pos))
-            self.current_gaze = Gaze(self.gaze_tracking)
-            current_pos = pyautogui.position()
-            # print("current_pos: {}".format(current_pos))
-            try:
-                # Sleep if moved moved by user
-                if current_pos.x != self.old_pos[0] or current_pos.y != self.old_pos[1]:
-                    print("Mouse moved dy user, sleeping 3 second")
-                    time.sleep(3)
-                    self.new_pos = [current_pos.x, current_pos.y]
-                    continue
-
-                # Skip if gaze not detected
-                if not self.current_gaze or not self.last_gaze:
-                    no_gaze_count += 1
-                    if no_gaze_count >= 5:
-                        no_gaze_count = 0
-                        self.reset_position()
-                    continue
-                no_gaze_count = 0
-
-                # Check if user is blinking
-                if self.gaze_tracking.is_blinking():
-                    blinking_count += 1
-                    if blinking_count >= 5:
-                        blinking_count = 0
+        self.last_gaze = Gaze(self.gaze_tracking.snapshot)
+        # Wakes up as soon as a new frame is analyzed
+        for snapshot in self.gaze_tracking.snapshots():
+            self.step(snapshot)
+
+    def step(self, snapshot):
+        """Moves the cursor for the snapshot of a new frame"""
+        # print("old_pos: {}".format(old_pos))
+        self.current_gaze = Gaze(snapshot)
+        current_pos = self.cursor.position()
+        # print("current_pos: {}".format(current_pos))
+        try:
+            # Pause if moved by user
+            if current_pos[0] != self.old_pos[0] or current_pos[1] != self.old_pos[1]:
+                if snapshot.timestamp >= self._paused_until:
+                    # Only when the pause starts, not on every frame the user moves it
+                    print("Mouse moved dy user, pausing 3 second")
+                self._paused_until = snapshot.timestamp + 3
+                self.new_pos = [current_pos[0], current_pos[1]]
+                self.cursor_filter.reset()
+                return
+            if snapshot.timestamp < self._paused_until:
+                return
+
+            # Back to the center when the eyes stay closed, hold still while they blink
+            if snapshot.blink_event == "closed":
+                self.reset_position()
+                return
+            if snapshot.is_blinking():
+                if snapshot.eye_left.closed is None:
+                    # No blink detector, the eyes stay closed after 5 frames
+                    self.blinking_count += 1
+                    if self.blinking_count >= 5:
+                        self.blinking_count = 0
                         self.reset_position()
-                    continue
-                else:
-                    blinking_count = 0
-
+                return
+            self.blinking_count = 0
+
+            # Skip if gaze not detected, the heuristic also needs the last one
+            if not self.current_gaze or (self.mapper is None and not self.last_gaze):
+                self.no_gaze_count += 1
+                if self.no_gaze_count >= 5:
+                    self.no_gaze_count = 0
+                    self.reset_position()
+                return
+            self.no_gaze_count = 0
+
+            if self.mapper is None:
                 # Calculate movement
-                change_x, change_y = self.calculate_movement(-sensibility_x, sensibility_y)
-
-                # Check if above or bellow screen boundaries
-                self.new_pos = [current_pos.x + change_x, current_pos.y + change_y]
-                self.new_pos[0] = self.new_pos[0] if self.new_pos[0] < self.calibration.size[0] - 5 \
-                    else self.calibration.size[0] - 5
-                self.new_pos[1] = self.new_pos[1] if self.new_pos[1] < self.calibration.size[1] - 5 \
-                    else self.calibration.size[1] - 5
-                self.new_pos[0] = self.new_pos[0] if self.new_pos[0] > 5 else 5
-                self.new_pos[1] = self.new_pos[1] if self.new_pos[1] > 5 else 5
-
-                # Skip if distance if less that threshold
-                distance = math.hypot((self.new_pos[0] - self.old_pos[0]), (self.new_pos[1]- self.old_pos[1]))
-                if distance <= threshold:
+                change_x, change_y = self.calculate_movement(-self.sensibility_x, self.sensibility_y)
+                self.new_pos = [current_pos[0] + change_x, current_pos[1] + change_y]
+            else:
+                position = self.mapper.predict(self.current_gaze)
+                if position is None:
+                    # Model not trained yet
                     self.new_pos = self.old_pos
-
-                # Move cursor
-                pyautogui.moveTo(self.new_pos[0], self.new_pos[1])
-                # print("new_pos: {}".format(new_pos))
-            finally:
-                # Save last mouse position and gaze
-                self.old_pos = self.new_pos
-                self.last_gaze = self.current_gaze
+                    return
+                self.new_pos = [int(round(position[0])), int(round(position[1]))]
+
+            # Smooth while the gaze is still, follow it during saccades
+            filtered = self.cursor_filter(self.new_pos, snapshot.timestamp)
+            self.new_pos = [int(round(filtered[0])), int(round(filtered[1]))]
+
+            # Check if above or bellow screen boundaries
+            self.new_pos[0] = self.new_pos[0] if self.new_pos[0] < self.calibration.size[0] - 5 \
+                else self.calibration.size[0] - 5
+            self.new_pos[1] = self.new_pos[1] if self.new_pos[1] < self.calibration.size[1] - 5 \
+                else self.calibration.size[1] - 5
+            self.new_pos[0] = self.new_pos[0] if self.new_pos[0] > 5 else 5
+            self.new_pos[1] = self.new_pos[1] if self.new_pos[1] > 5 else 5
+
+            # Skip if distance if less that threshold
+            distance = math.hypot((self.new_pos[0] - self.old_pos[0]), (self.new_pos[1]- self.old_pos[1]))
+            if distance <= self.threshold:
+                self.new_pos = self.old_pos
+
+            # Move cursor
+            self.cursor.move_to(self.new_pos[0], self.new_pos[1])
+            self.cursor.flush()
+            # print("new_pos: {}".format(new_pos))
+
+            if self.focus_engine is not None:
+                self.focus_engine.update(self.new_pos, snapshot.timestamp)
+        finally:
+            # Save last mouse position and gaze
+            self.old_pos = self.new_pos
+            self.last_gaze = self.current_gaze
 
     def calculate_movement(self, sensibility_x, sensibility_y):
         eyes_movement_x = (
@@ -123,9 +192,11 @@ class MouseControl:
         )
 
     def reset_position(self):
+        self.cursor_filter.reset()
         self.old_pos = [int(self.calibration.size[0]/2), int(self.calibration.size[1]/2)]
         self.new_pos = self.old_pos
-        pyautogui.moveTo(self.new_pos[0], self.new_pos[1])
+        self.cursor.move_to(self.new_pos[0], self.new_pos[1])
+        self.cursor.flush()
 
 
 
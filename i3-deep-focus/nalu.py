@@ -0,0 +1,53 @@
+"""
+NumPy implementation of the forward pass of the NAC and NALU modules of
+deep_focus_nalu, to use a trained model without importing torch.
+"""
+
+import numpy as np
+
+
+def _sigmoid(x):
+    # Same as 1 / (1 + exp(-x)) without overflowing for large negative x
+    return 0.5 * (1 + np.tanh(0.5 * x))
+
+
+class NAC:
+    def __init__(self, W_hat, M_hat):
+        # The weights don't change once trained, so they are computed only once
+        self.weights = np.tanh(W_hat) * _sigmoid(M_hat)
+
+    def forward(self, input):
+        return input @ self.weights.T
+
+
+class NALU:
+    def __init__(self, W_hat, M_hat, G, eps=1e-6):
+        self.NAC = NAC(W_hat, M_hat)
+        self.G = np.asarray(G)
+        self.eps = eps
+
+    @classmethod
+    def load(cls, path):
+        """Loads the weights exported by nalu_torch.export_weights or
+        DeepFocusNALU.export"""
+        with np.load(path, allow_pickle=False) as weights:
+            return cls(weights["NAC.W_hat"], weights["NAC.M_hat"], weights["G"])
+
+    def forward(self, input):
+        g = _sigmoid(input @ self.G.T)
+        y1 = g * self.NAC.forward(input)
+        y2 = (1 - g) * np.exp(self.NAC.forward(np.log(np.abs(input) + self.eps)))
+        return y1 + y2
+
+    def __call__(self, input):
+        return self.forward(input)
+
+    def predict(self, gaze):
+        """Returns the screen coordinates for a Gaze, a sample of 14 values,
+        or a (samples, 14) batch of them"""
+        if hasattr(gaze, "__list__"):
+            gaze = gaze.__list__()
+        input = np.asarray(gaze, dtype=np.float64)
+        if input.ndim == 1:
+            return self.forward(input[np.newaxis])[0]
+        return self.forward(input)
@@ -0,0 +1,82 @@
+"""
+Torch modules of the NALU model and their training, only imported by the
+training process.
+"""
+
+import torch
+from progressbar import progressbar
+from torch.nn.parameter import Parameter
+from torch.nn import functional
+from torch.nn import init
+from torch.nn.modules import Module
+import torch.utils.data
+import numpy as np
+
+
+def fit(m, dataloader, opt, crit, epochs=100):
+    for epoch in progressbar(range(epochs)):  # loop over the dataset multiple times
+        running_loss = 0.0
+        for i, data in enumerate(dataloader):
+            # get the inputs
+            inputs, labels = data
+            inputs = inputs.float()  # .cuda().float()
+            labels = labels.float()  # .cuda().float()
+
+            # zero the parameter gradients
+            opt.zero_grad()
+
+            # forward + backward + optimize
+            outputs = m(inputs)
+            loss = crit(outputs, labels)
+            loss.backward()
+            opt.step()
+
+            # print statistics
+            running_loss += loss.item()
+            if i % 8 == 7 and epoch % 20 == 19: # Print every eight minibatch of every 20th epoch
+                print('[%d] loss: %.3f' % (epoch + 1, running_loss / 8))
+                running_loss = 0.0
+
+
+def numpy_weights(model):
+    """Returns the parameters of a NALU module as NumPy arrays"""
+    return {name: parameter.detach().cpu().numpy() for name, parameter in model.state_dict().items()}
+
+
+def export_weights(model, path):
+    """Saves the parameters of a NALU module to an .npz file"""
+    np.savez(path, **numpy_weights(model))
+
+
+class NAC(Module):
+    def __init__(self, n_in, n_out):
+        super().__init__()
+        self.W_hat = Parameter(torch.Tensor(n_out, n_in))
+        self.M_hat = Parameter(torch.Tensor(n_out, n_in))
+        self.reset_parameters()
+
+    def reset_parameters(self):
+        init.kaiming_uniform_(self.W_hat)
+        init.kaiming_uniform_(self.M_hat)
+
+    def forward(self, input):
+        weights = torch.tanh(self.W_hat) * torch.sigmoid(self.M_hat)
+        return functional.linear(input, weights)
+
+
+class NALU(Module):
+    def __init__(self, n_in, n_out):
+        super().__init__()
+        self.NAC = NAC(n_in, n_out)
+        self.G = Parameter(torch.Tensor(1, n_in))
+        self.eps = 1e-6
+        self.reset_parameters()
+
+    def reset_parameters(self):
+        init.kaiming_uniform_(self.G)
+
+    def forward(self, input):
+        g = torch.sigmoid(functional.linear(input, self.G))
+        y1 = g * self.NAC(input)
+        y2 = (1 - g) * torch.exp(self.NAC(torch.log(torch.abs(input) + self.eps)))
+        return y1 + y2
\ No newline at end of file
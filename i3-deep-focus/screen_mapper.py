@@ -0,0 +1,93 @@
+"""
+Closed-form mapping from gaze samples to screen coordinates, fitted on the
+calibration data with polynomial ridge regression.
+"""
+
+import numpy as np
+
+
+class ScreenMapper:
+    """
+    Maps the 14 values of a Gaze to absolute screen coordinates. The samples
+    are standardized, expanded into polynomial features and mapped with a
+    single (features, 2) matrix solved from the normal equations, so fitting
+    takes milliseconds and mapping a frame is one small matrix product.
+    """
+
+    # Distinct screen positions needed to refit on a calibration
+    MIN_TARGETS = 3
+
+    def __init__(self, calibration = None, degree = 1, alpha = 1.0):
+        """
+        :param calibration: Calibration to fit on, refitted after every new
+            step it records once it has MIN_TARGETS positions, the mapper is
+            left unfitted if None
+        :param degree: 1 for a linear mapping, 2 to add the products of every
+            pair of values
+        :param alpha: Ridge penalty, keeps the mapping stable with the few
+            positions of a calibration
+        """
+        if degree not in (1, 2):
+            raise ValueError("degree must be 1 or 2, not {}".format(degree))
+        self.degree = degree
+        self.alpha = alpha
+        # (mean, scale, pairs, weights), replaced at once by fit so that a
+        # predict running on another thread never mixes two fits
+        self._model = None
+        if calibration is not None:
+            self._refit(calibration)
+            calibration.step_listeners.append(lambda *_: self._refit(calibration))
+
+    @property
+    def weights(self):
+        """(features, 2) matrix of the mapping, None until fitted"""
+        model = self._model
+        return None if model is None else model[3]
+
+    def _refit(self, calibration):
+        """Fits on the calibration data once it has enough distinct positions,
+        the previous fit is kept until then, after a new calibration started"""
+        if len(np.unique(calibration.targets, axis=0)) >= self.MIN_TARGETS:
+            self.fit(*calibration.training_data())
+
+    def _features(self, samples, mean, scale, pairs):
+        values = (samples - mean) / scale
+        columns = [np.ones((len(values), 1)), values]
+        if self.degree == 2:
+            columns.append(values[:, pairs[0]] * values[:, pairs[1]])
+        return np.hstack(columns)
+
+    def fit(self, samples, targets):
+        """Fits the mapping on (samples, 14) gaze samples and the (samples, 2)
+        screen positions looked at"""
+        samples = np.asarray(samples, dtype=np.float64)
+        targets = np.asarray(targets, dtype=np.float64)
+        if len(samples) == 0:
+            raise ValueError("No samples to fit on")
+        mean = samples.mean(axis=0)
+        scale = samples.std(axis=0)
+        scale[scale == 0] = 1
+        pairs = np.triu_indices(samples.shape[1])
+
+        features = self._features(samples, mean, scale, pairs)
+        penalty = self.alpha * np.eye(features.shape[1])
+        # The intercept is not penalized
+        penalty[0, 0] = 0
+        weights = np.linalg.solve(features.T @ features + penalty, features.T @ targets)
+        self._model = (mean, scale, pairs, weights)
+        return self
+
+    def predict(self, gaze):
+        """Returns the screen coordinates for a Gaze, a sample of 14 values,
+        or a (samples, 14) batch of them, or None if the mapper is not fitted
+        yet, like a calibration with too few positions leaves it"""
+        model = self._model
+        if model is None:
+            return None
+        mean, scale, pairs, weights = model
+        if hasattr(gaze, "__list__"):
+            gaze = gaze.__list__()
+        samples = np.asarray(gaze, dtype=np.float64)
+        if samples.ndim == 1:
+            return (self._features(samples[np.newaxis], mean, scale, pairs) @ weights)[0]
+        return self._features(samples, mean, scale, pairs) @ weights